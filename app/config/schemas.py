@@ -51,6 +51,11 @@ class ServerConfig(BaseModel):
     host: str = Field(default="0.0.0.0", description="서버 호스트")
     port: int = Field(default=8002, gt=0, le=65535, description="서버 포트")
     debug: bool = Field(default=False, description="디버그 모드")
+    loop: str = Field(
+        default="uvloop",
+        pattern="^(auto|asyncio|uvloop)$",
+        description="이벤트 루프 구현",
+    )
     cors_origins: list[str] = Field(default=["*"], description="CORS 허용 오리진")
     log_level: str = Field(
         default="INFO",
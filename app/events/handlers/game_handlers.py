@@ -77,6 +77,7 @@ class GameEventHandler:
 
         # 방 상태를 플레이 중으로 변경
         event.room.status = GameStatus.PLAYING
+        event.room.invalidate_cache()
 
         logger.info(
             f"Game started in room {event.room_id}. "
@@ -97,6 +98,7 @@ class GameEventHandler:
 
         # 방 상태를 대기로 변경
         event.room.status = GameStatus.WAITING
+        event.room.invalidate_cache()
 
         # 마지막 승자 기록
         event.room.last_winner = event.winner
@@ -112,6 +114,7 @@ class GameEventHandler:
         """게임 재시작 처리."""
         # 방 상태를 대기로 변경
         event.room.status = GameStatus.WAITING
+        event.room.invalidate_cache()
 
         logger.info(
             f"Game reset in room {event.room_id}. "
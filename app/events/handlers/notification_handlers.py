@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Any, Callable, Set
+from typing import Any, Callable, List, Set
 
 from fastapi import WebSocket
 
@@ -29,7 +29,7 @@ class NotificationEventHandler:
     게임 이벤트를 WebSocket을 통해 클라이언트들에게 알림으로 전송합니다.
     """
 
-    def __init__(self, get_connections_func: Callable[[str], Set[WebSocket]]) -> None:
+    def __init__(self, get_connections_func: Callable[[str], List[WebSocket]]) -> None:
         """핸들러 초기화
 
         Args:
@@ -219,7 +219,8 @@ class NotificationEventHandler:
         # 연결이 끊어진 WebSocket들을 추적
         disconnected_connections: Set[WebSocket] = set()
 
-        for websocket in connections:
+        # 전송 중 연결 목록이 바뀔 수 있으므로 복사본을 순회
+        for websocket in connections[:]:
             try:
                 await websocket.send_text(message_json)
             except Exception as e:
@@ -235,7 +236,7 @@ class NotificationEventHandler:
 
 
 def register_notification_handlers(
-    event_bus: Any, get_connections_func: Callable[[str], Set[WebSocket]]
+    event_bus: Any, get_connections_func: Callable[[str], List[WebSocket]]
 ) -> None:
     """알림 핸들러들을 이벤트 버스에 등록
 
@@ -23,3 +23,4 @@ class JanggiManager(BaseGameManager):
         room.game_state = self.get_initial_state()
         room.move_history = []
         room.undo_requests = {}
+        room.invalidate_cache()
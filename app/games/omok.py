@@ -8,18 +8,31 @@ FIRST_PLAYER = 1
 SECOND_PLAYER = 2
 WINNING_COUNT = 5
 
+# 빈 보드 템플릿 (행 단위 슬라이스 복사로 새 보드 생성)
+_EMPTY_ROW = (0,) * BOARD_SIZE
+
 
 class OmokGame:
     """오목 게임 로직."""
 
+    @staticmethod
+    def create_empty_board() -> List[List[int]]:
+        """빈 보드 생성."""
+        return [list(_EMPTY_ROW) for _ in range(BOARD_SIZE)]
+
     @staticmethod
     def create_initial_state() -> OmokGameState:
         """초기 게임 상태 생성."""
         return OmokGameState(
-            board=[[0 for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)],
+            board=OmokGame.create_empty_board(),
             current_player=FIRST_PLAYER,
         )
 
+    @staticmethod
+    def encode_board(board: List[List[int]]) -> str:
+        """보드를 전송용 문자열로 인코딩 (행 우선, 칸당 한 글자 "0"/"1"/"2")."""
+        return "".join(str(cell) for row in board for cell in row)
+
     @staticmethod
     def is_valid_move(board: List[List[int]], x: int, y: int) -> bool:
         """유효한 수인지 확인."""
@@ -82,15 +95,9 @@ class OmokGame:
         return None
 
     @staticmethod
-    def create_move_history_entry(
-        move: GameMove, board_state: List[List[int]], player: int
-    ) -> MoveHistoryEntry:
-        """이동 기록 엔트리 생성."""
-        return MoveHistoryEntry(
-            move=move,
-            board_state=[row[:] for row in board_state],  # 깊은 복사
-            player=player,
-        )
+    def create_move_history_entry(move: GameMove, player: int) -> MoveHistoryEntry:
+        """이동 기록 엔트리 생성 (보드 스냅샷 없이 둔 수만 기록)."""
+        return MoveHistoryEntry(move=move, player=player)
 
     @staticmethod
     def undo_last_move(
@@ -100,21 +107,15 @@ class OmokGame:
         if not move_history:
             return False
 
-        # 무를 수의 플레이어 저장
-        undone_move_player = move_history[-1].player
-        move_history.pop()  # 마지막 이동 제거
+        # 마지막 이동 제거 후 해당 칸만 비움
+        undone_entry = move_history.pop()
+        game_state.board[undone_entry.move.y][undone_entry.move.x] = 0
 
         if move_history:
-            # 이전 보드 상태로 복원
-            prev_state = move_history[-1]
-            game_state.board = [row[:] for row in prev_state.board_state]
             # 턴은 무른 수를 둔 플레이어에게 다시 부여 (재기회)
-            game_state.current_player = undone_move_player
+            game_state.current_player = undone_entry.player
         else:
             # 처음 상태로 복원 (첫 수를 무른 경우)
-            game_state.board = [
-                [0 for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)
-            ]
             game_state.current_player = FIRST_PLAYER
 
         return True
@@ -14,7 +14,7 @@ class OmokManager(BaseGameManager):
 
     def get_initial_state(self) -> Dict:
         return {
-            "board": [[0 for _ in range(15)] for _ in range(15)],
+            "board": OmokGame.create_empty_board(),
             "current_player": 1,
         }
 
@@ -35,6 +35,7 @@ class OmokManager(BaseGameManager):
         room.game_state = self.get_initial_state()
         room.move_history = []
         room.undo_requests = {}
+        room.invalidate_cache()
 
     def assign_colors(self, room: Room):
         """오목 플레이어 색상 배정."""
@@ -55,6 +56,7 @@ class OmokManager(BaseGameManager):
                         player.color = 2  # 승자는 백돌
                     else:
                         player.color = 1  # 패자는 흑돌
+        room.invalidate_players_view()
 
     def validate_move(
         self, room: Room, player: Player, x: int, y: int
@@ -107,7 +109,7 @@ class OmokManager(BaseGameManager):
         # 이동 기록 저장
         move = GameMove(x=x, y=y, player=player.color)
         history_entry = OmokGame.create_move_history_entry(
-            move=move, board_state=game_state.board, player=player.color
+            move=move, player=player.color
         )
         room.move_history.append(history_entry)
 
@@ -143,3 +145,4 @@ class OmokManager(BaseGameManager):
             "board": game_state.board,
             "current_player": game_state.current_player,
         }
+        room.invalidate_cache()
@@ -1,13 +1,18 @@
 """WebSocket 연결 관리 전담 클래스"""
 
+import asyncio
 from datetime import datetime
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional
 
 from fastapi import WebSocket
+from starlette.websockets import WebSocketState
 
 from ..models import Room
 from ..utils.room_timer import RoomTimer
 
+# 상수 정의
+SEND_QUEUE_SIZE = 64  # 연결별 전송 대기열 최대 크기 (초과 시 가장 오래된 메시지 폐기)
+
 
 class ConnectionManager:
     """WebSocket 연결 및 세션 관리 전담
@@ -16,8 +21,8 @@ class ConnectionManager:
     """
 
     def __init__(self):
-        # 방별 WebSocket 연결 관리
-        self.connections: Dict[str, Set[WebSocket]] = {}
+        # 방별 WebSocket 연결 관리 (방당 연결 수가 적어 리스트로 보관)
+        self.connections: Dict[str, List[WebSocket]] = {}
         # WebSocket -> session_id 매핑
         self.websocket_sessions: Dict[WebSocket, str] = {}
         # session_id -> room_id 매핑 (빠른 조회용)
@@ -26,6 +31,79 @@ class ConnectionManager:
         self.session_to_websocket: Dict[str, WebSocket] = {}
         # 방 정리 타이머 관리
         self.room_timer = RoomTimer()
+        # WebSocket별 전송 대기열과 전송 전담 태스크
+        self.send_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self.sender_tasks: Dict[WebSocket, asyncio.Task] = {}
+
+    def start_sender(self, room_id: str, websocket: WebSocket) -> None:
+        """연결 전용 전송 태스크 시작
+
+        느린 클라이언트가 브로드캐스트를 막지 않도록 메시지는 대기열에 넣고
+        별도 태스크가 순서대로 전송한다.
+
+        Args:
+            room_id: 방 ID
+            websocket: 수락된 WebSocket 연결
+        """
+        if websocket in self.send_queues:
+            return
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self.send_queues[websocket] = queue
+        self.sender_tasks[websocket] = asyncio.create_task(
+            self._sender_loop(room_id, websocket, queue)
+        )
+
+    async def _sender_loop(
+        self, room_id: str, websocket: WebSocket, queue: asyncio.Queue
+    ) -> None:
+        """대기열의 메시지를 순서대로 전송 (전송 실패 시 브로드캐스트 대상에서 제외)"""
+        try:
+            while True:
+                payload = await queue.get()
+                await websocket.send_bytes(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # 끊긴 연결에 더 이상 대기열이 쌓이지 않도록 정리 (현재 태스크는 취소하지 않음)
+            if self.send_queues.get(websocket) is queue:
+                self.send_queues.pop(websocket, None)
+                self.sender_tasks.pop(websocket, None)
+            self.discard_connections(room_id, [websocket])
+
+    def enqueue_send(self, websocket: WebSocket, payload: bytes) -> bool:
+        """전송 대기열에 메시지 추가
+
+        대기열이 가득 차면 가장 오래된 메시지를 버리고 추가한다.
+
+        Args:
+            websocket: 대상 WebSocket 연결
+            payload: 인코딩된 메시지
+
+        Returns:
+            대기열 추가 여부 (전송 태스크가 없는 연결이면 False)
+        """
+        queue = self.send_queues.get(websocket)
+        if queue is None:
+            return False
+
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(payload)
+        return True
+
+    def stop_sender(self, websocket: WebSocket) -> None:
+        """연결 전용 전송 태스크 종료 및 대기열 정리
+
+        Args:
+            websocket: 종료된 WebSocket 연결
+        """
+        self.send_queues.pop(websocket, None)
+        task = self.sender_tasks.pop(websocket, None)
+        if task:
+            task.cancel()
 
     def add_connection(
         self, room_id: str, websocket: WebSocket, session_id: Optional[str] = None
@@ -37,12 +115,12 @@ class ConnectionManager:
             websocket: 추가할 WebSocket 연결
             session_id: 세션 ID (옵션)
         """
-        # 방별 연결 집합 초기화
-        if room_id not in self.connections:
-            self.connections[room_id] = set()
+        # 방별 연결 목록 초기화
+        connections = self.connections.setdefault(room_id, [])
 
-        # WebSocket 연결 추가
-        self.connections[room_id].add(websocket)
+        # WebSocket 연결 추가 (중복 방지)
+        if websocket not in connections:
+            connections.append(websocket)
 
         # 세션 매핑 저장
         if session_id:
@@ -61,11 +139,13 @@ class ConnectionManager:
             제거된 연결의 session_id (있는 경우)
         """
         # 연결 제거
-        if room_id in self.connections:
-            self.connections[room_id].discard(websocket)
+        connections = self.connections.get(room_id)
+        if connections is not None:
+            if websocket in connections:
+                connections.remove(websocket)
 
-            # 빈 연결 집합 정리
-            if not self.connections[room_id]:
+            # 빈 연결 목록 정리
+            if not connections:
                 del self.connections[room_id]
 
         # 세션 매핑 정리 및 세션 ID 반환
@@ -84,16 +164,61 @@ class ConnectionManager:
 
         return disconnected_session_id
 
-    def get_connections(self, room_id: str) -> Set[WebSocket]:
+    def get_connections(self, room_id: str) -> List[WebSocket]:
         """방의 모든 WebSocket 연결 반환
 
         Args:
             room_id: 방 ID
 
         Returns:
-            WebSocket 연결 집합
+            WebSocket 연결 목록
+        """
+        return self.connections.get(room_id, [])
+
+    def get_active_connections(self, room_id: str) -> List[WebSocket]:
+        """방의 연결 중 실제로 열려 있는 WebSocket 목록 반환
+
+        이미 끊어진 연결은 브로드캐스트 대상에서 제거한다. 세션 매핑은
+        연결 종료 처리(remove_connection)에서 정리되도록 그대로 둔다.
+
+        Args:
+            room_id: 방 ID
+
+        Returns:
+            열려 있는 WebSocket 연결 목록
+        """
+        connections = self.connections.get(room_id)
+        if not connections:
+            return []
+
+        active = [
+            ws for ws in connections if ws.client_state == WebSocketState.CONNECTED
+        ]
+        if len(active) != len(connections):
+            if active:
+                self.connections[room_id] = active[:]
+            else:
+                del self.connections[room_id]
+        return active
+
+    def discard_connections(self, room_id: str, websockets: List[WebSocket]) -> None:
+        """전송에 실패한 연결을 브로드캐스트 대상에서 제거
+
+        세션 매핑은 연결 종료 처리(remove_connection)에서 정리되도록 그대로 둔다.
+
+        Args:
+            room_id: 방 ID
+            websockets: 제거할 WebSocket 연결 목록
         """
-        return self.connections.get(room_id, set())
+        connections = self.connections.get(room_id)
+        if not connections:
+            return
+
+        remaining = [ws for ws in connections if ws not in websockets]
+        if remaining:
+            self.connections[room_id] = remaining
+        else:
+            del self.connections[room_id]
 
     def get_session_id_by_websocket(self, websocket: WebSocket) -> Optional[str]:
         """WebSocket으로 세션 ID 조회
@@ -106,6 +231,17 @@ class ConnectionManager:
         """
         return self.websocket_sessions.get(websocket)
 
+    def get_websocket_by_session(self, session_id: str) -> Optional[WebSocket]:
+        """세션 ID로 WebSocket 조회 (O(1) 성능)
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            WebSocket 연결 (있는 경우)
+        """
+        return self.session_to_websocket.get(session_id)
+
     def get_room_id_by_session(self, session_id: str) -> Optional[str]:
         """세션 ID로 방 ID 조회 (O(1) 성능)
 
@@ -155,7 +291,7 @@ class ConnectionManager:
         Returns:
             연결 수
         """
-        return len(self.connections.get(room_id, set()))
+        return len(self.connections.get(room_id, []))
 
     def cleanup_room_connections(self, room_id: str) -> None:
         """방의 모든 연결 정리
@@ -164,7 +300,7 @@ class ConnectionManager:
             room_id: 방 ID
         """
         # 방의 모든 WebSocket 연결 가져오기
-        websockets = self.connections.get(room_id, set()).copy()
+        websockets = self.connections.get(room_id, [])[:]
 
         # 각 연결에 대해 세션 매핑 정리
         for websocket in websockets:
@@ -176,7 +312,7 @@ class ConnectionManager:
                 if session_id in self.session_to_websocket:
                     del self.session_to_websocket[session_id]
 
-        # 연결 집합 제거
+        # 연결 목록 제거
         if room_id in self.connections:
             del self.connections[room_id]
 
@@ -215,15 +351,16 @@ class ConnectionManager:
 
         if old_websocket:
             # 기존 WebSocket 연결 제거
-            if room_id in self.connections:
-                self.connections[room_id].discard(old_websocket)
+            connections = self.connections.get(room_id)
+            if connections and old_websocket in connections:
+                connections.remove(old_websocket)
             if old_websocket in self.websocket_sessions:
                 del self.websocket_sessions[old_websocket]
 
         # 새 연결 추가
         self.add_connection(room_id, websocket, session_id)
 
-    def get_all_connections(self) -> Dict[str, Set[WebSocket]]:
+    def get_all_connections(self) -> Dict[str, List[WebSocket]]:
         """모든 연결 정보 반환 (디버깅용)
 
         Returns:
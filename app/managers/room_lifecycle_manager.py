@@ -1,6 +1,6 @@
 """방 생명주기 관리 전담 클래스"""
 
-import uuid
+import secrets
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
@@ -38,7 +38,10 @@ class RoomLifecycleManager:
         Returns:
             (방 ID, URL 경로) 튜플
         """
-        room_id = str(uuid.uuid4())[:8]
+        # 8자리 16진수 방 ID (충돌 시 재생성)
+        room_id = secrets.token_hex(4)
+        while room_id in self.rooms:
+            room_id = secrets.token_hex(4)
 
         # 게임 타입별 방 생성
         if game_type == GameType.OMOK:
@@ -108,6 +111,7 @@ class RoomLifecycleManager:
             is_connected=True,
         )
         room.players.append(player)
+        room.invalidate_players_view()
 
         # session_to_room 매핑 추가
         self.session_to_room[session_id] = room_id
@@ -156,6 +160,7 @@ class RoomLifecycleManager:
                 room.status = GameStatus.WAITING
             elif len(room.players) < 2 and room.status == GameStatus.PLAYING:
                 room.status = GameStatus.WAITING
+            room.invalidate_players_view()
 
         return removed_player
 
@@ -0,0 +1,67 @@
+"""WebSocket 수신 메시지 스키마 (Pydantic)"""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .models import MessageType
+
+
+class InboundMessage(BaseModel):
+    """수신 메시지 공통 설정 (타입 강제 변환 없이 검증, 추가 필드는 무시)"""
+
+    model_config = ConfigDict(strict=True, extra="ignore")
+
+    session_id: Optional[str] = None
+
+
+class MovePayload(BaseModel):
+    """착수 좌표"""
+
+    model_config = ConfigDict(strict=True, extra="ignore")
+
+    x: int
+    y: int
+
+
+class JoinMessage(InboundMessage):
+    nickname: Optional[str] = None
+
+
+class MoveMessage(InboundMessage):
+    move: Optional[MovePayload] = None
+
+
+class GameEndMessage(InboundMessage):
+    last_move: Dict[str, Any] = Field(default_factory=dict)
+    winning_line: List[Any] = Field(default_factory=list)
+
+
+class PlayerRequestMessage(InboundMessage):
+    """재시작/무르기 요청"""
+
+    from_player: Optional[int] = Field(default=None, alias="from")
+
+
+class ResponseMessage(InboundMessage):
+    """재시작/무르기 응답"""
+
+    accepted: bool = False
+
+
+class ChatMessagePayload(InboundMessage):
+    message: Optional[str] = None
+
+
+# 메시지 타입 문자열 -> 스키마
+INBOUND_SCHEMAS: Dict[str, type[InboundMessage]] = {
+    MessageType.JOIN.value: JoinMessage,
+    MessageType.RECONNECT.value: InboundMessage,
+    MessageType.MOVE.value: MoveMessage,
+    MessageType.GAME_END.value: GameEndMessage,
+    MessageType.RESTART_REQUEST.value: PlayerRequestMessage,
+    MessageType.RESTART_RESPONSE.value: ResponseMessage,
+    MessageType.UNDO_REQUEST.value: PlayerRequestMessage,
+    MessageType.UNDO_RESPONSE.value: ResponseMessage,
+    MessageType.CHAT_MESSAGE.value: ChatMessagePayload,
+}
@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -42,7 +43,6 @@ class OmokGameState:
 @dataclass
 class MoveHistoryEntry:
     move: GameMove
-    board_state: List[List[int]]
     player: int
 
 
@@ -54,7 +54,7 @@ class ChatMessage:
     player_number: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     room_id: str
     game_type: GameType
@@ -68,6 +68,19 @@ class Room:
     games_played: int = 0  # 게임 횟수
     last_winner: Optional[int] = None  # 마지막 게임 승자
     chat_history: List[ChatMessage] = field(default_factory=list)  # 채팅 히스토리
+    chat_version: int = 0  # 채팅 메시지가 추가될 때마다 증가
+    # 인코딩된 ROOM_UPDATE 페이로드 캐시 (상태 변경 시 무효화)
+    room_update_cache: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # 전송용 플레이어 목록 캐시 (참여/퇴장/색상 변경 시 무효화)
+    players_view_cache: Optional[List[Dict]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # 방 상태 변경 직렬화용 잠금 (메시지 처리 단위로 획득)
+    lock: asyncio.Lock = field(
+        default_factory=asyncio.Lock, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if self.players is None:
@@ -79,6 +92,28 @@ class Room:
         if self.chat_history is None:
             self.chat_history = []
 
+    def invalidate_cache(self) -> None:
+        """방 상태 변경 시 브로드캐스트 페이로드 캐시 무효화"""
+        self.room_update_cache = None
+
+    def invalidate_players_view(self) -> None:
+        """플레이어 구성/색상 변경 시 플레이어 목록 캐시 무효화"""
+        self.players_view_cache = None
+        self.invalidate_cache()
+
+    def get_players_view(self) -> List[Dict]:
+        """전송용 플레이어 목록 (닉네임, 번호, 색상)"""
+        if self.players_view_cache is None:
+            self.players_view_cache = [
+                {
+                    "nickname": p.nickname,
+                    "player_number": p.player_number,
+                    "color": p.color,
+                }
+                for p in self.players
+            ]
+        return self.players_view_cache
+
     def is_full(self) -> bool:
         """방이 가득 찬지 확인"""
         return len(self.players) >= 2
@@ -2,7 +2,7 @@
 
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from .metrics import MetricsCollector, get_metrics_collector
@@ -151,8 +151,6 @@ class ConfigMetrics:
         self, config_name: Optional[str] = None, hours: int = 24
     ) -> List[Dict[str, Any]]:
         """설정 변경 히스토리 조회"""
-        from datetime import timedelta
-
         cutoff = datetime.now() - timedelta(hours=hours)
 
         filtered_changes = []
@@ -1,6 +1,6 @@
 """리팩토링된 방 관리 시스템 (Facade Pattern)"""
 
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import WebSocket
 
@@ -74,10 +74,30 @@ class RoomManager:
                         room_id, room, self._cleanup_room_callback
                     )
 
-    def get_room_connections(self, room_id: str) -> Set[WebSocket]:
+    def start_sender(self, room_id: str, websocket: WebSocket) -> None:
+        """연결 전용 전송 태스크 시작"""
+        self.connection_manager.start_sender(room_id, websocket)
+
+    def enqueue_send(self, websocket: WebSocket, payload: bytes) -> bool:
+        """연결의 전송 대기열에 메시지 추가"""
+        return self.connection_manager.enqueue_send(websocket, payload)
+
+    def stop_sender(self, websocket: WebSocket) -> None:
+        """연결 전용 전송 태스크 종료"""
+        self.connection_manager.stop_sender(websocket)
+
+    def discard_connections(self, room_id: str, websockets: List[WebSocket]) -> None:
+        """전송에 실패한 연결을 브로드캐스트 대상에서 제거"""
+        self.connection_manager.discard_connections(room_id, websockets)
+
+    def get_room_connections(self, room_id: str) -> List[WebSocket]:
         """방의 모든 연결 조회"""
         return self.connection_manager.get_connections(room_id)
 
+    def get_active_room_connections(self, room_id: str) -> List[WebSocket]:
+        """방의 열려 있는 연결 조회 (끊어진 연결은 정리)"""
+        return self.connection_manager.get_active_connections(room_id)
+
     # === 플레이어 관리 관련 ===
     def add_player_to_room(
         self, room_id: str, nickname: str, session_id: str
@@ -106,6 +126,10 @@ class RoomManager:
         """WebSocket으로 세션 ID 조회"""
         return self.connection_manager.get_session_id_by_websocket(websocket)
 
+    def get_websocket_by_session(self, session_id: str) -> Optional[WebSocket]:
+        """세션 ID로 WebSocket 조회"""
+        return self.connection_manager.get_websocket_by_session(session_id)
+
     # === 재접속 처리 ===
     def handle_reconnection(
         self, room_id: str, session_id: str, websocket: WebSocket
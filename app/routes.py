@@ -1,6 +1,7 @@
 """FastAPI routes for the Lupin game website."""
 
 import json
+import logging
 
 from fastapi import (
     APIRouter,
@@ -16,9 +17,21 @@ from fastapi.templating import Jinja2Templates
 from .dependencies import get_room_manager, get_session_manager, get_websocket_handler
 from .version import add_version_to_url, get_current_app_version
 
+logger = logging.getLogger(__name__)
+
 # 라우터 설정
 router = APIRouter()
 templates = Jinja2Templates(directory="templates")
+# 매크로/모든 페이지에서 버전 URL을 쓸 수 있도록 전역 등록
+templates.env.globals["add_version_to_url"] = add_version_to_url
+
+# 고정 WebSocket 오류 메시지 (모듈 로드 시 한 번만 인코딩)
+_ROOM_NOT_FOUND_BYTES = json.dumps(
+    {"type": "error", "message": "방을 찾을 수 없습니다."}, ensure_ascii=False
+).encode()
+_INVALID_MESSAGE_BYTES = json.dumps(
+    {"type": "error", "message": "잘못된 메시지 형식입니다."}, ensure_ascii=False
+).encode()
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -169,23 +182,23 @@ async def websocket_endpoint(
 
     # 방이 존재하지 않는 경우 연결 종료
     if not room_manager.room_exists(room_id):
-        await websocket.send_text(
-            json.dumps({"type": "error", "message": "방을 찾을 수 없습니다."})
-        )
+        await websocket.send_bytes(_ROOM_NOT_FOUND_BYTES)
         await websocket.close()
         return
 
+    # 연결 전용 전송 태스크 (브로드캐스트는 대기열을 통해 전송)
+    room_manager.start_sender(room_id, websocket)
+
     try:
         while True:
             data = await websocket.receive_text()
             try:
                 message = json.loads(data)
-            except json.JSONDecodeError:
-                await websocket.send_text(
-                    json.dumps(
-                        {"type": "error", "message": "잘못된 메시지 형식입니다."}
-                    )
-                )
+                if not isinstance(message, dict):
+                    raise ValueError("message must be an object")
+            except ValueError:
+                if not room_manager.enqueue_send(websocket, _INVALID_MESSAGE_BYTES):
+                    await websocket.send_bytes(_INVALID_MESSAGE_BYTES)
                 continue
 
             # 메시지 처리
@@ -193,9 +206,11 @@ async def websocket_endpoint(
 
     except WebSocketDisconnect:
         await _handle_disconnect(room_id, websocket, room_manager, websocket_handler)
-    except Exception as e:
-        print(f"WebSocket error: {e}")
+    except Exception:
+        logger.exception("WebSocket 처리 중 오류 (room=%s)", room_id)
         await _handle_disconnect(room_id, websocket, room_manager, websocket_handler)
+    finally:
+        room_manager.stop_sender(websocket)
 
 
 async def _handle_disconnect(
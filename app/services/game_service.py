@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 
 from fastapi import WebSocket
 
+from ..games.omok import OmokGame
 from ..models import ChatMessage, GameType, OmokGameState, Room
 from ..room_manager import room_manager
 from ..session_manager import session_manager
@@ -223,14 +224,7 @@ class GameService:
                     "success": True,
                     "accepted": True,
                     "game_state": room.game_state,
-                    "players": [
-                        {
-                            "nickname": p.nickname,
-                            "player_number": p.player_number,
-                            "color": p.color,
-                        }
-                        for p in room.players
-                    ],
+                    "players": room.get_players_view(),
                     "games_played": room.games_played,
                 }
             else:
@@ -321,11 +315,13 @@ class GameService:
                         "error_type": "game",
                     }
             else:
-                # 무르기 거부
+                # 무르기 거부 (요청자 알림을 위해 연결을 먼저 꺼내둠)
+                requester_websocket = room.undo_requests.get("requester_websocket")
                 room.undo_requests.clear()
                 return {
                     "success": True,
                     "accepted": False,
+                    "requester_websocket": requester_websocket,
                     "message": "무르기가 거부되었습니다",
                 }
 
@@ -340,8 +336,6 @@ class GameService:
 
     async def _handle_omok_undo(self, room_id: str, room: Room) -> bool:
         """오목 무르기 처리"""
-        from ..games.omok import OmokGame
-
         game_state = OmokGameState(
             board=room.game_state["board"],
             current_player=room.game_state["current_player"],
@@ -352,6 +346,7 @@ class GameService:
                 "board": game_state.board,
                 "current_player": game_state.current_player,
             }
+            room.invalidate_cache()
             return True
         return False
 
@@ -390,8 +385,10 @@ class GameService:
 
             # 채팅 히스토리에 추가
             room.chat_history.append(chat_message)
+            room.chat_version += 1
             if len(room.chat_history) > MAX_CHAT_HISTORY:
                 room.chat_history = room.chat_history[-MAX_CHAT_HISTORY:]
+            room.invalidate_cache()
 
             return {
                 "success": True,
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 from datetime import datetime
 from typing import Any, Dict, Optional
 
@@ -19,14 +20,21 @@ class ErrorHandler:
 
     @staticmethod
     def setup_logging() -> None:
-        """로깅 시스템 설정."""
+        """로깅 시스템 설정.
+
+        오류 로그 파일은 ERROR 이상만 기록하고 첫 오류가 생길 때 만든다.
+        경로는 LUPIN_ERROR_LOG로 바꿀 수 있으며 빈 값이면 파일에 쓰지 않는다.
+        """
+        handlers: list[logging.Handler] = [logging.StreamHandler()]
+        error_log = os.getenv("LUPIN_ERROR_LOG", "game_errors.log")
+        if error_log:
+            file_handler = logging.FileHandler(error_log, encoding="utf-8", delay=True)
+            file_handler.setLevel(logging.ERROR)
+            handlers.append(file_handler)
         logging.basicConfig(
             level=logging.INFO,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler("game_errors.log", encoding="utf-8"),
-            ],
+            handlers=handlers,
         )
 
     @staticmethod
@@ -2,6 +2,7 @@
 
 import hashlib
 import logging
+import os
 import time
 from pathlib import Path
 from typing import Dict, Optional
@@ -63,7 +64,7 @@ _file_version_cache: Dict[str, tuple[float, str]] = {}
 def get_static_file_version(file_path: str) -> str:
     """정적 파일의 해시 기반 버전 반환 (캐싱 지원)."""
     try:
-        full_path = Path("static") / file_path.lstrip("/static/")
+        full_path = Path("static") / file_path.removeprefix("/static/")
         if not full_path.exists():
             return get_app_version()
 
@@ -113,8 +114,6 @@ def clear_version_cache() -> None:
 def get_current_app_version() -> str:
     """현재 앱 버전 반환 (동적)."""
     # 개발 모드에서는 매번 새로 계산 (환경변수로 제어 가능)
-    import os
-
     if os.getenv("DEBUG", "false").lower() == "true":
         clear_version_cache()
     return get_app_version()
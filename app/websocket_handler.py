@@ -1,43 +1,171 @@
+import asyncio
+import contextlib
 import json
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import WebSocket
+from pydantic import ValidationError
 
-from .models import MessageType, WebSocketMessage
+from .games.omok import OmokGame
+from .message_schemas import INBOUND_SCHEMAS
+from .models import MessageType
 from .room_manager import room_manager
 from .services.game_service import game_service
 
+logger = logging.getLogger(__name__)
+
+# 상수 정의
+BROADCAST_BATCH_SIZE = 50  # 한 번에 동시 전송할 최대 연결 수
+DIRECT_SEND_MAX_CONNECTIONS = 2  # 이 수 이하면 gather 없이 순차 전송
+
+
+def _encode(message: Dict) -> bytes:
+    """전송용 JSON 바이트 인코딩 (바이너리 프레임으로 전송)."""
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _msg(type_: MessageType, data: Dict) -> Dict:
+    """전송용 메시지 딕셔너리 생성 (WebSocketMessage.to_json()과 동일한 형식)."""
+    return {"type": type_.value, **data}
+
+
+# 데이터가 없는 고정 메시지는 모듈 로드 시 한 번만 인코딩
+_RESTART_REJECTED_BYTES = _encode(_msg(MessageType.RESTART_REJECTED, {}))
+_UNDO_REJECTED_BYTES = _encode(_msg(MessageType.UNDO_REJECTED, {}))
+
+
+def _encode_game_state(game_state: Optional[Dict]) -> Optional[Dict]:
+    """전송용 게임 상태 생성 (오목 보드는 압축 문자열로 인코딩)."""
+    if not game_state or not isinstance(game_state.get("board"), list):
+        return game_state
+    return {
+        "board": OmokGame.encode_board(game_state["board"]),
+        "current_player": game_state["current_player"],
+    }
+
+
+def _chat_history_view(room) -> List[Dict]:
+    """전송용 채팅 히스토리 목록."""
+    return [
+        {
+            "nickname": msg.nickname,
+            "message": msg.message,
+            "timestamp": msg.timestamp,
+            "player_number": msg.player_number,
+        }
+        for msg in room.chat_history
+    ]
+
+
+def _build_room_update_bytes(room, include_chat: bool = False) -> bytes:
+    """인코딩된 ROOM_UPDATE 메시지 생성.
+
+    채팅 히스토리는 새로 참여한 플레이어에게만 포함하고, 그 외에는
+    chat_version만 전송한다 (이후 메시지는 CHAT_BROADCAST로 전달됨).
+    """
+    room_data = {
+        "game_type": room.game_type.value,
+        "players": room.get_players_view(),
+        "game_state": _encode_game_state(room.game_state),
+        "status": room.status.value,
+        "game_ended": room.game_ended,
+        "winner": room.winner,
+        "games_played": room.games_played,
+        "chat_version": room.chat_version,
+    }
+    if include_chat:
+        room_data["chat_history"] = _chat_history_view(room)
+    return _encode(_msg(MessageType.ROOM_UPDATE, {"room": room_data}))
+
+
+def _build_reconnect_success_bytes(room, player) -> bytes:
+    """인코딩된 RECONNECT_SUCCESS 메시지 생성 (전체 상태 포함)."""
+    return _encode(
+        _msg(
+            MessageType.RECONNECT_SUCCESS,
+            {
+                "player": {
+                    "nickname": player.nickname,
+                    "player_number": player.player_number,
+                    "color": player.color,
+                },
+                "room": {
+                    "game_type": room.game_type.value,
+                    "players": [
+                        {**view, "is_connected": p.is_connected}
+                        for view, p in zip(room.get_players_view(), room.players)
+                    ],
+                    "game_state": _encode_game_state(room.game_state),
+                    "status": room.status.value,
+                    "game_ended": room.game_ended,
+                    "winner": room.winner,
+                    "games_played": room.games_played,
+                    "chat_history": _chat_history_view(room),
+                },
+                "move_history": [
+                    {
+                        "move": {
+                            "x": entry.move.x,
+                            "y": entry.move.y,
+                            "player": entry.move.player,
+                        },
+                        "player": entry.player,
+                    }
+                    for entry in room.move_history
+                ],
+            },
+        )
+    )
+
 
 class WebSocketHandler:
     """WebSocket 메시지 처리 및 GameService로 위임"""
 
     def __init__(self):
         self.game_service = game_service
+        # 메시지 처리 중 쌓인 방별 GAME_UPDATE (처리 종료 시 한 번만 전송)
+        self.pending_game_updates: Dict[str, Dict] = {}
+        # 메시지 타입 문자열 -> 처리 함수 (Enum 변환 없이 바로 조회)
+        self.message_handlers = {
+            MessageType.JOIN.value: self._handle_join,
+            MessageType.RECONNECT.value: self._handle_reconnect,
+            MessageType.MOVE.value: self._handle_move,
+            MessageType.GAME_END.value: self._handle_game_end,
+            MessageType.RESTART_REQUEST.value: self._handle_restart_request,
+            MessageType.RESTART_RESPONSE.value: self._handle_restart_response,
+            MessageType.UNDO_REQUEST.value: self._handle_undo_request,
+            MessageType.UNDO_RESPONSE.value: self._handle_undo_response,
+            MessageType.CHAT_MESSAGE.value: self._handle_chat_message,
+        }
 
     async def handle_message(
         self, websocket: WebSocket, room_id: str, message: Dict[str, Any]
     ):
-        """메시지 처리 메인 함수."""
-        message_type = MessageType(message["type"])
-
-        if message_type == MessageType.JOIN:
-            await self._handle_join(websocket, room_id, message)
-        elif message_type == MessageType.RECONNECT:
-            await self._handle_reconnect(websocket, room_id, message)
-        elif message_type == MessageType.MOVE:
-            await self._handle_move(websocket, room_id, message)
-        elif message_type == MessageType.GAME_END:
-            await self._handle_game_end(websocket, room_id, message)
-        elif message_type == MessageType.RESTART_REQUEST:
-            await self._handle_restart_request(websocket, room_id, message)
-        elif message_type == MessageType.RESTART_RESPONSE:
-            await self._handle_restart_response(websocket, room_id, message)
-        elif message_type == MessageType.UNDO_REQUEST:
-            await self._handle_undo_request(websocket, room_id, message)
-        elif message_type == MessageType.UNDO_RESPONSE:
-            await self._handle_undo_response(websocket, room_id, message)
-        elif message_type == MessageType.CHAT_MESSAGE:
-            await self._handle_chat_message(websocket, room_id, message)
+        """메시지 처리 메인 함수. 알 수 없는 타입의 메시지는 무시한다."""
+        message_type = message.get("type")
+        # 문자열이 아닌 type(리스트 등 해시 불가 값 포함)은 조회 전에 무시
+        if not isinstance(message_type, str):
+            return
+        handler = self.message_handlers.get(message_type)
+        if handler is None:
+            return
+
+        # 필드 타입이 잘못된 메시지는 처리하지 않고 오류로 응답
+        # (검증 전용 관문: 핸들러는 검증을 통과한 원본 dict를 그대로 읽음)
+        try:
+            INBOUND_SCHEMAS[message_type].model_validate(message)
+        except ValidationError:
+            await self._send_error(websocket, "잘못된 메시지 형식입니다.", "validation")
+            return
+
+        # 같은 방의 메시지는 하나씩 처리 (상태 변경과 브로드캐스트가 섞이지 않도록)
+        room = room_manager.get_room(room_id)
+        async with room.lock if room else contextlib.nullcontext():
+            try:
+                await handler(websocket, room_id, message)
+            finally:
+                await self._flush_game_update(room_id)
 
     async def _handle_join(
         self, websocket: WebSocket, room_id: str, message: Dict[str, Any]
@@ -51,7 +179,9 @@ class WebSocketHandler:
         )
 
         if result["success"]:
-            await self._broadcast_room_update(room_id, result["room"])
+            await self._broadcast_room_update(
+                room_id, result["room"], joiner_ws=websocket
+            )
         else:
             await self._send_error(
                 websocket, result["error"], result.get("error_type", "general")
@@ -102,8 +232,8 @@ class WebSocketHandler:
                     room_id, result["last_move"], result.get("winning_line", []), result
                 )
             else:
-                # 일반 이동 업데이트
-                await self._broadcast_game_update(
+                # 일반 이동 업데이트 (메시지 처리 종료 시 전송)
+                self._schedule_game_update(
                     room_id, result["game_state"], result["last_move"]
                 )
         else:
@@ -119,16 +249,16 @@ class WebSocketHandler:
         result: Dict[str, Any],
     ):
         """게임 종료 브로드캐스트"""
-        response = WebSocketMessage(
-            type=MessageType.GAME_END,
-            data={
+        response = _msg(
+            MessageType.GAME_END,
+            {
                 "winner": result.get("winner"),
-                "game_state": result.get("game_state"),
+                "game_state": _encode_game_state(result.get("game_state")),
                 "last_move": last_move,
                 "winning_line": winning_line,
             },
         )
-        await self._broadcast_to_room(room_id, response.to_json())
+        await self._broadcast_to_room(room_id, response)
 
     async def _handle_game_end(
         self, websocket: WebSocket, room_id: str, message: Dict[str, Any]
@@ -179,15 +309,15 @@ class WebSocketHandler:
         if result["success"]:
             if result["accepted"]:
                 # 재시작 승인
-                response = WebSocketMessage(
-                    type=MessageType.RESTART_ACCEPTED,
-                    data={
-                        "game_state": result["game_state"],
+                response = _msg(
+                    MessageType.RESTART_ACCEPTED,
+                    {
+                        "game_state": _encode_game_state(result["game_state"]),
                         "players": result["players"],
                         "games_played": result["games_played"],
                     },
                 )
-                await self._broadcast_to_room(room_id, response.to_json())
+                await self._broadcast_to_room(room_id, response)
             else:
                 # 재시작 거부
                 await self._broadcast_restart_rejection(room_id, websocket)
@@ -242,14 +372,14 @@ class WebSocketHandler:
         if result["success"]:
             if result["accepted"]:
                 # 무르기 승인
-                response = WebSocketMessage(
-                    type=MessageType.UNDO_ACCEPTED,
-                    data={"game_state": result["game_state"]},
+                response = _msg(
+                    MessageType.UNDO_ACCEPTED,
+                    {"game_state": _encode_game_state(result["game_state"])},
                 )
-                await self._broadcast_to_room(room_id, response.to_json())
+                await self._broadcast_to_room(room_id, response)
             else:
                 # 무르기 거부 - 요청자에게 알림
-                await self._notify_undo_rejection(room_id)
+                await self._notify_undo_rejection(result.get("requester_websocket"))
         else:
             await self._send_error(
                 websocket, result["error"], result.get("error_type", "general")
@@ -272,196 +402,120 @@ class WebSocketHandler:
 
         if result["success"]:
             # 채팅 메시지 브로드캐스트
-            response = WebSocketMessage(
-                type=MessageType.CHAT_BROADCAST,
-                data=result["chat_message"],
-            )
-            await self._broadcast_to_room(room_id, response.to_json())
+            response = _msg(MessageType.CHAT_BROADCAST, result["chat_message"])
+            await self._broadcast_to_room(room_id, response)
         else:
             await self._send_error(
                 websocket, result["error"], result.get("error_type", "general")
             )
 
-    async def _broadcast_room_update(self, room_id: str, room):
-        """방 상태 업데이트 브로드캐스트."""
-        response = WebSocketMessage(
-            type=MessageType.ROOM_UPDATE,
-            data={
-                "room": {
-                    "game_type": room.game_type.value,
-                    "players": [
-                        {
-                            "nickname": p.nickname,
-                            "player_number": p.player_number,
-                            "color": p.color,
-                        }
-                        for p in room.players
-                    ],
-                    "game_state": room.game_state,
-                    "status": room.status.value,
-                    "game_ended": room.game_ended,
-                    "winner": room.winner,
-                    "games_played": room.games_played,
-                    "chat_history": [
-                        {
-                            "nickname": msg.nickname,
-                            "message": msg.message,
-                            "timestamp": msg.timestamp,
-                            "player_number": msg.player_number,
-                        }
-                        for msg in room.chat_history
-                    ],
-                }
-            },
+    async def _broadcast_room_update(
+        self, room_id: str, room, joiner_ws: Optional[WebSocket] = None
+    ):
+        """방 상태 업데이트 브로드캐스트.
+
+        인코딩된 페이로드는 방 상태가 바뀔 때까지 Room에 캐시해 재사용한다.
+        joiner_ws가 주어지면 해당 연결에는 채팅 히스토리를 포함해 전송한다.
+        """
+        if room.room_update_cache is None:
+            room.room_update_cache = _build_room_update_bytes(room)
+
+        if joiner_ws is None or not room.chat_history:
+            await self._broadcast_payload(room_id, room.room_update_cache)
+            return
+
+        joiner_payload = _build_room_update_bytes(room, include_chat=True)
+        connections = room_manager.get_active_room_connections(room_id)
+        await self._send_each(
+            room_id,
+            [
+                (ws, joiner_payload if ws is joiner_ws else room.room_update_cache)
+                for ws in connections
+            ],
         )
-        await self._broadcast_to_room(room_id, response.to_json())
 
-    async def _broadcast_game_update(
-        self, room_id: str, game_state: Dict, last_move=None
-    ):
-        """게임 상태 업데이트 브로드캐스트."""
-        response = WebSocketMessage(
-            type=MessageType.GAME_UPDATE,
-            data={
-                "game_state": {
-                    "board": game_state["board"],
-                    "current_player": game_state["current_player"],
-                },
-                "last_move": last_move,
+    def _schedule_game_update(self, room_id: str, game_state: Dict, last_move=None):
+        """게임 상태 업데이트 예약.
+
+        같은 메시지 처리 중 여러 번 호출되면 마지막 상태만 한 번 전송된다.
+        """
+        self.pending_game_updates[room_id] = {
+            "game_state": game_state,
+            "last_move": last_move,
+        }
+
+    async def _flush_game_update(self, room_id: str):
+        """예약된 게임 상태 업데이트 브로드캐스트."""
+        pending = self.pending_game_updates.pop(room_id, None)
+        if pending is None:
+            return
+
+        response = _msg(
+            MessageType.GAME_UPDATE,
+            {
+                "game_state": _encode_game_state(pending["game_state"]),
+                "last_move": pending["last_move"],
             },
         )
-        await self._broadcast_to_room(room_id, response.to_json())
+        await self._broadcast_to_room(room_id, response)
 
     async def _send_error(
         self, websocket: WebSocket, message: str, error_type: str = "general"
     ):
         """통합 오류 메시지 전송 메서드."""
+        payload = _encode(
+            {"type": "error", "error_type": error_type, "message": message}
+        )
+        if room_manager.enqueue_send(websocket, payload):
+            return
         try:
-            await websocket.send_json(
-                {
-                    "type": "error",
-                    "error_type": error_type,
-                    "message": message,
-                }
-            )
-        except Exception as e:
-            import logging
-
-            logging.error(f"오류 메시지 전송 실패: {e}")
+            await websocket.send_bytes(payload)
+        except Exception:
+            logger.exception("오류 메시지 전송 실패")
 
     async def _send_reconnect_success(self, websocket: WebSocket, room, player):
         """재접속 성공 메시지 전송."""
-        response = WebSocketMessage(
-            type=MessageType.RECONNECT_SUCCESS,
-            data={
-                "player": {
-                    "nickname": player.nickname,
-                    "player_number": player.player_number,
-                    "color": player.color,
-                },
-                "room": {
-                    "game_type": room.game_type.value,
-                    "players": [
-                        {
-                            "nickname": p.nickname,
-                            "player_number": p.player_number,
-                            "is_connected": p.is_connected,
-                            "color": p.color,
-                        }
-                        for p in room.players
-                    ],
-                    "game_state": {
-                        "board": room.game_state["board"],
-                        "current_player": room.game_state["current_player"],
-                    },
-                    "status": room.status.value,
-                    "game_ended": room.game_ended,
-                    "winner": room.winner,
-                    "games_played": room.games_played,
-                    "chat_history": [
-                        {
-                            "nickname": msg.nickname,
-                            "message": msg.message,
-                            "timestamp": msg.timestamp,
-                            "player_number": msg.player_number,
-                        }
-                        for msg in room.chat_history
-                    ],
-                },
-                "move_history": [
-                    {
-                        "move": {
-                            "x": entry.move.x,
-                            "y": entry.move.y,
-                            "player": entry.move.player,
-                        },
-                        "player": entry.player,
-                    }
-                    for entry in room.move_history
-                ],
-            },
+        await self._send_payload(
+            websocket, _build_reconnect_success_bytes(room, player)
         )
-        try:
-            await websocket.send_text(json.dumps(response.to_json()))
-        except Exception:
-            pass
 
     async def _notify_player_reconnected(self, room_id: str, nickname: str):
         """상대방에게 재접속 알림."""
-        response = WebSocketMessage(
-            type=MessageType.PLAYER_RECONNECTED, data={"nickname": nickname}
-        )
-        await self._broadcast_to_room(room_id, response.to_json())
+        response = _msg(MessageType.PLAYER_RECONNECTED, {"nickname": nickname})
+        await self._broadcast_to_room(room_id, response)
 
     async def _notify_player_disconnected(self, room_id: str, nickname: str):
         """상대방에게 연결 끊김 알림"""
-        response = WebSocketMessage(
-            type=MessageType.PLAYER_DISCONNECTED, data={"nickname": nickname}
-        )
-        await self._broadcast_to_room(room_id, response.to_json())
+        response = _msg(MessageType.PLAYER_DISCONNECTED, {"nickname": nickname})
+        await self._broadcast_to_room(room_id, response)
 
     async def _broadcast_restart_request(
         self, room_id: str, requester_ws: WebSocket, from_player: int
     ):
         """재시작 요청 브로드캐스트"""
-        connections = room_manager.get_room_connections(room_id)
-
-        for ws in connections:
-            try:
-                if ws == requester_ws:  # 요청자
-                    waiting_response = WebSocketMessage(
-                        type=MessageType.RESTART_REQUEST,
-                        data={
-                            "from": from_player,
-                            "is_requester": True,
-                        },
-                    )
-                    await ws.send_text(json.dumps(waiting_response.to_json()))
-                else:  # 상대방
-                    confirm_response = WebSocketMessage(
-                        type=MessageType.RESTART_REQUEST,
-                        data={
-                            "from": from_player,
-                            "is_requester": False,
-                        },
-                    )
-                    await ws.send_text(json.dumps(confirm_response.to_json()))
-            except Exception:
-                pass
+        # 요청자에게는 대기 메시지, 상대방에게는 확인 요청 메시지
+        waiting_bytes = _encode(
+            _msg(
+                MessageType.RESTART_REQUEST, {"from": from_player, "is_requester": True}
+            )
+        )
+        confirm_bytes = _encode(
+            _msg(
+                MessageType.RESTART_REQUEST,
+                {"from": from_player, "is_requester": False},
+            )
+        )
+        await self._send_by_role(room_id, requester_ws, waiting_bytes, confirm_bytes)
 
     async def _broadcast_restart_rejection(self, room_id: str, rejector_ws: WebSocket):
         """재시작 거부 브로드캐스트"""
-        connections = room_manager.get_room_connections(room_id)
-        rejection_response = WebSocketMessage(
-            type=MessageType.RESTART_REJECTED, data={}
-        )
+        connections = room_manager.get_active_room_connections(room_id)
 
-        for ws in connections:
-            if ws != rejector_ws:  # 거부한 사람은 제외
-                try:
-                    await ws.send_text(json.dumps(rejection_response.to_json()))
-                except Exception:
-                    pass
+        # 거부한 사람은 제외
+        await self._send_each(
+            room_id,
+            [(ws, _RESTART_REJECTED_BYTES) for ws in connections if ws != rejector_ws],
+        )
 
     async def _broadcast_undo_request(
         self,
@@ -471,54 +525,118 @@ class WebSocketHandler:
         requester_session_id: str,
     ):
         """무르기 요청 브로드캐스트"""
-        connections = room_manager.get_room_connections(room_id)
+        # 요청자에게는 대기 메시지, 상대방에게는 확인 요청 메시지
+        waiting_bytes = _encode(
+            _msg(MessageType.UNDO_REQUEST, {"from": from_player, "is_requester": True})
+        )
+        confirm_bytes = _encode(
+            _msg(MessageType.UNDO_REQUEST, {"from": from_player, "is_requester": False})
+        )
+        requester_session_ws = room_manager.get_websocket_by_session(
+            requester_session_id
+        )
+        await self._send_by_role(
+            room_id, requester_session_ws, waiting_bytes, confirm_bytes
+        )
 
-        for ws in connections:
-            try:
-                ws_session_id = room_manager.get_session_id_by_websocket(ws)
-
-                if ws_session_id == requester_session_id:  # 요청자
-                    waiting_response = WebSocketMessage(
-                        type=MessageType.UNDO_REQUEST,
-                        data={
-                            "from": from_player,
-                            "is_requester": True,
-                        },
-                    )
-                    await ws.send_text(json.dumps(waiting_response.to_json()))
-                else:  # 상대방
-                    confirm_response = WebSocketMessage(
-                        type=MessageType.UNDO_REQUEST,
-                        data={
-                            "from": from_player,
-                            "is_requester": False,
-                        },
-                    )
-                    await ws.send_text(json.dumps(confirm_response.to_json()))
-            except Exception:
-                pass
+    async def _send_by_role(
+        self,
+        room_id: str,
+        requester_ws: Optional[WebSocket],
+        requester_payload: bytes,
+        other_payload: bytes,
+    ):
+        """요청자와 나머지 연결에 미리 인코딩된 페이로드를 각각 전송"""
+        connections = room_manager.get_active_room_connections(room_id)
+        await self._send_each(
+            room_id,
+            [
+                (ws, requester_payload if ws is requester_ws else other_payload)
+                for ws in connections
+            ],
+        )
 
-    async def _notify_undo_rejection(self, room_id: str):
+    async def _notify_undo_rejection(self, requester_ws: Optional[WebSocket]):
         """무르기 거부 알림"""
-        room = room_manager.get_room(room_id)
-        if room:
-            requester_ws = room.undo_requests.get("requester_websocket")
-            if requester_ws:
-                response = WebSocketMessage(type=MessageType.UNDO_REJECTED, data={})
-                try:
-                    await requester_ws.send_text(json.dumps(response.to_json()))
-                except Exception:
-                    pass
+        if requester_ws:
+            await self._send_payload(requester_ws, _UNDO_REJECTED_BYTES)
+
+    async def _send_payload(self, websocket: WebSocket, payload: bytes):
+        """인코딩된 페이로드를 한 연결에 전송 (전송 대기열 우선)."""
+        if room_manager.enqueue_send(websocket, payload):
+            return
+        try:
+            await websocket.send_bytes(payload)
+        except Exception:
+            pass
+
+    async def _send_each(self, room_id: str, sends: List[Tuple[WebSocket, bytes]]):
+        """연결별로 지정된 페이로드 전송 (대기열이 없는 연결은 동시에 직접 전송)."""
+        direct = [
+            (ws, payload)
+            for ws, payload in sends
+            if not room_manager.enqueue_send(ws, payload)
+        ]
+        if direct:
+            results = await asyncio.gather(
+                *(ws.send_bytes(payload) for ws, payload in direct),
+                return_exceptions=True,
+            )
+            self._discard_failed(room_id, [ws for ws, _ in direct], results)
 
     async def _broadcast_to_room(self, room_id: str, message: Dict):
         """방의 모든 연결에 메시지 브로드캐스트."""
-        connections = room_manager.get_room_connections(room_id)
-        for websocket in connections:
-            try:
-                await websocket.send_text(json.dumps(message))
-            except Exception:
-                # 연결이 끊어진 경우 무시
-                pass
+        await self._broadcast_payload(room_id, _encode(message))
+
+    async def _broadcast_payload(self, room_id: str, payload: bytes):
+        """인코딩된 페이로드를 방의 모든 연결에 전송.
+
+        각 연결의 전송 대기열에 넣어 느린 연결이 브로드캐스트를 막지 않게 한다.
+        대기열이 없는 연결에는 동시에 직접 전송하고, 전송에 실패한 연결은
+        브로드캐스트 대상에서 제외한다.
+        """
+        connections = [
+            ws
+            for ws in room_manager.get_active_room_connections(room_id)
+            if not room_manager.enqueue_send(ws, payload)
+        ]
+        if not connections:
+            return
+
+        # 일반적인 2인 게임은 gather 없이 바로 전송
+        if len(connections) <= DIRECT_SEND_MAX_CONNECTIONS:
+            failed = []
+            for websocket in connections:
+                try:
+                    await websocket.send_bytes(payload)
+                except Exception:
+                    failed.append(websocket)
+            if failed:
+                room_manager.discard_connections(room_id, failed)
+            return
+
+        # 연결이 많은 경우 배치 단위로 전송하고 사이사이 이벤트 루프에 양보
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            batch = connections[start : start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(websocket.send_bytes(payload) for websocket in batch),
+                return_exceptions=True,
+            )
+            self._discard_failed(room_id, batch, results)
+            if start + BROADCAST_BATCH_SIZE < len(connections):
+                await asyncio.sleep(0)
+
+    def _discard_failed(
+        self, room_id: str, connections: List[WebSocket], results: List[Any]
+    ):
+        """gather 결과에서 전송에 실패한 연결을 브로드캐스트 대상에서 제외."""
+        failed = [
+            ws
+            for ws, result in zip(connections, results)
+            if isinstance(result, Exception)
+        ]
+        if failed:
+            room_manager.discard_connections(room_id, failed)
 
 
 # 전역 핸들러 인스턴스
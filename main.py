@@ -1,9 +1,19 @@
 """Lupin - 월급루팡 게임 사이트의 메인 진입점."""
 
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+from pathlib import Path
+from typing import Optional
+
 import uvicorn
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
-from starlette.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
+from starlette.datastructures import Headers, QueryParams
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
 
 from app.api.health_routes import router as health_router
 from app.api.version_routes import router as version_router
@@ -16,18 +26,92 @@ from app.exceptions.game_exceptions import (
 )
 from app.routes import router
 
+logger = logging.getLogger(__name__)
+
+# 상수 정의
+GZIP_MIN_SIZE = 500  # 이보다 작은 응답은 압축하지 않음
+# 압축 효과가 있는 정적 파일 타입 (이미지 등 이미 압축된 형식은 제외)
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json")
+
+
+class StaticAwareGZipMiddleware(GZipMiddleware):
+    """정적 파일은 CustomStaticFiles가 미리 압축해 두므로 건너뛰는 GZip 미들웨어"""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/static/"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 # FastAPI 앱 생성
 app = FastAPI(title="Lupin - 월급루팡 게임 사이트")
+app.add_middleware(StaticAwareGZipMiddleware, minimum_size=GZIP_MIN_SIZE)
+
+
+def _cache_control(scope) -> str:
+    """콘텐츠 해시(?v=)가 붙은 URL만 영구 캐시, 그 외에는 매번 재검증"""
+    if "v" in QueryParams(scope.get("query_string", b"")):
+        return "public, max-age=31536000, immutable"
+    return "no-cache"
 
 
 class CustomStaticFiles(StaticFiles):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # 정적 파일을 메모리에 미리 적재 (경로 -> (본문, gzip 본문, 미디어 타입, ETag))
+        # 개발 모드(DEBUG=true)에서는 수정 사항이 바로 보이도록 디스크에서 읽는다
+        self._cache: dict[str, tuple[bytes, Optional[bytes], str, str]] = {}
+        if os.getenv("DEBUG", "false").lower() != "true":
+            self._preload()
+
+    def _preload(self) -> None:
+        """정적 디렉터리의 모든 파일을 메모리에 적재"""
+        if self.directory is None:
+            return
+        root = Path(self.directory)
+        for file_path in root.rglob("*"):
+            if not file_path.is_file():
+                continue
+            body = file_path.read_bytes()
+            media_type = (
+                mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+            )
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            gzip_body = None
+            if len(body) >= GZIP_MIN_SIZE and media_type.startswith(COMPRESSIBLE_TYPES):
+                gzip_body = gzip.compress(body, compresslevel=9)
+            self._cache[file_path.relative_to(root).as_posix()] = (
+                body,
+                gzip_body,
+                media_type,
+                etag,
+            )
+
+    async def get_response(self, path: str, scope):
+        cached = self._cache.get(path.replace(os.sep, "/"))
+        if cached is None or scope["method"] not in ("GET", "HEAD"):
+            # 캐시에 없는 파일은 기존 디스크 경로로 처리
+            return await super().get_response(path, scope)
+
+        body, gzip_body, media_type, etag = cached
+        headers = {"ETag": etag, "Cache-Control": _cache_control(scope)}
+        request_headers = Headers(scope=scope)
+        if gzip_body is not None:
+            headers["Vary"] = "Accept-Encoding"
+            if "gzip" in request_headers.get("Accept-Encoding", ""):
+                body = gzip_body
+                headers["Content-Encoding"] = "gzip"
+                # 표현이 다르므로 ETag도 구분
+                headers["ETag"] = f'{etag[:-1]}-gz"'
+        response = Response(body, media_type=media_type, headers=headers)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
 
-    def file_response(self, *args, **kwargs):
-        response = super().file_response(*args, **kwargs)
-        # 정적 파일에 대해 긴 캐시 유효기간 설정 (버전 관리와 함께 사용)
-        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = _cache_control(scope)
         return response
 
 
@@ -56,18 +140,14 @@ async def rate_limit_error_handler(request: Request, exc: RateLimitError):
 @app.exception_handler(ServerError)
 async def server_error_handler(request: Request, exc: ServerError):
     """서버 에러 핸들러"""
-    import logging
-
-    logging.error(f"Server error: {exc.message}", exc_info=True)
+    logger.error("Server error: %s", exc.message, exc_info=True)
     return JSONResponse(status_code=500, content=exc.to_dict())
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """일반 예외 핸들러"""
-    import logging
-
-    logging.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=500,
         content={
@@ -84,6 +164,7 @@ app.include_router(health_router)
 app.include_router(version_router)
 
 if __name__ == "__main__":
+    import importlib.util
     import sys
 
     # 설정 로드
@@ -94,6 +175,28 @@ if __name__ == "__main__":
     port = int(sys.argv[1]) if len(sys.argv) > 1 else server_config.get("port", 8000)
     host = server_config.get("host", "0.0.0.0")
     debug = server_config.get("debug", False)
-
-    print(f"서버 시작: {host}: {port} (debug={debug})")
-    uvicorn.run(app, host=host, port=port, log_level="debug" if debug else "info")
+    loop = server_config.get("loop", "uvloop")
+
+    # uvloop/httptools가 없으면 uvicorn이 조용히 asyncio/h11로 대체하므로 명시적으로 확인
+    required = ["httptools"] + (["uvloop"] if loop == "uvloop" else [])
+    missing = [name for name in required if importlib.util.find_spec(name) is None]
+    if missing:
+        raise SystemExit(
+            f"필수 패키지가 설치되지 않았습니다: {', '.join(missing)} "
+            "(Windows에서는 server.loop를 asyncio로 설정하세요)"
+        )
+
+    print(f"서버 시작: {host}: {port} (debug={debug}, loop={loop})")
+    # 방/연결 상태가 프로세스 메모리에 있으므로 단일 프로세스로 실행한다.
+    # 멀티 워커(Gunicorn 등)는 방 상태를 외부 저장소로 옮긴 뒤에만 가능하다.
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        loop=loop,
+        http="httptools",
+        ws="websockets",
+        ws_per_message_deflate=True,
+        access_log=False,
+        log_level="debug" if debug else "info",
+    )
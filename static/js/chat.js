@@ -111,7 +111,7 @@ class GameChat {
         chatMessages.innerHTML = '';
         if (chatHistory && chatHistory.length > 0) {
             chatHistory.forEach(msg => {
-                this.displayMessage(msg.nickname, msg.message, msg.timestamp, msg.playerNumber);
+                this.displayMessage(msg.nickname, msg.message, msg.timestamp, msg.player_number);
             });
         } else {
             // 채팅 히스토리가 없으면 빈 메시지 표시
@@ -8,12 +8,13 @@ class OmokGameClient {
         this.roomId = roomId;
         this.sessionId = sessionId;
         this.ws = null;
+        this.textDecoder = new TextDecoder();
         this.canvas = document.getElementById('omokBoard');
         this.ctx = this.canvas ? this.canvas.getContext('2d') : null;
 
         // 게임 상태 - 서버에서 전달된 초기 상태 사용
         this.state = {
-            gameState: initialGameState || {
+            gameState: initialGameState ? this.decodeGameState(initialGameState) : {
                 board: Array(15).fill(null).map(() => Array(15).fill(0)),
                 current_player: 1
             },
@@ -168,6 +169,8 @@ class OmokGameClient {
 
         try {
             this.ws = new WebSocket(wsUrl);
+            // 서버는 JSON을 바이너리 프레임으로 전송
+            this.ws.binaryType = 'arraybuffer';
 
             this.ws.onopen = () => {
                 this.updateConnectionStatus('connected');
@@ -659,7 +662,8 @@ class OmokGameClient {
 
     // WebSocket 메시지 처리
     handleWebSocketMessage(event) {
-        const serverData = JSON.parse(event.data);
+        const raw = typeof event.data === 'string' ? event.data : this.textDecoder.decode(event.data);
+        const serverData = JSON.parse(raw);
 
         // 서버의 snake_case 데이터를 그대로 사용 (필요시 개별 변환)
         const data = serverData;
@@ -712,12 +716,29 @@ class OmokGameClient {
         }
     }
 
+    // 서버는 보드를 225자 문자열("0"/"1"/"2", 행 우선)로 전송 - 2차원 배열로 복원
+    decodeGameState(gameState) {
+        if (!gameState || typeof gameState.board !== 'string') {
+            return gameState;
+        }
+        const cells = gameState.board;
+        const board = [];
+        for (let y = 0; y < 15; y++) {
+            const row = new Array(15);
+            for (let x = 0; x < 15; x++) {
+                row[x] = cells.charCodeAt(y * 15 + x) - 48;
+            }
+            board.push(row);
+        }
+        return { ...gameState, board };
+    }
+
     handleRoomUpdate(data) {
         this.state.players = data.room.players;
 
         // 게임 상태 업데이트
         if (data.room.game_state) {
-            this.state.gameState = data.room.game_state;
+            this.state.gameState = this.decodeGameState(data.room.game_state);
         }
 
         // myPlayerNumber 설정 (항상 확인)
@@ -760,7 +781,7 @@ class OmokGameClient {
 
     handleReconnectSuccess(data) {
         if (data.room && data.room.game_state) {
-            this.state.gameState = data.room.game_state;
+            this.state.gameState = this.decodeGameState(data.room.game_state);
         }
         if (data.room && data.room.players) {
             this.state.players = data.room.players;
@@ -780,10 +801,8 @@ class OmokGameClient {
         }
 
         // 채팅 히스토리 복원
-        if (data.room && data.room.chatHistory && typeof displayChatMessage === 'function') {
-            data.room.chatHistory.forEach(msg => {
-                displayChatMessage(msg.nickname, msg.message, msg.timestamp, msg.player_number);
-            });
+        if (data.room && data.room.chat_history && typeof loadChatHistory === 'function') {
+            loadChatHistory(data.room.chat_history);
         }
 
         // 무브 히스토리 복원
@@ -817,7 +836,7 @@ class OmokGameClient {
 
     handleGameUpdate(data) {
         const previousPlayer = this.state.gameState.current_player;
-        this.state.gameState = data.game_state;
+        this.state.gameState = this.decodeGameState(data.game_state);
 
         if (data.last_move) {
             this.state.lastMove = data.last_move;
@@ -848,7 +867,7 @@ class OmokGameClient {
 
     handleGameEnd(data) {
         this.state.gameEnded = true;
-        this.state.gameState = data.game_state;
+        this.state.gameState = this.decodeGameState(data.game_state);
         if (data.lastMove) {
             this.state.lastMove = data.last_move;
         }
@@ -1583,7 +1602,7 @@ class OmokGameClient {
         this.state.winningLine = null;
         this.state.winnerNumber = null;
         this.state.gameStats = { moves: 0, startTime: Date.now() };
-        this.state.gameState = data.game_state;
+        this.state.gameState = this.decodeGameState(data.game_state);
         this.state.moveHistory = []; // 게임 재시작 시 히스토리 초기화
 
         if (data.players) {
@@ -1663,7 +1682,7 @@ class OmokGameClient {
     }
 
     handleUndoAccepted(data) {
-        this.state.gameState = data.game_state;
+        this.state.gameState = this.decodeGameState(data.game_state);
         this.recalculateMoveCount();
         this.state.waitingForUndo = false;
         this.state.lastMove = null;
@@ -1,10 +1,23 @@
 """E2E 테스트 공통 설정"""
 
+import asyncio
+from dataclasses import dataclass
+
+import pytest
 import pytest_asyncio
 from playwright.async_api import Browser, BrowserContext, async_playwright
+from pytest_asyncio import is_async_test
+
 
+def pytest_collection_modifyitems(items):
+    """세션 브라우저를 공유하도록 모든 비동기 테스트를 세션 이벤트 루프에서 실행"""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
-@pytest_asyncio.fixture(scope="function")
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def browser():
     """브라우저 인스턴스 (세션당 하나)"""
     async with async_playwright() as p:
@@ -13,7 +26,7 @@ async def browser():
         await browser.close()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def context(browser: Browser):
     """브라우저 컨텍스트 (테스트마다 새로 생성)"""
     context = await browser.new_context(**CONTEXT_CONFIG)
@@ -21,40 +34,39 @@ async def context(browser: Browser):
     await context.close()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def page(context: BrowserContext):
     """페이지 (테스트마다 새로 생성)"""
     page = await context.new_page()
 
     # 기본적으로 우리 서버로 이동
-    await page.goto(TEST_CONFIG["base_url"])
+    await page.goto(TEST_CONFIG.base_url)
 
     yield page
     await page.close()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def dual_pages(browser: Browser):
     """멀티플레이어 테스트를 위한 2개 페이지"""
-    context1 = await browser.new_context(**CONTEXT_CONFIG)
-    context2 = await browser.new_context(**CONTEXT_CONFIG)
-
-    page1 = await context1.new_page()
-    page2 = await context2.new_page()
+    # 두 플레이어의 컨텍스트/페이지를 동시에 준비
+    context1, context2 = await asyncio.gather(
+        browser.new_context(**CONTEXT_CONFIG), browser.new_context(**CONTEXT_CONFIG)
+    )
+    page1, page2 = await asyncio.gather(context1.new_page(), context2.new_page())
 
     # 두 페이지 모두 홈페이지로 이동
-    await page1.goto(TEST_CONFIG["base_url"])
-    await page2.goto(TEST_CONFIG["base_url"])
+    await asyncio.gather(
+        page1.goto(TEST_CONFIG.base_url), page2.goto(TEST_CONFIG.base_url)
+    )
 
     yield page1, page2
 
-    await page1.close()
-    await page2.close()
-    await context1.close()
-    await context2.close()
+    await asyncio.gather(page1.close(), page2.close())
+    await asyncio.gather(context1.close(), context2.close())
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def single_browser_context(browser: Browser):
     """단일 컨텍스트 테스트용 (test_error_handling 등에서 사용)"""
     context = await browser.new_context(**CONTEXT_CONFIG)
@@ -63,23 +75,29 @@ async def single_browser_context(browser: Browser):
 
 
 # 테스트 설정 (통합된 타임아웃 관리)
-TEST_CONFIG = {
-    "base_url": "http://localhost:8003",
+@dataclass(frozen=True, slots=True)
+class E2EConfig:
+    """E2E 테스트 설정 (타임아웃 단위: ms)"""
+
+    base_url: str = "http://localhost:8003"
     # 기본 타임아웃들
-    "timeout": 30000,  # 30초 (일반적인 최대 대기)
-    "short_timeout": 2000,  # 2초 (짧은 대기)
-    "ui_timeout": 5000,  # 5초 (UI 요소 대기)
-    "network_timeout": 10000,  # 10초 (네트워크 관련)
-    "game_timeout": 60000,  # 60초 (게임 관련)
+    timeout: int = 30000  # 30초 (일반적인 최대 대기)
+    short_timeout: int = 2000  # 2초 (짧은 대기)
+    ui_timeout: int = 5000  # 5초 (UI 요소 대기)
+    network_timeout: int = 10000  # 10초 (네트워크 관련)
+    game_timeout: int = 60000  # 60초 (게임 관련)
     # 세분화된 타임아웃들
-    "element_wait": 2000,  # 요소 표시 대기
-    "network_wait": 5000,  # 네트워크 응답 대기
-    "game_action": 3000,  # 게임 액션 처리 대기
-    "state_sync": 1500,  # 상태 동기화 대기
-    "websocket": 10000,  # WebSocket 연결 대기
-    "page_load": 8000,  # 페이지 로딩 대기
-    "retry_interval": 500,  # 재시도 간격
-}
+    element_wait: int = 2000  # 요소 표시 대기
+    network_wait: int = 5000  # 네트워크 응답 대기
+    game_action: int = 3000  # 게임 액션 처리 대기
+    state_sync: int = 1500  # 상태 동기화 대기
+    websocket: int = 10000  # WebSocket 연결 대기
+    page_load: int = 8000  # 페이지 로딩 대기
+    retry_interval: int = 500  # 재시도 간격
+    retry_initial: int = 50  # 폴링 첫 간격 (이후 두 배씩 늘려 최대 간격까지)
+
+
+TEST_CONFIG = E2EConfig()
 
 # 브라우저 설정
 BROWSER_CONFIG = {
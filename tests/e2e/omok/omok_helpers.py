@@ -3,12 +3,313 @@
 중복 코드 제거 및 재사용성 향상을 위한 모듈
 """
 
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import functools
+import json
+import logging
+import random
+import re
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from playwright.async_api import Locator, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from ...conftest import TEST_CONFIG
 
+logger = logging.getLogger(__name__)
+
+# 자주 쓰는 타임아웃 값 (TEST_CONFIG는 frozen이라 import 시 한 번만 읽어 둠, ms)
+_RETRY_INITIAL = TEST_CONFIG.retry_initial
+_RETRY_INTERVAL = TEST_CONFIG.retry_interval
+_ELEMENT_WAIT = TEST_CONFIG.element_wait
+_UI_TIMEOUT = TEST_CONFIG.ui_timeout
+_NETWORK_TIMEOUT = TEST_CONFIG.network_timeout
+_GAME_ACTION = TEST_CONFIG.game_action
+_STATE_SYNC = TEST_CONFIG.state_sync
+_PAGE_LOAD = TEST_CONFIG.page_load
+
+
+def _poll_delay(attempt: int, max_interval: int) -> float:
+    """폴링 시도 횟수에 따른 대기 시간 (초)
+
+    retry_initial부터 두 배씩 늘려 max_interval에서 멈추고, 여러 페이지가
+    같은 순간에 몰리지 않도록 최대 25%의 지터를 더한다.
+    """
+    delay = min(_RETRY_INITIAL << min(attempt, 16), max_interval)
+    return (delay + random.randint(0, delay // 4)) / 1000
+
+
+def text_pattern(*groups: Sequence[str], ignore_case: bool = False) -> re.Pattern:
+    """여러 텍스트 묶음을 한 번의 검색으로 찾는 정규식 (긴 문자열 우선)"""
+    texts = sorted({text for group in groups for text in group}, key=len, reverse=True)
+    # 빈 목록은 어떤 문자열과도 일치하지 않는 패턴으로 처리
+    source = "|".join(map(re.escape, texts)) if texts else "(?!)"
+    return re.compile(source, re.IGNORECASE if ignore_case else 0)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_text_pattern(texts: Tuple[str, ...]) -> re.Pattern:
+    """같은 텍스트 목록으로 반복 호출될 때 정규식을 다시 만들지 않도록 캐시"""
+    return text_pattern(texts)
+
+
+async def _sleep_before_deadline(delay: float, deadline: float) -> None:
+    """마감 시각(loop.time() 기준)을 넘기지 않도록 대기 시간을 줄여서 sleep"""
+    remaining = deadline - asyncio.get_running_loop().time()
+    await asyncio.sleep(max(0.0, min(delay, remaining)))
+
+
+# 상태 조회 함수를 페이지에 한 번 설치하는 스크립트 (evaluate마다 식을 새로 보내지 않음)
+# snapshot: 게임 상태/연결 상태/내 플레이어 정보, stoneCount: 보드의 돌 개수
+# (게임 상태가 없으면 -1, 연결이 끊겼으면 null),
+# clientReady / clientState / gameState / connectionStatus: 개별 값
+PAGE_HELPERS_SCRIPT = """
+(() => {
+    if (window.__lupinHelpers) return;
+    const client = () => window.omokClient;
+    window.__lupinHelpers = {
+        snapshot() {
+            const c = client();
+            if (!c) return null;
+            const state = c.state;
+            const myPlayer = state.players.find(
+                p => p.player_number === state.myPlayerNumber
+            ) || null;
+            return {
+                gameState: state.gameState,
+                connectionStatus: c.connection.status,
+                myPlayerNumber: state.myPlayerNumber,
+                myPlayer: myPlayer,
+                players: state.players,
+                currentPlayer: state.gameState ? state.gameState.current_player : null,
+                roomStatus: state.roomStatus || '',
+                gameStarted: state.gameStarted || false
+            };
+        },
+        stoneCount() {
+            if (client()?.connection?.status === 'disconnected') return null;
+            const board = client()?.state?.gameState?.board;
+            if (!board) return -1;
+            let count = 0;
+            for (const row of board) {
+                for (const cell of row) {
+                    if (cell) count++;
+                }
+            }
+            return count;
+        },
+        clientReady() {
+            return client() !== undefined;
+        },
+        clientState() {
+            return client()?.state ?? null;
+        },
+        gameState() {
+            return client()?.state?.gameState ?? null;
+        },
+        connectionStatus() {
+            return client()?.connection?.status ?? null;
+        }
+    };
+})()
+"""
+
+# 페이지 HTML에 포함된 문자열만 돌려주는 스크립트 (전체 HTML 전송 없이 검색)
+FIND_IN_HTML_SCRIPT = """
+([items, ignoreCase]) => {
+    let html = document.documentElement.outerHTML;
+    if (ignoreCase) html = html.toLowerCase();
+    return items.filter(item => html.includes(item));
+}
+"""
+
+# 내 플레이어에게 색깔이 배정되었는지 확인하는 식 (wait_for_js용)
+MY_COLOR_ASSIGNED_SCRIPT = """
+(() => {
+    const client = window.omokClient;
+    if (!client) return false;
+    const state = client.state;
+    const me = state.players.find(p => p.player_number === state.myPlayerNumber);
+    return Boolean(me && me.color);
+})()
+"""
+
+# 화면에 보이는 텍스트(innerText)에 포함된 문자열만 돌려주는 스크립트
+FIND_IN_TEXT_SCRIPT = """
+(items) => {
+    const text = document.body.innerText;
+    return items.filter(item => text.includes(item));
+}
+"""
+
+# 요소가 계산된 스타일상 보이는지 확인하는 스크립트 (opacity 0 / display none이면 false)
+ELEMENT_SHOWN_SCRIPT = """
+(el) => {
+    const style = getComputedStyle(el);
+    return style.display !== 'none' && parseFloat(style.opacity) > 0;
+}
+"""
+
+# DOM 변경이 quietMs 동안 없을 때까지 기다리는 스크립트 (최대 timeoutMs)
+# 반환값: 조용해졌으면 true, 시간 초과면 false
+DOM_SETTLE_SCRIPT = """
+([quietMs, timeoutMs]) => new Promise(resolve => {
+    let quietTimer;
+    const finish = (settled) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(limitTimer);
+        resolve(settled);
+    };
+    const restart = () => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    };
+    const observer = new MutationObserver(restart);
+    observer.observe(document.documentElement, {
+        attributes: true, childList: true, subtree: true, characterData: true
+    });
+    const limitTimer = setTimeout(() => finish(false), timeoutMs);
+    restart();
+})
+"""
+
+# 게임 오버레이의 숨김(업무 모드) 여부 식 (오버레이가 없으면 null)
+OVERLAY_HIDDEN_EXPR = (
+    "(document.getElementById('gameOverlay')?.classList.contains('hidden') ?? null)"
+)
+
+# 정규식으로 페이지 HTML을 한 번만 훑어 처음 일치한 문자열을 돌려주는 스크립트
+SEARCH_HTML_SCRIPT = """
+([source, flags]) => {
+    const match = document.documentElement.outerHTML.match(new RegExp(source, flags));
+    return match ? match[0] : null;
+}
+"""
+
+# 다음 턴이 expected가 될 때까지 기다리는 스크립트
+# gameState 대입을 감지하는 setter를 한 번만 설치하고, 대입될 때마다 해제되는
+# 일회성 Promise를 기다린다 (폴링 없이 상태 변경 시에만 다시 확인)
+# 제한 시간은 브라우저 안에서 적용해 시간 초과 후 대기가 페이지에 남지 않도록 함
+# 반환값: true(턴 확인), false(게임 종료로 더 이상 턴이 바뀌지 않음), null(시간 초과)
+TURN_CHANGE_SCRIPT = """
+async ([expected, timeoutMs]) => {
+    const deadline = Date.now() + timeoutMs;
+    const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+    // 클라이언트가 아직 없으면 생성될 때까지 대기
+    while (!window.omokClient) {
+        if (Date.now() >= deadline) return null;
+        await sleep(50);
+    }
+    const client = window.omokClient;
+    const state = client.state;
+    if (!client.__turnWatch) {
+        const watch = {};
+        const arm = () => {
+            watch.next = new Promise(resolve => { watch.resolve = resolve; });
+        };
+        let value = state.gameState;
+        arm();
+        Object.defineProperty(state, 'gameState', {
+            configurable: true,
+            enumerable: true,
+            get: () => value,
+            set: (next) => {
+                value = next;
+                const resolve = watch.resolve;
+                arm();
+                resolve();
+            }
+        });
+        client.__turnWatch = watch;
+    }
+    let timer;
+    const timedOut = new Promise(resolve => {
+        timer = setTimeout(resolve, Math.max(0, deadline - Date.now()));
+    });
+    try {
+        while (state.gameState?.current_player !== expected) {
+            if (state.gameEnded) return false;
+            if (Date.now() >= deadline) return null;
+            await Promise.race([client.__turnWatch.next, timedOut]);
+        }
+        return true;
+    } finally {
+        clearTimeout(timer);
+    }
+}
+"""
+
+# 닉네임 입력과 참여 버튼 클릭을 한 번에 처리하는 스크립트 (입력칸 옆 버튼 클릭)
+FILL_AND_JOIN_SCRIPT = """
+(input, nickname) => {
+    input.value = nickname;
+    input.dispatchEvent(new Event('input', { bubbles: true }));
+    input.parentElement.querySelector('button').click();
+}
+"""
+
+# 연달아 호출되는 상태 조회가 evaluate를 반복하지 않도록 스냅샷을 잠시 재사용 (초)
+SNAPSHOT_TTL = 0.05
+
+# 페이지별 최근 스냅샷 캐시: (조회 시각, 스냅샷)
+_snapshot_cache: "weakref.WeakKeyDictionary[Page, Tuple[float, Dict[str, Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# 페이지별 Locator 캐시 (셀렉터 또는 후보 셀렉터 묶음 -> Locator)
+_locator_cache: (
+    "weakref.WeakKeyDictionary[Page, Dict[Union[str, Tuple[str, ...]], Locator]]"
+) = weakref.WeakKeyDictionary()
+
+
+def _locator(page: Page, selector: str) -> Locator:
+    """페이지의 셀렉터 Locator를 한 번만 만들어 재사용"""
+    locators = _locator_cache.setdefault(page, {})
+    locator = locators.get(selector)
+    if locator is None:
+        locator = locators[selector] = page.locator(selector)
+    return locator
+
+
+# 상태 조회 함수를 설치한 페이지 (add_init_script라 이후 탐색에도 유지됨)
+_helper_pages: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+
+async def _call_page_helper(page: Page, name: str) -> Any:
+    """페이지에 설치한 상태 조회 함수 호출 (처음 호출 시 한 번만 설치)"""
+    if page not in _helper_pages:
+        await page.add_init_script(PAGE_HELPERS_SCRIPT)
+        await page.evaluate(PAGE_HELPERS_SCRIPT)
+        _helper_pages.add(page)
+    return await page.evaluate(f"window.__lupinHelpers.{name}()")
+
+
+# 페이지별 캔버스 위치/크기 캐시 (돌을 놓을 때마다 bounding_box를 조회하지 않도록)
+_canvas_box_cache: "weakref.WeakKeyDictionary[Page, Dict[str, float]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# make_alternating_moves의 preset 위치 (캔버스 크기 대비 비율)
+PRESET_POSITIONS = (
+    (0.5, 0.5),  # 중앙
+    (0.6, 0.6),  # 오프셋 1
+    (0.4, 0.4),  # 오프셋 2
+    (0.7, 0.3),  # 오프셋 3
+    (0.3, 0.7),  # 오프셋 4
+)
+
+
+def _move_position(index: int, position_pattern: str) -> Tuple[float, float]:
+    """index번째 수의 위치 비율 ("preset" 또는 "calculated")"""
+    if position_pattern == "preset":
+        if index < len(PRESET_POSITIONS):
+            return PRESET_POSITIONS[index]
+        return 0.5 + (index % 3) * 0.1, 0.5 + (index % 2) * 0.1
+    return 0.4 + index * 0.1, 0.4 + index * 0.1
+
 
 class OmokSelectors:
     """오목 게임 E2E 테스트용 공통 셀렉터 상수"""
@@ -72,22 +373,29 @@ class OmokSelectors:
     # === 자주 사용하는 텍스트 패턴 ===
     class TextPatterns:
         # 무르기 관련
-        UNDO_REQUEST_TITLES = ["무르기 요청", "무르기를 요청했습니다"]
+        UNDO_REQUEST_TITLES = ("무르기 요청", "무르기를 요청했습니다")
 
         # 재시작 관련
-        RESTART_REQUEST_TITLES = ["게임 재시작 요청", "재시작을 요청했습니다"]
+        RESTART_REQUEST_TITLES = ("게임 재시작 요청", "재시작을 요청했습니다")
 
         # 대기 상태
-        WAITING_INDICATORS = ["상대방을 기다리는 중", "대기중", "기다리는", "대기"]
+        WAITING_INDICATORS = ("상대방을 기다리는 중", "대기중", "기다리는", "대기")
 
         # 게임 관련
-        GAME_ELEMENTS = ["omokBoard", "gameArea", "canvas", "오목", "게임"]
+        GAME_ELEMENTS = ("omokBoard", "gameArea", "canvas", "오목", "게임")
 
         # 연결 상태
-        CONNECTION_INDICATORS = ["연결됨", "온라인", "connected", "정상"]
+        CONNECTION_INDICATORS = ("연결됨", "온라인", "connected", "정상")
+
+        # 위 묶음을 HTML 한 번 검색으로 확인하는 정규식 (check_page_condition용)
+        UNDO_REQUEST_RE = text_pattern(UNDO_REQUEST_TITLES)
+        RESTART_REQUEST_RE = text_pattern(RESTART_REQUEST_TITLES)
+        WAITING_RE = text_pattern(WAITING_INDICATORS)
+        GAME_ELEMENTS_RE = text_pattern(GAME_ELEMENTS)
+        CONNECTION_RE = text_pattern(CONNECTION_INDICATORS)
 
         # Excel 메뉴 항목들
-        EXCEL_MENUS = [
+        EXCEL_MENUS = (
             "파일",
             "홈",
             "삽입",
@@ -96,28 +404,28 @@ class OmokSelectors:
             "데이터",
             "검토",
             "보기",
-        ]
+        )
 
         # Excel 스타일 요소들
-        EXCEL_STYLE_ELEMENTS = [
+        EXCEL_STYLE_ELEMENTS = (
             ".excel-container",
             ".excel-header",
             ".excel-toolbar",
             ".excel-menu",
             "Excel",
-        ]
+        )
 
         # 모바일 최적화 요소들
-        MOBILE_INDICATORS = ["viewport", "responsive", "mobile", "@media"]
+        MOBILE_INDICATORS = ("viewport", "responsive", "mobile", "@media")
 
         # 화려한 게임 요소들 (위장모드에서 피해야 할)
-        FLASHY_ELEMENTS = [
+        FLASHY_ELEMENTS = (
             "text=오목 게임!!!",
             "text=OMOK GAME",
             ".big-title",
             ".game-logo",
             ".flashy",
-        ]
+        )
 
     # === UI 제어 관련 ===
     class UIControls:
@@ -141,30 +449,30 @@ class OmokSelectors:
         OMOK_GAME = ".omok-game"
 
         # 모든 투명도 관련 셀렉터
-        ALL_OPACITY_SELECTORS = [
+        ALL_OPACITY_SELECTORS = (
             OPACITY_SLIDER,
             OPACITY_CONTROL,
             TRANSPARENCY_SLIDER,
             OPACITY_SLIDER_ID,
             OPACITY_DATA_ATTR,
-        ]
+        )
 
         # 모든 숨김 버튼 관련 셀렉터
-        ALL_HIDE_BUTTON_SELECTORS = [
+        ALL_HIDE_BUTTON_SELECTORS = (
             QUICK_HIDE_BUTTON,
             WORK_MODE_BUTTON,
             HIDE_TEXT_BUTTON,
             STEALTH_BUTTON,
             HIDE_BUTTON_ID,
-        ]
+        )
 
         # 모든 게임 영역 관련 셀렉터
-        ALL_GAME_AREA_SELECTORS = [
+        ALL_GAME_AREA_SELECTORS = (
             GAME_OVERLAY,
             GAME_CONTAINER,
             "#gameArea",  # GameUI.GAME_AREA 값을 직접 사용
             OMOK_GAME,
-        ]
+        )
 
 
 class OmokTestData:
@@ -179,7 +487,7 @@ class OmokTestData:
 class OmokGameHelper:
     """오목 게임 E2E 테스트 헬퍼 클래스"""
 
-    BASE_URL = TEST_CONFIG["base_url"]
+    BASE_URL = TEST_CONFIG.base_url
 
     @staticmethod
     async def wait_for_websocket_connection(
@@ -197,45 +505,127 @@ class OmokGameHelper:
             연결 상태 일치 여부
         """
         if timeout is None:
-            timeout = TEST_CONFIG["network_timeout"]
+            timeout = _NETWORK_TIMEOUT
 
-        start_time = page.context.time_ms()
+        # 브라우저 안에서 상태가 바뀔 때까지 대기 (Python 폴링 없음)
+        connected = await OmokGameHelper.wait_for_js(
+            page,
+            "window.omokClient?.connection?.status === "
+            f"{json.dumps(expected_status)}",
+            timeout,
+        )
+        if connected:
+            print(f"SUCCESS: WebSocket 연결 상태 '{expected_status}' 확인")
+        else:
+            print(f"INFO: WebSocket 연결 대기 시간 초과 (예상: {expected_status})")
+        return connected
 
-        while page.context.time_ms() - start_time < timeout:
-            try:
-                status = await OmokGameHelper.get_websocket_status(page)
-                if status == expected_status:
-                    print(f"SUCCESS: WebSocket 연결 상태 '{expected_status}' 확인")
-                    return True
+    @staticmethod
+    async def wait_for_js(page: Page, expression: str, timeout: int = None) -> bool:
+        """
+        JavaScript 조건식이 참이 될 때까지 브라우저 안에서 대기
+
+        Args:
+            page: Playwright Page 객체
+            expression: 확인할 JavaScript 식
+            timeout: 최대 대기 시간 (ms, None이면 기본값 사용)
 
-                await page.wait_for_timeout(TEST_CONFIG["retry_interval"])
+        Returns:
+            제한 시간 안에 조건을 만족했는지 여부
+        """
+        if timeout is None:
+            timeout = _UI_TIMEOUT
+        try:
+            await page.wait_for_function(expression, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
 
-            except Exception as e:
-                print(f"INFO: WebSocket 상태 확인 중 오류 - {e}")
-                await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+    @staticmethod
+    async def get_client_snapshot(page: Page) -> Optional[Dict[str, Any]]:
+        """
+        클라이언트 상태 스냅샷 조회 (게임 상태, 연결 상태, 내 플레이어 정보)
 
-        print(f"INFO: WebSocket 연결 대기 시간 초과 (예상: {expected_status})")
-        return False
+        SNAPSHOT_TTL 안에 다시 조회하면 마지막 스냅샷을 그대로 반환
+
+        Args:
+            page: Playwright Page 객체
+
+        Returns:
+            스냅샷 딕셔너리 또는 None (클라이언트 미초기화)
+        """
+        now = asyncio.get_running_loop().time()
+        cached = _snapshot_cache.get(page)
+        if cached is not None and now - cached[0] < SNAPSHOT_TTL:
+            return cached[1]
+        try:
+            snapshot = await _call_page_helper(page, "snapshot")
+        except Exception as e:
+            print(f"클라이언트 상태 조회 실패: {e}")
+            return None
+        if snapshot is not None:
+            _snapshot_cache[page] = (now, snapshot)
+        return snapshot
+
+    @staticmethod
+    async def get_client_snapshots(*pages: Page) -> List[Optional[Dict[str, Any]]]:
+        """여러 페이지의 클라이언트 스냅샷을 동시에 조회 (페이지당 evaluate 1회)"""
+        return list(
+            await asyncio.gather(
+                *(OmokGameHelper.get_client_snapshot(page) for page in pages)
+            )
+        )
+
+    @staticmethod
+    def invalidate_snapshot(page: Page) -> None:
+        """캐시된 스냅샷 폐기 (착수 등 상태를 바꾸는 동작 직후 호출)"""
+        _snapshot_cache.pop(page, None)
 
     @staticmethod
-    async def get_websocket_status(page: Page) -> Optional[str]:
+    async def wait_on_pages(timeout: float, *pages: Page) -> None:
+        """여러 페이지에서 동시에 대기 (순차 대기로 시간이 배로 늘지 않도록)"""
+        await asyncio.gather(*(page.wait_for_timeout(timeout) for page in pages))
+
+    @staticmethod
+    async def get_websocket_status(
+        page: Page, snapshot: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
         """
         WebSocket 연결 상태 확인
 
         Args:
             page: Playwright Page 객체
+            snapshot: 이미 조회한 스냅샷 (있으면 재조회하지 않음)
 
         Returns:
             연결 상태 문자열 또는 None
         """
+        if snapshot is not None:
+            return snapshot["connectionStatus"]
         try:
-            status = await page.evaluate(
-                "window.omokClient ? " "window.omokClient.connection.status : null"
-            )
-            return status
+            return await _call_page_helper(page, "connectionStatus")
         except Exception:
             return None
 
+    @staticmethod
+    async def wait_for_dom_settle(
+        page: Page, quiet_ms: int = 150, timeout: int = None
+    ) -> bool:
+        """
+        DOM 변경이 quiet_ms 동안 없을 때까지 대기
+
+        Args:
+            page: Playwright Page 객체
+            quiet_ms: 변경이 없어야 하는 시간 (ms)
+            timeout: 최대 대기 시간 (ms, None이면 element_wait)
+
+        Returns:
+            제한 시간 안에 DOM이 안정되었는지 여부
+        """
+        if timeout is None:
+            timeout = _ELEMENT_WAIT
+        return await page.evaluate(DOM_SETTLE_SCRIPT, [quiet_ms, timeout])
+
     @staticmethod
     async def wait_for_condition(
         condition_func: Callable, timeout: int = None, interval: int = None
@@ -243,23 +633,26 @@ class OmokGameHelper:
         """
         조건이 만족될 때까지 대기
 
+        Python에서 주기적으로 확인하므로, 조건이 JavaScript 식이면 wait_for_js 사용
+
         Args:
             condition_func: 확인할 조건 함수 (async callable)
             timeout: 최대 대기 시간 (None이면 기본값 사용)
-            interval: 확인 간격 (ms)
+            interval: 최대 확인 간격 (ms, 처음에는 더 짧은 간격으로 확인)
 
         Returns:
             조건 만족 여부
         """
         if timeout is None:
-            timeout = TEST_CONFIG["ui_timeout"]
+            timeout = _UI_TIMEOUT
         if interval is None:
-            interval = TEST_CONFIG["retry_interval"]
+            interval = _RETRY_INTERVAL
 
-        # start_time = 0  # Playwright에서는 page.context.time_ms() 사용해야 하므로 단순화
-        elapsed = 0
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout / 1000
+        attempt = 0
 
-        while elapsed < timeout:
+        while loop.time() < deadline:
             try:
                 result = await condition_func()
                 if result:
@@ -267,11 +660,8 @@ class OmokGameHelper:
             except Exception as e:
                 print(f"INFO: 조건 확인 중 오류 - {e}")
 
-            # 대기 시간만큼 sleep
-            import asyncio
-
-            await asyncio.sleep(interval / 1000)  # ms를 초로 변환
-            elapsed += interval
+            await _sleep_before_deadline(_poll_delay(attempt, interval), deadline)
+            attempt += 1
 
         return False
 
@@ -284,6 +674,22 @@ class OmokGameHelper:
             page: Playwright Page 객체
             nickname: 플레이어 닉네임
 
+        Returns:
+            room_url: 생성된 방의 URL
+        """
+        room_url = await OmokGameHelper.create_room(page, nickname)
+        await OmokGameHelper.enter_created_room(page, nickname)
+        return room_url
+
+    @staticmethod
+    async def create_room(page: Page, nickname: str = "Player1") -> str:
+        """
+        메인 페이지에서 방 생성 후 방 페이지로 이동 (게임 참여 전까지)
+
+        Args:
+            page: Playwright Page 객체
+            nickname: 방장 닉네임
+
         Returns:
             room_url: 생성된 방의 URL
         """
@@ -295,61 +701,58 @@ class OmokGameHelper:
         assert "Excel" in page_title, f"Excel 위장 실패: {page_title}"
 
         # 2. 오목 게임 선택
-        omok_card = page.locator(".game-card:has-text('오목')")
-        await omok_card.click()
+        await page.locator(OmokSelectors.MainPage.OMOK_CARD).click()
         # 다음 단계 UI(방 만들기 버튼)가 나타날 때까지 대기
-        await page.locator(".game-card:has-text('방 만들기')").wait_for(
-            state="visible", timeout=TEST_CONFIG["ui_timeout"]
-        )
+        create_room_btn = page.locator(OmokSelectors.MainPage.CREATE_ROOM_CARD).first
+        await create_room_btn.wait_for(state="visible", timeout=_UI_TIMEOUT)
 
-        # 3. 방 만들기
-        create_room_btn = page.locator(".game-card:has-text('방 만들기')")
+        # 3. 방 만들기 (대기에 사용한 locator 재사용)
         await create_room_btn.click()
         # 닉네임 입력 필드가 나타날 때까지 대기
 
         # 4. 방 생성 완료 화면에서 닉네임 입력
-        host_nickname_input = page.locator("#hostNickname")
-        await host_nickname_input.wait_for(
-            state="visible", timeout=TEST_CONFIG["ui_timeout"]
-        )
+        host_nickname_input = page.locator(OmokSelectors.MainPage.HOST_NICKNAME_INPUT)
+        await host_nickname_input.wait_for(state="visible", timeout=_UI_TIMEOUT)
         await host_nickname_input.fill(nickname)
 
         # 5. 게임 입장 (실제 게임 방으로 이동)
-        join_game_btn = page.locator("button:has-text('게임 입장')")
-        await join_game_btn.click()
+        await page.locator(OmokSelectors.Buttons.JOIN_ROOM).click()
 
         # URL 변경 대기
-        await page.wait_for_url("**/omok/**", timeout=TEST_CONFIG["ui_timeout"])
+        await page.wait_for_url("**/omok/**", timeout=_UI_TIMEOUT)
         room_url = page.url
         assert "/omok/" in room_url, f"방 URL 형식 오류: {room_url}"
+        return room_url
 
+    @staticmethod
+    async def enter_created_room(page: Page, nickname: str = "Player1") -> None:
+        """
+        생성한 방 페이지에서 게임 참여
+
+        Args:
+            page: 방 페이지로 이동한 Playwright Page 객체
+            nickname: 플레이어 닉네임
+        """
         # 6. 오목 게임 페이지에서 실제 게임 참여
-        await page.wait_for_load_state(
-            "networkidle", timeout=TEST_CONFIG["network_timeout"]
-        )
+        await page.wait_for_load_state("networkidle", timeout=_NETWORK_TIMEOUT)
 
         # 닉네임 입력 (오목 페이지에서 다시 한 번)
-        nickname_input = page.locator("#nicknameInput")
-        await nickname_input.wait_for(
-            state="visible", timeout=TEST_CONFIG["ui_timeout"]
-        )
-        await nickname_input.fill(nickname)
+        nickname_input = _locator(page, OmokSelectors.GameUI.NICKNAME_INPUT)
+        await nickname_input.wait_for(state="visible", timeout=_UI_TIMEOUT)
 
-        # 게임 참여 버튼 클릭
-        join_game_final_btn = page.locator("button:has-text('게임 참여')")
-        await join_game_final_btn.click()
+        # 닉네임 입력 후 게임 참여 버튼 클릭 (evaluate 왕복 1회)
+        await nickname_input.evaluate(FILL_AND_JOIN_SCRIPT, nickname)
 
         # 게임 보드 표시 대기
-        await page.locator("#omokBoard").wait_for(
-            state="visible", timeout=TEST_CONFIG["ui_timeout"]
+        await _locator(page, OmokSelectors.GameUI.BOARD).wait_for(
+            state="visible", timeout=_UI_TIMEOUT
         )
 
-        print(f"SUCCESS: {nickname}이 방 생성 및 입장 완료 - {room_url}")
-        return room_url
+        print(f"SUCCESS: {nickname}이 방 생성 및 입장 완료 - {page.url}")
 
     @staticmethod
     async def join_existing_room(
-        page: Page, room_url: str, nickname: str = "Player2"
+        page: Page, room_url: str, nickname: str = "Player2", navigate: bool = True
     ) -> None:
         """
         기존 방에 입장
@@ -358,11 +761,11 @@ class OmokGameHelper:
             page: Playwright Page 객체
             room_url: 입장할 방의 URL
             nickname: 플레이어 닉네임
+            navigate: False면 이미 방 페이지가 열려 있다고 보고 이동을 생략
         """
         # 1. 방 URL 접속
-        await page.goto(room_url)
-        # 페이지 로드 완료 대기
-        await page.wait_for_load_state("networkidle", timeout=TEST_CONFIG["page_load"])
+        if navigate:
+            await OmokGameHelper.open_room_page(page, room_url)
 
         # 2. 닉네임 입력
         nickname_input = await OmokGameHelper.find_input_field(
@@ -401,23 +804,27 @@ class OmokGameHelper:
         # 게임 참여 성공 확인 - 게임 보드나 플레이어 리스트 확인
         try:
             # 게임 보드가 나타나는지 확인
-            await page.locator("#omokBoard").wait_for(
-                state="visible", timeout=TEST_CONFIG["game_action"]
+            await _locator(page, OmokSelectors.GameUI.BOARD).wait_for(
+                state="visible", timeout=_GAME_ACTION
             )
-        except Exception:
+        except PlaywrightTimeoutError:
             try:
                 # 또는 플레이어 리스트에 자신이 추가되었는지 확인
-                await page.locator("#playerList").wait_for(
-                    state="visible", timeout=TEST_CONFIG["element_wait"]
+                await _locator(page, OmokSelectors.GameUI.PLAYER_LIST).wait_for(
+                    state="visible", timeout=_ELEMENT_WAIT
                 )
-            except Exception:
+            except PlaywrightTimeoutError:
                 # 최소한 페이지 로드는 완료되어야 함
-                await page.wait_for_load_state(
-                    "networkidle", timeout=TEST_CONFIG["element_wait"]
-                )
+                await page.wait_for_load_state("networkidle", timeout=_ELEMENT_WAIT)
 
         print(f"SUCCESS: {nickname} 방 입장 완료")
 
+    @staticmethod
+    async def open_room_page(page: Page, room_url: str) -> None:
+        """방 URL로 이동 후 페이지 로드 완료 대기"""
+        await page.goto(room_url)
+        await page.wait_for_load_state("networkidle", timeout=_PAGE_LOAD)
+
     @staticmethod
     async def wait_for_game_start(
         page1: Page, page2: Page, timeout: int = None
@@ -428,88 +835,57 @@ class OmokGameHelper:
         Args:
             page1: Player1 페이지
             page2: Player2 페이지
-            timeout: 대기 시간 (ms)
+            timeout: 게임 시작 상태 확인 대기 시간 (ms, None이면 약 20초)
         """
         if timeout is None:
-            timeout = TEST_CONFIG["ui_timeout"]
+            timeout = _UI_TIMEOUT * 4
+
         # 게임 시작 버튼 찾기 및 클릭
         for page in [page1, page2]:
             try:
                 start_button = page.locator("button:has-text('게임 시작')")
-                if await start_button.is_visible(timeout=TEST_CONFIG["element_wait"]):
+                if await start_button.is_visible(timeout=_ELEMENT_WAIT):
                     await start_button.click()
                     # start_button_clicked = True
                     print("SUCCESS: 게임 시작 버튼 클릭")
                     break
-            except Exception:
+            except PlaywrightTimeoutError:
                 pass
 
-        # 게임 시작 대기 - 네트워크 안정화
-        await page1.wait_for_load_state(
-            "networkidle", timeout=TEST_CONFIG["game_action"]
+        # 게임 시작 대기 - 네트워크 안정화 (두 페이지 동시)
+        await asyncio.gather(
+            page1.wait_for_load_state("networkidle", timeout=_GAME_ACTION),
+            page2.wait_for_load_state("networkidle", timeout=_GAME_ACTION),
         )
-        await page2.wait_for_load_state(
-            "networkidle", timeout=TEST_CONFIG["game_action"]
-        )
-
-        # 게임 상태 확인 - 더 효율적인 폴링 간격
-        max_attempts = 15  # 총 15회 시도 (약 12초)
-        for attempt in range(max_attempts):
-            # 게임 상태 확인
-            game_state1 = await OmokGameHelper.get_game_state(page1)
-            game_state2 = await OmokGameHelper.get_game_state(page2)
-
-            # room 상태 확인 (JavaScript에서 직접 가져오기)
-            room_status1 = await page1.evaluate(
-                """
-                window.omokClient && window.omokClient.state &&
-                window.omokClient.state.roomStatus || ''
-            """
-            )
-            room_status2 = await page2.evaluate(
-                """
-                window.omokClient && window.omokClient.state &&
-                window.omokClient.state.roomStatus || ''
-            """
-            )
 
-            # 플레이어 수 확인
-            player_count1 = await page1.evaluate(
-                """
-                window.omokClient && window.omokClient.state &&
-                window.omokClient.state.players
-                ? window.omokClient.state.players.length : 0
-            """
+        # 게임 상태 확인 - timeout까지 점점 긴 간격으로 폴링
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout / 1000
+        attempt = 0
+        while loop.time() < deadline:
+            # 두 페이지의 클라이언트 상태를 한 번에 조회
+            snapshots = await asyncio.gather(
+                OmokGameHelper.get_client_snapshot(page1),
+                OmokGameHelper.get_client_snapshot(page2),
             )
-            player_count2 = await page2.evaluate(
-                """
-                window.omokClient && window.omokClient.state &&
-                window.omokClient.state.players
-                ? window.omokClient.state.players.length : 0
-            """
-            )
-
-            # 게임 시작 상태 확인
-            game_started1 = await page1.evaluate(
-                """
-                window.omokClient && window.omokClient.state &&
-                window.omokClient.state.gameStarted || false
-            """
-            )
-            game_started2 = await page2.evaluate(
-                """
-                window.omokClient && window.omokClient.state &&
-                window.omokClient.state.gameStarted || false
-            """
-            )
-
-            print(
-                f"DEBUG: room_status1={room_status1}, "
-                f"room_status2={room_status2}, "
-                f"player_count1={player_count1}, "
-                f"player_count2={player_count2}, "
-                f"game_started1={game_started1}, "
-                f"game_started2={game_started2}"
+            snapshot1, snapshot2 = (snapshot or {} for snapshot in snapshots)
+
+            room_status1 = snapshot1.get("roomStatus", "")
+            room_status2 = snapshot2.get("roomStatus", "")
+            player_count1 = len(snapshot1.get("players") or [])
+            player_count2 = len(snapshot2.get("players") or [])
+            game_started1 = snapshot1.get("gameStarted", False)
+            game_started2 = snapshot2.get("gameStarted", False)
+
+            logger.debug(
+                "room_status1=%s, room_status2=%s, player_count1=%s, "
+                "player_count2=%s, game_started1=%s, game_started2=%s",
+                room_status1,
+                room_status2,
+                player_count1,
+                player_count2,
+                game_started1,
+                game_started2,
             )
 
             # 게임이 시작된 상태인지 확인
@@ -520,61 +896,38 @@ class OmokGameHelper:
                 or game_started1
                 or game_started2
             ):
-                print(f"SUCCESS: 게임 시작 확인 " f"(시도 {attempt+1}/{max_attempts})")
+                print(f"SUCCESS: 게임 시작 확인 (시도 {attempt+1})")
                 # 게임 시작 후 UI 안정화를 위한 최소 대기
-                await page1.wait_for_load_state(
-                    "networkidle", timeout=TEST_CONFIG["state_sync"]
-                )
-                await page2.wait_for_load_state(
-                    "networkidle", timeout=TEST_CONFIG["state_sync"]
+                await asyncio.gather(
+                    page1.wait_for_load_state("networkidle", timeout=_STATE_SYNC),
+                    page2.wait_for_load_state("networkidle", timeout=_STATE_SYNC),
                 )
                 return
 
-            # 점진적 대기 간격 (초기에는 짧게, 나중에는 길게)
-            wait_interval = (
-                TEST_CONFIG["retry_interval"]
-                if attempt < 5
-                else TEST_CONFIG["element_wait"]
-            )
-            await page1.wait_for_timeout(wait_interval)
-            await page2.wait_for_timeout(wait_interval)
-
-        # 멀티플레이어 게임 시작 확인
-        found_game_start = (
-            await OmokGameHelper.check_page_condition(
-                page1,
-                ["Player1", "Player2"],
-                "content",
-                "Player1 화면에 두 플레이어 표시",
-            )
-            or await OmokGameHelper.check_page_condition(
-                page2,
-                ["Player1", "Player2"],
-                "content",
-                "Player2 화면에 두 플레이어 표시",
-            )
-            or await OmokGameHelper.check_page_condition(
-                page1, ["게임 시작"], "content", "게임 시작 메시지"
-            )
-            or await OmokGameHelper.check_page_condition(
-                page2, ["게임 시작"], "content", "게임 시작 메시지"
-            )
-            or await OmokGameHelper.check_page_condition(
-                page1, ["canvas"], "content", "게임 보드 표시 (page1)"
-            )
-            and await OmokGameHelper.check_page_condition(
-                page2, ["canvas"], "content", "게임 보드 표시 (page2)"
-            )
+            # 점진적 대기 간격 (처음에는 짧게, 이후 두 배씩 늘려 element_wait까지)
+            await _sleep_before_deadline(_poll_delay(attempt, _ELEMENT_WAIT), deadline)
+            attempt += 1
+
+        # 멀티플레이어 게임 시작 확인 (화면 텍스트와 캔버스 개수만 조회, 두 페이지 동시)
+        game_start_texts = ["Player1", "Player2", "게임 시작"]
+        texts1, texts2, canvases1, canvases2 = await asyncio.gather(
+            OmokGameHelper.find_in_page_text(page1, game_start_texts),
+            OmokGameHelper.find_in_page_text(page2, game_start_texts),
+            _locator(page1, "canvas").count(),
+            _locator(page2, "canvas").count(),
         )
+        found1 = set(texts1) | ({"canvas"} if canvases1 else set())
+        found2 = set(texts2) | ({"canvas"} if canvases2 else set())
+        found_game_start = bool(texts1 or texts2) or (canvases1 > 0 and canvases2 > 0)
+        if found_game_start:
+            print(f"SUCCESS: 게임 화면 확인 - page1={found1}, page2={found2}")
 
         # JavaScript 게임 상태로도 확인
         if not found_game_start:
             try:
-                game_state1 = await page1.evaluate(
-                    "window.omokClient ? " "window.omokClient.state.gameState : null"
-                )
-                game_state2 = await page2.evaluate(
-                    "window.omokClient ? " "window.omokClient.state.gameState : null"
+                game_state1, game_state2 = await asyncio.gather(
+                    OmokGameHelper.get_game_state(page1),
+                    OmokGameHelper.get_game_state(page2),
                 )
 
                 if game_state1 or game_state2:
@@ -587,51 +940,67 @@ class OmokGameHelper:
         print("SUCCESS: 게임 시작 완료")
 
     @staticmethod
-    async def get_game_state(page: Page) -> Optional[Dict[str, Any]]:
+    async def get_game_state(
+        page: Page, snapshot: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         JavaScript를 통한 게임 상태 조회
 
         Args:
             page: Playwright Page 객체
+            snapshot: 이미 조회한 스냅샷 (있으면 재조회하지 않음)
 
         Returns:
             게임 상태 딕셔너리 또는 None
         """
+        if snapshot is not None:
+            return snapshot["gameState"]
         try:
-            game_state = await page.evaluate(
-                "window.omokClient ? " "window.omokClient.state.gameState : null"
-            )
-            return game_state
+            return await _call_page_helper(page, "gameState")
         except Exception as e:
             print(f"게임 상태 조회 실패: {e}")
             return None
 
+    @staticmethod
+    async def get_client_state(page: Page) -> Optional[Dict[str, Any]]:
+        """클라이언트 state 전체 조회 (닉네임, 세션 ID 등, 클라이언트가 없으면 None)"""
+        try:
+            return await _call_page_helper(page, "clientState")
+        except Exception as e:
+            print(f"클라이언트 state 조회 실패: {e}")
+            return None
+
+    @staticmethod
+    async def is_client_ready(page: Page) -> bool:
+        """window.omokClient 초기화 여부"""
+        return await _call_page_helper(page, "clientReady")
+
     @staticmethod
     async def get_stone_count(page: Page, max_retries: int = 3) -> int:
         """현재 보드의 돌 개수 확인 (재시도 로직 포함)"""
         for retry in range(max_retries):
             try:
-                game_state = await OmokGameHelper.get_game_state(page)
-                if game_state and "board" in game_state:
-                    board = game_state["board"]
-                    # 보드에서 놓인 돌의 개수 세기 (0이 아닌 셀 카운트)
-                    stone_count = sum(
-                        sum(1 for cell in row if cell != 0) for row in board
-                    )
+                # 보드 전체를 전송하지 않고 브라우저에서 센 돌 개수만 받음
+                stone_count = await _call_page_helper(page, "stoneCount")
+                if stone_count is None:
+                    # 연결이 끊긴 페이지는 기다려도 상태가 오지 않으므로 바로 포기
+                    print("INFO: WebSocket 연결 끊김, 돌 개수 확인 생략")
+                    return 0
+                if stone_count >= 0:
                     return stone_count
                 elif retry < max_retries - 1:
                     print(
                         f"INFO: 게임 상태 없음, 재시도 중... "
                         f"({retry+1}/{max_retries})"
                     )
-                    await page.wait_for_timeout(TEST_CONFIG["retry_interval"])
+                    await page.wait_for_timeout(_RETRY_INTERVAL)
             except Exception as e:
                 if retry < max_retries - 1:
                     print(
                         f"INFO: 돌 개수 확인 실패, 재시도 중... "
                         f"({retry+1}/{max_retries}) - {e}"
                     )
-                    await page.wait_for_timeout(TEST_CONFIG["retry_interval"])
+                    await page.wait_for_timeout(_RETRY_INTERVAL)
                 else:
                     print(f"INFO: 돌 개수 확인 최종 실패 - {e}")
         return 0
@@ -643,68 +1012,47 @@ class OmokGameHelper:
         expected_player: int,
         timeout: int = None,
         assert_on_failure: bool = False,
-        max_retries: int = 5,
     ) -> bool:
         """
-        턴 변경 검증 (실제 게임 상태 확인) - 재시도 로직 포함
+        턴 변경 검증 (실제 게임 상태 확인)
+
+        page1의 게임 상태가 expected_player 턴이 될 때까지 최대 timeout 동안
+        한 번 대기하고, 확인되지 않으면 페이지 텍스트로 한 번 더 확인
 
         Args:
             page1: Player1 페이지
             page2: Player2 페이지
             expected_player: 예상되는 현재 플레이어 (1 or 2)
-            timeout: 각 재시도 간 대기 시간
+            timeout: 턴 변경을 기다리는 전체 시간 (ms, None이면 약 20초)
             assert_on_failure: True면 실패시 assert 발생, False면 bool 반환
-            max_retries: 최대 재시도 횟수
 
         Returns:
             턴 변경 성공 여부 (assert_on_failure=False인 경우에만)
         """
         if timeout is None:
-            timeout = TEST_CONFIG["game_action"]
-        found_turn = False
+            timeout = _UI_TIMEOUT * 4
 
-        for retry in range(max_retries):
-            # 재시도마다 점진적으로 더 오래 대기 - 50% 축소
-            wait_time = min(
-                timeout + (retry * TEST_CONFIG["retry_interval"]),
-                TEST_CONFIG["ui_timeout"],
-            )  # 최대 UI timeout까지
-            await page1.wait_for_timeout(wait_time)
-            await page2.wait_for_timeout(wait_time)
-
-            # JavaScript 게임 상태로 정확하게 확인
-            try:
-                game_state = await OmokGameHelper.get_game_state(page1)
-                if game_state and "current_player" in game_state:
-                    current_player = game_state["current_player"]
-                    found_turn = current_player == expected_player
-                    if found_turn:
-                        print(
-                            f"SUCCESS: 게임 상태에서 턴 확인됨 - "
-                            f"Player{current_player} "
-                            f"(재시도 {retry+1}/{max_retries})"
-                        )
-                        break
-                    else:
-                        print(
-                            f"INFO: 턴 대기 중 - "
-                            f"예상 Player{expected_player}, "
-                            f"실제 Player{current_player} "
-                            f"(재시도 {retry+1}/{max_retries})"
-                        )
-                else:
-                    print(
-                        f"INFO: 게임 상태를 가져올 수 없음 "
-                        f"(재시도 {retry+1}/{max_retries})"
-                    )
-            except Exception as e:
-                print(
-                    f"INFO: 게임 상태 확인 실패 "
-                    f"(재시도 {retry+1}/{max_retries}) - {e}"
-                )
+        # 브라우저 안에서 상태 변경 알림을 기다림 (evaluate 왕복 1회, 제한 시간도 브라우저에서 적용)
+        result = await page1.evaluate(TURN_CHANGE_SCRIPT, [expected_player, timeout])
+
+        found_turn = result is True
+        game_over = result is False
+        if found_turn:
+            print(f"SUCCESS: 게임 상태에서 턴 확인됨 - Player{expected_player}")
+        else:
+            game_state = await OmokGameHelper.get_game_state(page1)
+            current_player = game_state.get("current_player") if game_state else None
+            reason = (
+                "게임 종료로 턴 변경 불가" if game_over else "턴 변경 대기 시간 초과"
+            )
+            print(
+                f"INFO: {reason} - "
+                f"예상 Player{expected_player}, 실제 Player{current_player}"
+            )
 
         # HTML 텍스트는 보조 확인용으로만 사용 (게임 상태 확인이 모두 실패한 경우에만)
-        if not found_turn:
+        # 게임이 이미 끝났다면 턴이 바뀔 수 없으므로 추가 확인 없이 실패 처리
+        if not found_turn and not game_over:
             print("INFO: JavaScript 상태 확인 실패, HTML 텍스트로 최종 확인 시도")
 
             if expected_player == 1:
@@ -727,7 +1075,7 @@ class OmokGameHelper:
         if assert_on_failure:
             assert found_turn, (
                 f"Player{expected_player} 턴으로 변경되지 않았음 "
-                f"(재시도 {max_retries}회 모두 실패)"
+                f"({timeout}ms 대기 후 실패)"
             )
 
         return found_turn
@@ -751,11 +1099,20 @@ class OmokGameHelper:
         Returns:
             room_url: 게임 방 URL
         """
-        # Player1 방 생성 및 입장
-        room_url = await OmokGameHelper.create_room_and_join(page1, player1_name)
+        # Player1 방 생성
+        room_url = await OmokGameHelper.create_room(page1, player1_name)
+
+        # Player1 참여와 Player2 방 페이지 로딩을 동시에 진행
+        # (플레이어 번호가 바뀌지 않도록 Player2 참여는 Player1 참여 후에 실행)
+        await asyncio.gather(
+            OmokGameHelper.enter_created_room(page1, player1_name),
+            OmokGameHelper.open_room_page(page2, room_url),
+        )
 
         # Player2 입장
-        await OmokGameHelper.join_existing_room(page2, room_url, player2_name)
+        await OmokGameHelper.join_existing_room(
+            page2, room_url, player2_name, navigate=False
+        )
 
         # 게임 시작 대기
         await OmokGameHelper.wait_for_game_start(page1, page2)
@@ -763,19 +1120,35 @@ class OmokGameHelper:
         print(f"SUCCESS: 두 플레이어 게임 설정 완료 - {room_url}")
         return room_url
 
+    @staticmethod
+    async def prime_board_geometry(page: Page) -> Dict[str, float]:
+        """Canvas 위치/크기를 조회해 캐시 (레이아웃이 바뀌면 다시 호출)"""
+        canvas_box = await _locator(page, OmokSelectors.GameUI.BOARD).bounding_box()
+        assert canvas_box is not None, "Canvas bounding box를 가져올 수 없음"
+        _canvas_box_cache[page] = canvas_box
+        # 새로고침/이동 후에는 레이아웃이 달라질 수 있으므로 다음 로드 시 캐시 폐기
+        page.once("load", lambda _: OmokGameHelper.invalidate_canvas_cache(page))
+        return canvas_box
+
+    @staticmethod
+    def invalidate_canvas_cache(page: Page) -> None:
+        """캐시된 Canvas 위치/크기 폐기 (뷰포트 크기 변경 등 레이아웃 변경 시)"""
+        _canvas_box_cache.pop(page, None)
+
     @staticmethod
     async def click_canvas_position(
         page: Page, x_ratio: float, y_ratio: float
     ) -> Tuple[float, float]:
         """Canvas의 특정 비율 위치 클릭"""
-        canvas = page.locator("#omokBoard")
-        canvas_box = await canvas.bounding_box()
-        assert canvas_box is not None, "Canvas bounding box를 가져올 수 없음"
+        canvas_box = _canvas_box_cache.get(page)
+        if canvas_box is None:
+            canvas_box = await OmokGameHelper.prime_board_geometry(page)
 
         x = canvas_box["x"] + canvas_box["width"] * x_ratio
         y = canvas_box["y"] + canvas_box["height"] * y_ratio
 
         await page.mouse.click(x, y)
+        OmokGameHelper.invalidate_snapshot(page)
         return x, y
 
     @staticmethod
@@ -805,7 +1178,7 @@ class OmokGameHelper:
             except Exception as e:
                 if attempt < retry_count - 1:
                     print(f"WARNING: 시도 {attempt+1} 실패, 재시도 중... - {e}")
-                    await page.wait_for_timeout(TEST_CONFIG["state_sync"])
+                    await page.wait_for_timeout(_STATE_SYNC)
                 else:
                     raise
 
@@ -814,25 +1187,23 @@ class OmokGameHelper:
         """게임 상태 및 연결 상태 검증"""
         print(f"INFO: Player{player_num} 게임 상태 안정화 대기 중...")
         # 네트워크 안정화 확인
-        await page.wait_for_load_state("networkidle", timeout=TEST_CONFIG["state_sync"])
+        await page.wait_for_load_state("networkidle", timeout=_STATE_SYNC)
 
         game_state = None
         connection_status = None
 
         for i in range(8):  # 최대 8회 재시도
-            game_state = await page.evaluate(
-                "window.omokClient ? " "window.omokClient.state.gameState : null"
-            )
-            connection_status = await page.evaluate(
-                "window.omokClient ? " "window.omokClient.connection.status : null"
-            )
+            snapshot = await OmokGameHelper.get_client_snapshot(page)
+            if snapshot:
+                game_state = snapshot["gameState"]
+                connection_status = snapshot["connectionStatus"]
 
             if game_state and connection_status == "connected":
                 break
 
             if i < 7:  # 마지막이 아니면 잠시 대기
                 print(f"INFO: 게임 상태 재확인 중... ({i+1}/8)")
-                await page.wait_for_timeout(TEST_CONFIG["retry_interval"] * 1.5)
+                await page.wait_for_timeout(_RETRY_INTERVAL * 1.5)
 
         if not game_state:
             raise AssertionError(f"Player{player_num}: 게임 상태를 확인할 수 없습니다")
@@ -842,57 +1213,23 @@ class OmokGameHelper:
                 f"WARNING: Player{player_num} "
                 f"WebSocket 연결 상태: {connection_status}"
             )
-            await page.wait_for_timeout(TEST_CONFIG["state_sync"])
+            await page.wait_for_timeout(_STATE_SYNC)
 
     @staticmethod
     async def _wait_for_player_turn(page: Page, player_num: int) -> None:
         """플레이어 턴 대기 및 색깔 확인"""
-        # 플레이어 정보 확인 (색깔 배정까지 대기)
-        debug_info = None
-        for color_check in range(5):  # 색깔 배정 대기 루프
-            debug_info = await page.evaluate(
-                """
-                (() => {
-                    if (!window.omokClient) return { error: 'omokClient not found' };
-
-                    const client = window.omokClient;
-                    const myPlayer = client.state.players.find(
-                        p => p.player_number === client.state.myPlayerNumber
-                    );
-
-                    return {
-                        myPlayerNumber: client.state.myPlayerNumber,
-                        myPlayer: myPlayer,
-                        players: client.state.players,
-                        currentPlayer: client.state.gameState ?
-                            client.state.gameState.current_player : null
-                    };
-                })()
-            """
-            )
-
-            if debug_info.get("error"):
-                if color_check < 4:
-                    print(f"INFO: 클라이언트 초기화 대기 중... " f"({color_check+1}/5)")
-                    await page.wait_for_timeout(TEST_CONFIG["retry_interval"] * 1.5)
-                    continue
-                else:
-                    raise AssertionError(
-                        f"클라이언트 상태 확인 실패: {debug_info['error']}"
-                    )
-
-            my_player = debug_info.get("myPlayer")
-            if my_player and my_player.get("color"):
-                break  # 색깔이 배정되면 루프 탈출
-
-            if color_check < 4:
-                print(
-                    f"INFO: Player{player_num} 색깔 배정 대기 중... "
-                    f"({color_check+1}/5)"
-                )
-                await page.wait_for_timeout(TEST_CONFIG["retry_interval"] * 1.5)
-
-        print(f"DEBUG Player{player_num}: {debug_info}")
+        # 색깔 배정까지 브라우저 안에서 대기한 뒤 (기존 재시도 4회분) 한 번만 조회
+        if not await OmokGameHelper.wait_for_js(
+            page, MY_COLOR_ASSIGNED_SCRIPT, _RETRY_INTERVAL * 6
+        ):
+            print(f"INFO: Player{player_num} 색깔 배정 대기 시간 초과")
+        OmokGameHelper.invalidate_snapshot(page)
+        debug_info = await OmokGameHelper.get_client_snapshot(page)
+        if debug_info is None:
+            raise AssertionError("클라이언트 상태 확인 실패: omokClient not found")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player%s: %r", player_num, debug_info)
 
         my_player = debug_info["myPlayer"]
         if not my_player:
@@ -927,47 +1264,23 @@ class OmokGameHelper:
         print(f"돌 놓기 시도 위치: ({x:.1f}, {y:.1f})")
 
         # WebSocket 응답 대기 - 실제 보드 변화 확인
-        max_wait_attempts = 5
-        board_changed = False
-
-        for wait_attempt in range(max_wait_attempts):
-            current_stone_count = await OmokGameHelper.get_stone_count(page1)
-            if current_stone_count > initial_stone_count:
-                board_changed = True
-                print(f"SUCCESS: 보드 변화 감지됨 " f"({wait_attempt+1}번째 확인)")
-                break
-
-            # 점진적 대기 간격
-            wait_time = TEST_CONFIG["retry_interval"] * 0.6 + (
-                wait_attempt * 200
-            )  # 기본 간격부터 시작해서 점점 증가
-            await page.wait_for_timeout(wait_time)
-
-        if not board_changed:
-            print("INFO: 즉시 보드 변화 감지되지 않음, 추가 확인 진행")
-            # 추가 확인 로직
-            for check_attempt in range(3):
-                final_stone_count = await OmokGameHelper.get_stone_count(page1)
-                stone_placed = final_stone_count > initial_stone_count
+        # (짧은 간격부터 두 배씩 늘려 확인, 기존 재시도 대기 시간의 합까지)
+        final_stone_count = initial_stone_count
 
-                if stone_placed:
-                    print(
-                        f"SUCCESS: 돌 놓기 지연 성공 "
-                        f"({initial_stone_count} -> {final_stone_count})"
-                    )
-                    return True
-                elif check_attempt < 2:
-                    print(f"INFO: 돌 놓기 상태 재확인 중... ({check_attempt+1}/3)")
-                    await page.wait_for_timeout(TEST_CONFIG["retry_interval"])
+        async def stone_added() -> bool:
+            nonlocal final_stone_count
+            final_stone_count = await OmokGameHelper.get_stone_count(
+                page1, max_retries=1
+            )
+            return final_stone_count > initial_stone_count
 
+        if not await OmokGameHelper.wait_for_condition(
+            stone_added, timeout=_RETRY_INTERVAL * 9, interval=_RETRY_INTERVAL
+        ):
             raise AssertionError("돌 놓기 실패")
-        else:
-            final_stone_count = await OmokGameHelper.get_stone_count(page1)
-            print(
-                f"SUCCESS: 돌 놓기 성공 "
-                f"({initial_stone_count} -> {final_stone_count})"
-            )
-            return True
+
+        print(f"SUCCESS: 돌 놓기 성공 ({initial_stone_count} -> {final_stone_count})")
+        return True
 
     @staticmethod
     async def _verify_turn_change(
@@ -978,15 +1291,35 @@ class OmokGameHelper:
             page1,
             page2,
             expected_next_player,
-            timeout=TEST_CONFIG["state_sync"],
+            timeout=_UI_TIMEOUT * 5,
             assert_on_failure=True,
-            max_retries=8,
         )
 
+    @staticmethod
+    async def find_in_page_html(
+        page: Page, items: Sequence[str], ignore_case: bool = False
+    ) -> List[str]:
+        """페이지 HTML에 포함된 항목 목록 (입력 순서 유지)
+
+        ignore_case=True면 소문자로 바꾼 HTML에서 검색 (항목은 그대로 비교)
+        """
+        return await page.evaluate(FIND_IN_HTML_SCRIPT, [items, ignore_case])
+
+    @staticmethod
+    async def find_in_page_text(page: Page, items: Sequence[str]) -> List[str]:
+        """화면에 보이는 텍스트에 포함된 항목 목록 (입력 순서 유지)"""
+        return await page.evaluate(FIND_IN_TEXT_SCRIPT, items)
+
+    @staticmethod
+    async def search_page_html(page: Page, pattern: re.Pattern) -> Optional[str]:
+        """페이지 HTML에서 정규식과 처음 일치한 문자열 (없으면 None)"""
+        flags = "i" if pattern.flags & re.IGNORECASE else ""
+        return await page.evaluate(SEARCH_HTML_SCRIPT, [pattern.pattern, flags])
+
     @staticmethod
     async def check_page_condition(
         page: Page,
-        items: List[str],
+        items: Union[Sequence[str], re.Pattern],
         check_type: str = "element",
         success_message: str = "조건 확인",
         timeout: int = None,
@@ -996,7 +1329,7 @@ class OmokGameHelper:
 
         Args:
             page: Playwright Page 객체
-            items: 확인할 항목들 (선택자 또는 텍스트)
+            items: 확인할 항목들 (선택자 또는 텍스트), content 타입은 정규식도 가능
             check_type: 확인 타입 ("element", "content", "popup")
             success_message: 성공 시 출력할 메시지
             timeout: 요소 대기 시간 (element, popup 타입에만 적용), None이면 기본값 사용
@@ -1005,15 +1338,18 @@ class OmokGameHelper:
             조건 만족 여부
         """
         if timeout is None:
-            timeout = TEST_CONFIG["element_wait"]
+            timeout = _ELEMENT_WAIT
 
-        if check_type == "content":
-            # 페이지 내용에서 텍스트 찾기
-            page_content = await page.content()
-            for item in items:
-                if item in page_content:
-                    print(f"SUCCESS: {success_message} - '{item}'")
-                    return True
+        if check_type == "content" and not isinstance(items, re.Pattern):
+            # 텍스트 목록도 정규식 하나로 합쳐서 검색 (항목 묶음별로 한 번만 컴파일)
+            items = _cached_text_pattern(tuple(items))
+
+        if isinstance(items, re.Pattern):
+            # 페이지 HTML을 브라우저 안에서 한 번만 검색
+            match = await OmokGameHelper.search_page_html(page, items)
+            if match is not None:
+                print(f"SUCCESS: {success_message} - '{match}'")
+                return True
         else:
             # 요소 찾기 (element 또는 popup)
             for item in items:
@@ -1023,6 +1359,8 @@ class OmokGameHelper:
                         print(f"SUCCESS: {success_message} - {item}")
                         return True
                 except Exception:
+                    # 호출부가 선택자와 일반 텍스트를 섞어 넘기므로
+                    # 선택자 해석 오류도 "없음"으로 보고 다음 항목 확인
                     continue
         return False
 
@@ -1033,36 +1371,64 @@ class OmokGameHelper:
         timeout: int = None,
         success_message: str = "버튼 클릭",
     ) -> bool:
-        """버튼 선택자 목록에서 첫 번째로 찾은 버튼 클릭"""
+        """버튼 선택자 목록 중 처음 보이는 버튼 클릭 (목록 전체를 한 번에 대기)"""
         if timeout is None:
-            timeout = TEST_CONFIG["element_wait"]
-        for selector in button_selectors:
-            try:
-                button = page.locator(selector)
-                if await button.is_visible(timeout=timeout):
-                    await button.click()
-                    print(f"SUCCESS: {success_message} - {selector}")
-                    return True
-            except Exception:
-                continue
-        return False
+            timeout = _ELEMENT_WAIT
+        button = await OmokGameHelper._wait_for_any_visible(
+            page, button_selectors, timeout
+        )
+        if button is None:
+            return False
+        try:
+            await button.click()
+        except PlaywrightTimeoutError:
+            return False
+        print(f"SUCCESS: {success_message}")
+        return True
 
     @staticmethod
     async def find_input_field(
         page: Page, input_selectors: List[str], timeout: int = None
     ) -> Optional[Locator]:
-        """입력 필드 찾기"""
+        """입력 필드 찾기 (선택자 목록 중 처음 보이는 요소)"""
         if timeout is None:
-            timeout = TEST_CONFIG["ui_timeout"]
-        for selector in input_selectors:
-            try:
-                input_field = page.locator(selector)
-                if await input_field.is_visible(timeout=timeout):
-                    print(f"SUCCESS: 입력 필드 발견 - {selector}")
-                    return input_field
-            except Exception:
-                continue
-        return None
+            timeout = _UI_TIMEOUT
+        input_field = await OmokGameHelper._wait_for_any_visible(
+            page, input_selectors, timeout
+        )
+        if input_field is not None:
+            print("SUCCESS: 입력 필드 발견")
+        return input_field
+
+    @staticmethod
+    def _combined_locator(page: Page, selectors: Sequence[str]) -> Locator:
+        """선택자 목록 중 하나와 일치하는 보이는 요소들의 locator (페이지별 재사용)"""
+        key = tuple(selectors)
+        locators = _locator_cache.setdefault(page, {})
+        locator = locators.get(key)
+        if locator is None:
+            locator = _locator(page, key[0])
+            for selector in key[1:]:
+                locator = locator.or_(_locator(page, selector))
+            locator = locators[key] = locator.filter(visible=True)
+        return locator
+
+    @staticmethod
+    async def _wait_for_any_visible(
+        page: Page, selectors: Sequence[str], timeout: int
+    ) -> Optional[Locator]:
+        """선택자 목록을 하나의 locator로 묶어 보이는 첫 요소를 대기
+
+        선택자마다 따로 확인하지 않고 한 번의 대기로 처리하며,
+        여러 요소가 보이면 문서 순서상 첫 요소를 반환
+        (text= 등 CSS가 아닌 선택자도 섞일 수 있어 쉼표 대신 or_로 결합)
+        """
+        locator = OmokGameHelper._combined_locator(page, selectors).first
+        try:
+            await locator.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+        return locator
 
     @staticmethod
     async def setup_room_creation_form(page: Page) -> Locator:
@@ -1071,7 +1437,7 @@ class OmokGameHelper:
         await page.locator(OmokSelectors.MainPage.OMOK_CARD).click()
         await page.wait_for_load_state("networkidle")
         await page.click(OmokSelectors.MainPage.CREATE_ROOM_CARD)
-        await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+        await page.wait_for_timeout(_ELEMENT_WAIT)
 
         nickname_input = await OmokGameHelper.find_input_field(
             page,
@@ -1105,27 +1471,16 @@ class OmokGameHelper:
             position_pattern: 위치 패턴 ("preset" 또는 "calculated")
         """
         try:
-            # Canvas 표시 상태 확인
-            canvas1 = page1.locator("#omokBoard")
-            canvas2 = page2.locator("#omokBoard")
-            assert await canvas1.is_visible(), "Player1 오목 보드가 표시되지 않음"
-            assert await canvas2.is_visible(), "Player2 오목 보드가 표시되지 않음"
-
-            # 실제 색깔 배정 확인
-            player1_info = await page1.evaluate(
-                """
-                window.omokClient.state.players.find(
-                    p => p.player_number === window.omokClient.state.myPlayerNumber
-                )
-            """
-            )
-            player2_info = await page2.evaluate(
-                """
-                window.omokClient.state.players.find(
-                    p => p.player_number === window.omokClient.state.myPlayerNumber
-                )
-            """
+            # Canvas 표시 상태와 실제 색깔 배정 확인 (두 페이지 동시 조회)
+            visible1, visible2, (snapshot1, snapshot2) = await asyncio.gather(
+                _locator(page1, OmokSelectors.GameUI.BOARD).is_visible(),
+                _locator(page2, OmokSelectors.GameUI.BOARD).is_visible(),
+                OmokGameHelper.get_client_snapshots(page1, page2),
             )
+            assert visible1, "Player1 오목 보드가 표시되지 않음"
+            assert visible2, "Player2 오목 보드가 표시되지 않음"
+            player1_info = snapshot1["myPlayer"]
+            player2_info = snapshot2["myPlayer"]
 
             print(
                 f"색깔 배정 - Player1: color={player1_info['color']}, "
@@ -1140,31 +1495,16 @@ class OmokGameHelper:
                 black_page, black_num = page2, 2
                 white_page, white_num = page1, 1
 
-            for i in range(moves_count):
-                # 위치 결정
-                if position_pattern == "preset":
-                    preset_positions = [
-                        (0.5, 0.5),  # 중앙
-                        (0.6, 0.6),  # 오프셋 1
-                        (0.4, 0.4),  # 오프셋 2
-                        (0.7, 0.3),  # 오프셋 3
-                        (0.3, 0.7),  # 오프셋 4
-                    ]
-                    if i < len(preset_positions):
-                        x_ratio, y_ratio = preset_positions[i]
-                    else:
-                        x_ratio, y_ratio = (0.5 + (i % 3) * 0.1, 0.5 + (i % 2) * 0.1)
-                else:  # calculated pattern
-                    x_ratio, y_ratio = 0.4 + i * 0.1, 0.4 + i * 0.1
-
-                # 색깔 기준으로 돌 놓기 (짝수: 흑돌, 홀수: 백돌)
-                if i % 2 == 0:  # 흑돌 차례
-                    current_page, current_num = black_page, black_num
-                    next_color = 2  # 다음은 백돌
-                else:  # 백돌 차례
-                    current_page, current_num = white_page, white_num
-                    next_color = 1  # 다음은 흑돌
+            # 수마다 (페이지, 플레이어 번호, 다음 색깔, 위치)를 미리 계산
+            # 색깔 기준으로 돌 놓기 (짝수: 흑돌, 다음은 백돌 / 홀수: 백돌, 다음은 흑돌)
+            turns = ((black_page, black_num, 2), (white_page, white_num, 1))
+            move_plan = [
+                (*turns[i % 2], *_move_position(i, position_pattern))
+                for i in range(moves_count)
+            ]
 
+            for i, move in enumerate(move_plan):
+                current_page, current_num, next_color, x_ratio, y_ratio = move
                 if verify_turns:
                     await OmokGameHelper.place_stone_and_verify_turn(
                         current_page,
@@ -1181,6 +1521,9 @@ class OmokGameHelper:
                         f"{i+1}번째 수 완료"
                     )
                 else:
+                    stones_before = await OmokGameHelper.get_stone_count(
+                        current_page, max_retries=1
+                    )
                     x, y = await OmokGameHelper.click_canvas_position(
                         current_page, x_ratio, y_ratio
                     )
@@ -1189,9 +1532,13 @@ class OmokGameHelper:
                         f"{'(흑돌)' if i % 2 == 0 else '(백돌)'}이 "
                         f"{i+1}번째 수: ({x:.1f}, {y:.1f})"
                     )
-                    # 간단한 수 진행 시에는 짧은 대기로 충분
-                    await page1.wait_for_timeout(TEST_CONFIG["retry_interval"])
-                    await page2.wait_for_timeout(TEST_CONFIG["retry_interval"])
+                    # 고정 대기 대신 돌이 반영될 때까지만 대기 (최대 state_sync)
+                    await OmokGameHelper.wait_for_js(
+                        current_page,
+                        "(window.__lupinHelpers?.stoneCount() ?? -1) > "
+                        f"{stones_before}",
+                        _STATE_SYNC,
+                    )
 
             print(
                 f"SUCCESS: {moves_count}수 게임 진행 완료 " f"(턴 검증: {verify_turns})"
@@ -1213,16 +1560,15 @@ class OmokGameHelper:
             투명도 슬라이더 Locator 또는 None
         """
         if timeout is None:
-            timeout = TEST_CONFIG["ui_timeout"]
+            timeout = _UI_TIMEOUT
 
-        for selector in OmokSelectors.UIControls.ALL_OPACITY_SELECTORS:
-            try:
-                slider = page.locator(selector)
-                if await slider.is_visible(timeout=timeout):
-                    print(f"SUCCESS: 투명도 슬라이더 발견 - {selector}")
-                    return slider
-            except Exception:
-                continue
+        # 후보 선택자를 한 번에 대기 (선택자마다 순서대로 확인하지 않음)
+        slider = await OmokGameHelper._wait_for_any_visible(
+            page, OmokSelectors.UIControls.ALL_OPACITY_SELECTORS, timeout
+        )
+        if slider is not None:
+            print("SUCCESS: 투명도 슬라이더 발견")
+            return slider
 
         print("INFO: 투명도 슬라이더를 찾을 수 없음")
         return None
@@ -1240,16 +1586,15 @@ class OmokGameHelper:
             숨김 버튼 Locator 또는 None
         """
         if timeout is None:
-            timeout = TEST_CONFIG["ui_timeout"]
+            timeout = _UI_TIMEOUT
 
-        for selector in OmokSelectors.UIControls.ALL_HIDE_BUTTON_SELECTORS:
-            try:
-                button = page.locator(selector)
-                if await button.is_visible(timeout=timeout):
-                    print(f"SUCCESS: 빠른 숨김 버튼 발견 - {selector}")
-                    return button
-            except Exception:
-                continue
+        # 후보 선택자를 한 번에 대기 (선택자마다 순서대로 확인하지 않음)
+        button = await OmokGameHelper._wait_for_any_visible(
+            page, OmokSelectors.UIControls.ALL_HIDE_BUTTON_SELECTORS, timeout
+        )
+        if button is not None:
+            print("SUCCESS: 빠른 숨김 버튼 발견")
+            return button
 
         print("INFO: 빠른 숨김 버튼을 찾을 수 없음")
         return None
@@ -1267,16 +1612,15 @@ class OmokGameHelper:
             게임 영역 Locator 또는 None
         """
         if timeout is None:
-            timeout = TEST_CONFIG["ui_timeout"]
+            timeout = _UI_TIMEOUT
 
-        for selector in OmokSelectors.UIControls.ALL_GAME_AREA_SELECTORS:
-            try:
-                element = page.locator(selector)
-                if await element.is_visible(timeout=timeout):
-                    print(f"SUCCESS: 게임 영역 발견 - {selector}")
-                    return element
-            except Exception:
-                continue
+        # 후보 선택자를 한 번에 대기 (선택자마다 순서대로 확인하지 않음)
+        element = await OmokGameHelper._wait_for_any_visible(
+            page, OmokSelectors.UIControls.ALL_GAME_AREA_SELECTORS, timeout
+        )
+        if element is not None:
+            print("SUCCESS: 게임 영역 발견")
+            return element
 
         print("INFO: 게임 영역을 찾을 수 없음")
         return None
@@ -1301,7 +1645,7 @@ class OmokGameHelper:
         try:
             await opacity_slider.fill(opacity_value)
             # 변경 적용 대기
-            await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page.wait_for_timeout(_ELEMENT_WAIT)
             print(f"SUCCESS: 투명도 {opacity_value}% 설정")
             return True
         except Exception as e:
@@ -1320,12 +1664,22 @@ class OmokGameHelper:
         Returns:
             성공 여부
         """
+        # 토글 전 오버레이 숨김 상태 (오버레이가 없으면 None)
+        hidden_before = await page.evaluate(OVERLAY_HIDDEN_EXPR)
+        # 고정 대기 대신 오버레이의 hidden 클래스가 바뀔 때까지만 대기
+        toggled_expr = (
+            f"{OVERLAY_HIDDEN_EXPR} === {json.dumps(not hidden_before)}"
+            if hidden_before is not None
+            else "true"
+        )
+
         # 먼저 Escape 키 시도
         try:
             await page.keyboard.press("Escape")
-            await page.wait_for_timeout(TEST_CONFIG["element_wait"])
-            print("SUCCESS: Escape 키로 스텔스 모드 토글")
-            return True
+            if await OmokGameHelper.wait_for_js(page, toggled_expr, _ELEMENT_WAIT):
+                print("SUCCESS: Escape 키로 스텔스 모드 토글")
+                return True
+            print("INFO: Escape 키로 토글되지 않음, 버튼 클릭 시도")
         except Exception as e:
             print(f"INFO: Escape 키 토글 실패, 버튼 클릭 시도 - {e}")
 
@@ -1336,7 +1690,9 @@ class OmokGameHelper:
 
         try:
             await hide_button.click()
-            await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+            if not await OmokGameHelper.wait_for_js(page, toggled_expr, _ELEMENT_WAIT):
+                print("INFO: 버튼 클릭 후 토글 상태 변화 없음")
+                return False
             print("SUCCESS: 버튼 클릭으로 스텔스 모드 토글")
             return True
         except Exception as e:
@@ -1355,26 +1711,45 @@ class OmokGameHelper:
         Returns:
             Excel 요소들이 충분히 발견되었는지 여부
         """
-        found_menus = 0
 
-        # Excel 메뉴 확인
-        for menu in OmokSelectors.TextPatterns.EXCEL_MENUS:
+        async def probe_menu(menu: str) -> Optional[str]:
             try:
-                menu_element = page.locator(f"text={menu}")
-                if await menu_element.is_visible(timeout=TEST_CONFIG["element_wait"]):
-                    print(f"SUCCESS: Excel 메뉴 '{menu}' 확인")
-                    found_menus += 1
+                if await page.locator(f"text={menu}").is_visible():
+                    return menu
             except Exception:
                 pass
+            return None
 
-        # Excel 스타일 요소 확인
-        page_content = await page.content()
-        excel_element_count = 0
+        # Excel 메뉴를 동시에 확인하고, min_count개를 찾으면 나머지 확인은 취소
+        style_task = asyncio.ensure_future(
+            OmokGameHelper.find_in_page_html(
+                page, list(OmokSelectors.TextPatterns.EXCEL_STYLE_ELEMENTS)
+            )
+        )
+        menu_tasks = [
+            asyncio.ensure_future(probe_menu(menu))
+            for menu in OmokSelectors.TextPatterns.EXCEL_MENUS
+        ]
+        found_menus = 0
+        try:
+            for next_done in asyncio.as_completed(menu_tasks):
+                menu = await next_done
+                if menu is not None:
+                    print(f"SUCCESS: Excel 메뉴 '{menu}' 확인")
+                    found_menus += 1
+                    if found_menus >= min_count:
+                        break
 
-        for element in OmokSelectors.TextPatterns.EXCEL_STYLE_ELEMENTS:
-            if element in page_content:
-                print(f"SUCCESS: Excel 스타일 요소 발견 - {element}")
-                excel_element_count += 1
+            # Excel 스타일 요소 확인
+            found_elements = await style_task
+        finally:
+            # 중간에 예외/취소로 빠져나와도 남은 작업이 고아로 남지 않도록 정리
+            for task in (*menu_tasks, style_task):
+                task.cancel()
+            await asyncio.gather(*menu_tasks, style_task, return_exceptions=True)
+        for element in found_elements:
+            print(f"SUCCESS: Excel 스타일 요소 발견 - {element}")
+        excel_element_count = len(found_elements)
 
         success = found_menus >= min_count and excel_element_count > 0
         if success:
@@ -1402,14 +1777,16 @@ class OmokGameHelper:
         Returns:
             화려한 요소들이 모두 숨겨져 있는지 여부
         """
-        for flashy in OmokSelectors.TextPatterns.FLASHY_ELEMENTS:
-            try:
-                element = page.locator(flashy)
-                if await element.is_visible(timeout=TEST_CONFIG["retry_interval"]):
-                    print(f"WARNING: 화려한 요소가 발견됨 - {flashy}")
-                    return False
-            except Exception:
-                pass  # 요소가 없으면 정상
+        # 보이는 화려한 요소 개수를 한 번에 조회 (선택자마다 확인하지 않음)
+        try:
+            visible_count = await OmokGameHelper._combined_locator(
+                page, OmokSelectors.TextPatterns.FLASHY_ELEMENTS
+            ).count()
+        except Exception:
+            visible_count = 0  # 확인할 수 없으면 기존처럼 정상으로 간주
+        if visible_count:
+            print(f"WARNING: 화려한 요소가 발견됨 - {visible_count}개")
+            return False
 
         print("SUCCESS: 화려한 게임 요소들이 모두 숨겨져 있음")
         return True
@@ -1434,13 +1811,9 @@ class OmokGameHelper:
             return not should_be_visible
 
         try:
-            is_visible = await game_area.is_visible()
-
-            # 스타일 속성도 확인 (opacity, display 등)
-            style = await game_area.get_attribute("style") or ""
-            is_hidden_by_style = "opacity: 0" in style or "display: none" in style
-
-            actual_visible = is_visible and not is_hidden_by_style
+            # find_game_area는 보이는 요소만 반환하므로 계산된 스타일만 추가 확인
+            # (style 속성뿐 아니라 CSS 클래스로 숨긴 경우도 반영)
+            actual_visible = await game_area.evaluate(ELEMENT_SHOWN_SCRIPT)
 
             if actual_visible == should_be_visible:
                 status = "보임" if actual_visible else "숨김"
@@ -1482,8 +1855,8 @@ class OmokGameHelper:
         if await OmokGameHelper.toggle_stealth_mode(page):
             success_count += 1
 
-        # 3. 숨김 상태에서 Excel 요소들 확인
-        await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+        # 3. 숨김 상태에서 Excel 요소들 확인 (고정 대기 대신 화면 변경이 끝날 때까지)
+        await OmokGameHelper.wait_for_dom_settle(page)
         if await OmokGameHelper.verify_excel_elements(page, min_count=2):
             success_count += 1
 
@@ -8,12 +8,22 @@ scenarios.md 문서의 Critical 시나리오들을 체계적으로 검증:
 - S6: 게임 종료 및 승부 판정
 """
 
-import json
+import asyncio
 
 import pytest
 
 from ...conftest import CONTEXT_CONFIG, TEST_CONFIG
-from .omok_helpers import OmokGameHelper, OmokSelectors
+from .omok_helpers import OmokGameHelper, OmokSelectors, text_pattern
+
+# 대기 상태 / 게임 페이지 확인용 텍스트 (페이지 HTML 한 번 검색)
+WAITING_PATTERN = text_pattern(
+    OmokSelectors.TextPatterns.WAITING_INDICATORS,
+    ("상대방을 기다리고 있습니다", "대기 중", "waiting", "플레이어 대기"),
+    ignore_case=True,
+)
+GAME_PAGE_PATTERN = text_pattern(
+    OmokSelectors.TextPatterns.GAME_ELEMENTS, ("보드", "플레이어")
+)
 
 
 class TestS1BasicGameFlow:
@@ -47,43 +57,22 @@ class TestS1BasicGameFlow:
         assert game_board_visible, "게임 보드가 표시되지 않았습니다"
         print("SUCCESS: 게임 보드 표시 확인")
 
-        # 2. 대기 상태 메시지 확인
-        page_content = await page.content()
-        waiting_indicators = OmokSelectors.TextPatterns.WAITING_INDICATORS + [
-            "상대방을 기다리고 있습니다",
-            "대기 중",
-            "waiting",
-            "플레이어 대기",
-        ]
-
-        found_waiting = False
-        for indicator in waiting_indicators:
-            if indicator in page_content.lower():
-                found_waiting = True
-                print(f"SUCCESS: 대기 상태 메시지 확인 - '{indicator}'")
-                break
+        # 2. 대기 상태 메시지 확인 (HTML 한 번 검색)
+        found_waiting = await OmokGameHelper.check_page_condition(
+            page, WAITING_PATTERN, "content", "대기 상태 메시지 확인"
+        )
 
         # 대기 메시지가 없더라도 게임 UI 요소는 있어야 함
         if not found_waiting:
-            game_indicators = OmokSelectors.TextPatterns.GAME_ELEMENTS + [
-                "오목",
-                "게임",
-                "보드",
-                "플레이어",
-            ]
-            for indicator in game_indicators:
-                if indicator in page_content:
-                    found_waiting = True
-                    print(f"SUCCESS: 게임 페이지 요소 발견 - '{indicator}'")
-                    break
+            found_waiting = await OmokGameHelper.check_page_condition(
+                page, GAME_PAGE_PATTERN, "content", "게임 페이지 요소 발견"
+            )
 
         assert found_waiting, "대기 상태나 게임 관련 요소를 찾을 수 없습니다"
 
         # 3. 플레이어 정보 확인
         try:
-            player_info = await page.evaluate(
-                "window.omokClient ? window.omokClient.state : null"
-            )
+            player_info = await OmokGameHelper.get_client_state(page)
             if player_info:
                 assert (
                     player_info.get("nickname") == "Player1"
@@ -118,16 +107,13 @@ class TestS1BasicGameFlow:
         print(f"SUCCESS: 두 플레이어 게임 설정 완료 - {room_url}")
 
         # 1. 양쪽 페이지에서 게임 상태 확인
-        await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
-        await page2.wait_for_timeout(TEST_CONFIG["element_wait"])
+        await OmokGameHelper.wait_on_pages(TEST_CONFIG.element_wait, page1, page2)
 
-        # 게임 상태가 올바르게 설정되었는지 확인
-        game_state1 = await page1.evaluate(
-            "window.omokClient ? window.omokClient.state.gameState : null"
-        )
-        game_state2 = await page2.evaluate(
-            "window.omokClient ? window.omokClient.state.gameState : null"
-        )
+        # 게임 상태가 올바르게 설정되었는지 확인 (페이지당 스냅샷 1회로 모두 조회)
+        snapshot1, snapshot2 = await OmokGameHelper.get_client_snapshots(page1, page2)
+        snapshot1, snapshot2 = snapshot1 or {}, snapshot2 or {}
+        game_state1 = snapshot1.get("gameState")
+        game_state2 = snapshot2.get("gameState")
 
         assert game_state1 is not None, "Player1의 게임 상태를 가져올 수 없습니다"
         assert game_state2 is not None, "Player2의 게임 상태를 가져올 수 없습니다"
@@ -146,15 +132,8 @@ class TestS1BasicGameFlow:
         print(f"SUCCESS: 현재 턴 설정 확인 - Player{current_player1}")
 
         # 3. 플레이어 정보 확인 (클라이언트 상태에서)
-        client_state1 = await page1.evaluate(
-            "window.omokClient ? window.omokClient.state : null"
-        )
-        client_state2 = await page2.evaluate(
-            "window.omokClient ? window.omokClient.state : null"
-        )
-
-        players1 = client_state1.get("players", []) if client_state1 else []
-        players2 = client_state2.get("players", []) if client_state2 else []
+        players1 = snapshot1.get("players") or []
+        players2 = snapshot2.get("players") or []
 
         if len(players1) >= 2 and len(players2) >= 2:
             print("SUCCESS: 플레이어 정보 확인 - 2명")
@@ -165,20 +144,8 @@ class TestS1BasicGameFlow:
             )
 
         # 4. 색깔 배정 확인
-        player1_info = await page1.evaluate(
-            """
-            window.omokClient.state.players.find(
-                p => p.player_number === window.omokClient.state.myPlayerNumber
-            )
-        """
-        )
-        player2_info = await page2.evaluate(
-            """
-            window.omokClient.state.players.find(
-                p => p.player_number === window.omokClient.state.myPlayerNumber
-            )
-        """
-        )
+        player1_info = snapshot1.get("myPlayer")
+        player2_info = snapshot2.get("myPlayer")
 
         assert player1_info and player2_info, "플레이어 정보를 가져올 수 없습니다"
         assert (
@@ -220,21 +187,10 @@ class TestS1BasicGameFlow:
         )
         print(f"SUCCESS: 게임 설정 완료 - {room_url}")
 
-        # 실제 색깔 배정 확인
-        player1_info = await page1.evaluate(
-            """
-            window.omokClient.state.players.find(
-                p => p.player_number === window.omokClient.state.myPlayerNumber
-            )
-        """
-        )
-        player2_info = await page2.evaluate(
-            """
-            window.omokClient.state.players.find(
-                p => p.player_number === window.omokClient.state.myPlayerNumber
-            )
-        """
-        )
+        # 실제 색깔 배정 및 현재 턴 확인 (두 페이지 스냅샷 동시 조회)
+        snapshot1, snapshot2 = await OmokGameHelper.get_client_snapshots(page1, page2)
+        player1_info = snapshot1["myPlayer"]
+        player2_info = snapshot2["myPlayer"]
 
         print(
             f"플레이어 정보 - Player1: {player1_info['color']}, "
@@ -242,7 +198,7 @@ class TestS1BasicGameFlow:
         )
 
         # 현재 턴 확인
-        game_state = await page1.evaluate("window.omokClient.state.gameState")
+        game_state = snapshot1["gameState"]
         current_player = game_state["current_player"]
         print(f"게임 시작 시 현재 턴: Player{current_player}")
 
@@ -291,8 +247,9 @@ class TestS1BasicGameFlow:
                 else:
                     await OmokGameHelper.click_canvas_position(page2, x_ratio, y_ratio)
                     print(f"Player2가 {i+1}번째 추가 수: ({x_ratio}, {y_ratio})")
-                await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
-                await page2.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await OmokGameHelper.wait_on_pages(
+                    TEST_CONFIG.element_wait, page1, page2
+                )
             except Exception as e:
                 print(f"INFO: {i+1}번째 수 진행 중 오류 (정상적일 수 있음) - {e}")
                 break
@@ -336,11 +293,11 @@ class TestS2MultiplayerSync:
         print("SUCCESS: URL 동기화 확인")
 
         # 2. 게임 상태 동기화 확인
-        await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
-        await page2.wait_for_timeout(TEST_CONFIG["element_wait"])
+        await OmokGameHelper.wait_on_pages(TEST_CONFIG.element_wait, page1, page2)
 
-        game_state1 = await page1.evaluate("window.omokClient.state.gameState")
-        game_state2 = await page2.evaluate("window.omokClient.state.gameState")
+        snapshot1, snapshot2 = await OmokGameHelper.get_client_snapshots(page1, page2)
+        game_state1 = snapshot1["gameState"]
+        game_state2 = snapshot2["gameState"]
 
         # 핵심 게임 상태 동기화 검증
         assert game_state1["current_player"] == game_state2["current_player"], (
@@ -349,24 +306,10 @@ class TestS2MultiplayerSync:
         )
 
         # 클라이언트 상태에서 플레이어 수 확인 (gameState가 아닌 client state에 있음)
-        client_state1 = await page1.evaluate(
-            "window.omokClient ? window.omokClient.state : null"
-        )
-        client_state2 = await page2.evaluate(
-            "window.omokClient ? window.omokClient.state : null"
-        )
-
-        if (
-            client_state1
-            and client_state1.get("players")
-            and client_state2
-            and client_state2.get("players")
-        ):
-            assert (
-                len(client_state1["players"]) == len(client_state2["players"]) == 2
-            ), (
-                f"플레이어 수 불일치: {len(client_state1['players'])} "
-                f"vs {len(client_state2['players'])}"
+        if snapshot1.get("players") and snapshot2.get("players"):
+            assert len(snapshot1["players"]) == len(snapshot2["players"]) == 2, (
+                f"플레이어 수 불일치: {len(snapshot1['players'])} "
+                f"vs {len(snapshot2['players'])}"
             )
             print("SUCCESS: 플레이어 수 동기화 확인")
         else:
@@ -376,20 +319,8 @@ class TestS2MultiplayerSync:
 
         # 3. 실시간 동작 동기화 테스트 - 한 플레이어가 수를 놓으면 다른 플레이어에게 즉시 반영
         # 실제 색깔 배정 확인 후 적절한 플레이어가 수를 놓도록 함
-        player1_info = await page1.evaluate(
-            """
-            window.omokClient.state.players.find(
-                p => p.player_number === window.omokClient.state.myPlayerNumber
-            )
-        """
-        )
-        player2_info = await page2.evaluate(
-            """
-            window.omokClient.state.players.find(
-                p => p.player_number === window.omokClient.state.myPlayerNumber
-            )
-        """
-        )
+        player1_info = snapshot1["myPlayer"]
+        player2_info = snapshot2["myPlayer"]
 
         current_player = game_state1["current_player"]
         print(
@@ -426,11 +357,9 @@ class TestS2MultiplayerSync:
         )
 
         # 5. WebSocket 연결 상태 확인
-        connection_status1 = await page1.evaluate(
-            "window.omokClient ? window.omokClient.connection.status : null"
-        )
-        connection_status2 = await page2.evaluate(
-            "window.omokClient ? window.omokClient.connection.status : null"
+        connection_status1, connection_status2 = await asyncio.gather(
+            OmokGameHelper.get_websocket_status(page1),
+            OmokGameHelper.get_websocket_status(page2),
         )
 
         assert (
@@ -464,11 +393,9 @@ class TestS2MultiplayerSync:
         print(f"SUCCESS: 게임 설정 완료 - {room_url}")
 
         # 1. 정상 연결 상태 확인
-        connection1 = await page1.evaluate(
-            "window.omokClient ? window.omokClient.connection.status : null"
-        )
-        connection2 = await page2.evaluate(
-            "window.omokClient ? window.omokClient.connection.status : null"
+        connection1, connection2 = await asyncio.gather(
+            OmokGameHelper.get_websocket_status(page1),
+            OmokGameHelper.get_websocket_status(page2),
         )
 
         assert connection1 == "connected", f"Player1 초기 연결 상태 이상: {connection1}"
@@ -495,7 +422,7 @@ class TestS2MultiplayerSync:
         # Player1 연결 끊김 시뮬레이션
         await page1.reload()
         await page1.wait_for_load_state("networkidle")
-        await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+        await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
         # 4. 자동 재연결 확인
         print("INFO: 자동 재연결 및 세션 복원 확인")
@@ -506,21 +433,19 @@ class TestS2MultiplayerSync:
             if continue_button:
                 await continue_button.click()
                 print("INFO: 이어하기 버튼 클릭")
-                await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await page1.wait_for_timeout(TEST_CONFIG.element_wait)
         except Exception:
             pass
 
         # omokClient 초기화 대기
         client_initialized = False
         for i in range(10):
-            client_exists = await page1.evaluate(
-                "typeof window.omokClient !== 'undefined'"
-            )
+            client_exists = await OmokGameHelper.is_client_ready(page1)
             if client_exists:
                 client_initialized = True
                 print(f"omokClient 초기화 확인 ({i+1}초 후)")
                 break
-            await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
         if not client_initialized:
             print("WARNING: omokClient가 초기화되지 않음")
@@ -528,23 +453,19 @@ class TestS2MultiplayerSync:
         # 재연결 후 연결 상태 확인 (최대 15초 대기)
         reconnected = False
         for attempt in range(15):
-            connection_status = await page1.evaluate(
-                "window.omokClient ? window.omokClient.connection.status : null"
-            )
+            connection_status = await OmokGameHelper.get_websocket_status(page1)
             if connection_status == "connected":
                 reconnected = True
                 print(f"SUCCESS: Player1 재연결 완료 ({attempt + 1}초 후)")
                 break
-            await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
         assert reconnected, "Player1 재연결 실패"
 
         # 5. 재연결 후 게임 상태 복원 확인
-        await page1.wait_for_timeout(TEST_CONFIG["game_action"])  # 상태 복원 대기
+        await page1.wait_for_timeout(TEST_CONFIG.game_action)  # 상태 복원 대기
 
-        after_reconnect_state1 = await page1.evaluate(
-            "window.omokClient.state.gameState"
-        )
+        after_reconnect_state1 = await OmokGameHelper.get_game_state(page1)
         if after_reconnect_state1:
             board_stones_after = await OmokGameHelper.get_stone_count(page1)
             assert (
@@ -555,8 +476,10 @@ class TestS2MultiplayerSync:
             print("INFO: 재연결 후 게임 상태 복원 진행 중")
 
         # 6. 양쪽 플레이어 게임 상태 동기화 확인
-        current_state1 = await page1.evaluate("window.omokClient.state.gameState")
-        current_state2 = await page2.evaluate("window.omokClient.state.gameState")
+        current_state1, current_state2 = await asyncio.gather(
+            OmokGameHelper.get_game_state(page1),
+            OmokGameHelper.get_game_state(page2),
+        )
 
         if current_state1 and current_state2:
             current_player1 = current_state1.get("current_player")
@@ -580,11 +503,9 @@ class TestS2MultiplayerSync:
             print(f"INFO: 재연결 후 게임 진행 테스트 - {e}")
 
         # 8. 연결 상태 안정성 최종 확인
-        final_connection1 = await page1.evaluate(
-            "window.omokClient ? window.omokClient.connection.status : null"
-        )
-        final_connection2 = await page2.evaluate(
-            "window.omokClient ? window.omokClient.connection.status : null"
+        final_connection1, final_connection2 = await asyncio.gather(
+            OmokGameHelper.get_websocket_status(page1),
+            OmokGameHelper.get_websocket_status(page2),
         )
 
         assert (
@@ -624,12 +545,11 @@ class TestS3SessionRecovery:
         # 1. 게임 진행 (몇 수를 놓아서 복원할 상태 생성)
         print("INFO: 게임 진행으로 복원할 상태 생성")
         await OmokGameHelper.make_alternating_moves(page1, page2, moves_count=3)
-        await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
-        await page2.wait_for_timeout(TEST_CONFIG["element_wait"])
+        await OmokGameHelper.wait_on_pages(TEST_CONFIG.element_wait, page1, page2)
 
         # 새로고침 전 게임 상태 저장
-        before_refresh_state = await page1.evaluate("window.omokClient.state.gameState")
-        before_player_info = await page1.evaluate("window.omokClient.state")
+        before_player_info = await OmokGameHelper.get_client_state(page1)
+        before_refresh_state = before_player_info["gameState"]
 
         board_stones_before = await OmokGameHelper.get_stone_count(page1)
         current_player_before = before_refresh_state["current_player"]
@@ -659,7 +579,7 @@ class TestS3SessionRecovery:
             if continue_button:
                 await continue_button.click()
                 print("INFO: 이어하기 버튼 클릭")
-                await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await page1.wait_for_timeout(TEST_CONFIG.element_wait)
         except Exception:
             pass
 
@@ -667,14 +587,12 @@ class TestS3SessionRecovery:
         print("INFO: omokClient 초기화 대기")
         client_initialized = False
         for i in range(10):
-            client_exists = await page1.evaluate(
-                "typeof window.omokClient !== 'undefined'"
-            )
+            client_exists = await OmokGameHelper.is_client_ready(page1)
             if client_exists:
                 client_initialized = True
                 print(f"omokClient 초기화 확인 ({i+1}초 후)")
                 break
-            await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
         if not client_initialized:
             print("WARNING: omokClient가 초기화되지 않음")
@@ -684,9 +602,7 @@ class TestS3SessionRecovery:
         session_restored = False
         for attempt in range(15):
             try:
-                client_state = await page1.evaluate(
-                    "window.omokClient ? window.omokClient.state : null"
-                )
+                client_state = await OmokGameHelper.get_client_state(page1)
                 if client_state and client_state.get("gameState"):
                     game_state = client_state["gameState"]
                     if game_state.get("board") and game_state.get("current_player"):
@@ -695,12 +611,12 @@ class TestS3SessionRecovery:
                         break
             except Exception:
                 pass
-            await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
         assert session_restored, "세션 복원 실패 - 게임 상태를 찾을 수 없음"
 
         # 게임 보드 그리기 대기
-        await page1.wait_for_timeout(TEST_CONFIG["game_action"])
+        await page1.wait_for_timeout(TEST_CONFIG.game_action)
 
         # 6. 게임 보드 복원 확인 (캔버스가 실제로 그려졌는지 확인)
         board_visible = False
@@ -718,8 +634,8 @@ class TestS3SessionRecovery:
         print("SUCCESS: 게임 보드 UI 복원 확인")
 
         # 7. 구체적인 게임 상태 복원 검증
-        after_refresh_state = await page1.evaluate("window.omokClient.state.gameState")
-        after_player_info = await page1.evaluate("window.omokClient.state")
+        after_player_info = await OmokGameHelper.get_client_state(page1)
+        after_refresh_state = after_player_info["gameState"]
 
         board_stones_after = await OmokGameHelper.get_stone_count(page1)
         current_player_after = after_refresh_state["current_player"]
@@ -746,7 +662,7 @@ class TestS3SessionRecovery:
         )
 
         # 8. 상대방과의 동기화 확인
-        page2_state = await page2.evaluate("window.omokClient.state.gameState")
+        page2_state = await OmokGameHelper.get_game_state(page2)
         assert page2_state["current_player"] == current_player_after, (
             f"Player2와 턴 동기화 실패: {page2_state['current_player']} "
             f"vs {current_player_after}"
@@ -757,12 +673,7 @@ class TestS3SessionRecovery:
         print("INFO: 새로고침 후 게임 진행 가능성 테스트")
         try:
             await OmokGameHelper.make_alternating_moves(page1, page2, moves_count=1)
-            final_stones = sum(
-                sum(1 for cell in row if cell != 0)
-                for row in (await page1.evaluate("window.omokClient.state.gameState"))[
-                    "board"
-                ]
-            )
+            final_stones = await OmokGameHelper.get_stone_count(page1)
             assert final_stones > board_stones_after, "새로고침 후 게임 진행 불가"
             print(f"SUCCESS: 새로고침 후 정상 게임 진행 확인 - {final_stones}개 돌")
         except Exception as e:
@@ -785,6 +696,7 @@ class TestS3SessionRecovery:
 
         room_url = None
         session_data = None
+        storage_state = None
 
         # 1. 첫 번째 컨텍스트에서 방 생성 및 게임 진행
         print("INFO: 첫 번째 컨텍스트에서 게임 생성 및 진행")
@@ -806,13 +718,13 @@ class TestS3SessionRecovery:
 
             if session_data:
                 print(f"세션 데이터 저장됨: {session_data.get('sessionId', 'N/A')}")
+                # 새 컨텍스트에 그대로 넘길 저장소 상태 (복원용 페이지 이동 불필요)
+                storage_state = await context1.storage_state()
             else:
                 print("WARNING: 세션 데이터가 로컬 스토리지에 저장되지 않음")
 
             # 게임 상태 확인
-            game_state = await page1.evaluate(
-                "window.omokClient ? window.omokClient.state : null"
-            )
+            game_state = await OmokGameHelper.get_client_state(page1)
             if game_state:
                 print(
                     f"게임 상태 확인: 닉네임={game_state.get('nickname')}, "
@@ -826,31 +738,24 @@ class TestS3SessionRecovery:
         # 2. 새 컨텍스트에서 같은 URL 접속 및 세션 복원 시도
         if room_url:
             print("INFO: 새 컨텍스트에서 세션 복원 시도")
-            context2 = await browser.new_context(**CONTEXT_CONFIG)
+            # 이전 세션이 있다면 컨텍스트 생성 시 로컬 스토리지를 함께 복원
+            context2 = await browser.new_context(
+                **CONTEXT_CONFIG, storage_state=storage_state
+            )
             page2 = await context2.new_page()
+            if storage_state:
+                print("세션 데이터를 새 브라우저에 설정")
 
             try:
-                # 이전 세션이 있다면 로컬 스토리지에 복원
-                if session_data:
-                    await page2.goto(OmokGameHelper.BASE_URL)
-                    await page2.evaluate(
-                        f"""
-                            localStorage.setItem('omok_session',
-                                '{json.dumps(session_data).replace("'", "\\'")}')
-                        """
-                    )
-                    print("세션 데이터를 새 브라우저에 설정")
 
                 # 게임 URL로 직접 접속
                 await page2.goto(room_url)
                 await page2.wait_for_load_state("networkidle")
-                await page2.wait_for_timeout(
-                    TEST_CONFIG["ui_timeout"]
-                )  # 세션 복원 대기
+                await page2.wait_for_timeout(TEST_CONFIG.ui_timeout)  # 세션 복원 대기
 
                 # 3. 페이지 로드 및 게임 요소 확인
-                page_content = await page2.content()
-                game_indicators = OmokSelectors.TextPatterns.GAME_ELEMENTS + [
+                game_indicators = [
+                    *OmokSelectors.TextPatterns.GAME_ELEMENTS,
                     "오목",
                     "게임",
                     "보드",
@@ -858,12 +763,10 @@ class TestS3SessionRecovery:
                     "플레이어",
                 ]
 
-                found_game = False
-                for indicator in game_indicators:
-                    if indicator in page_content:
-                        found_game = True
-                        print(f"SUCCESS: 게임 요소 발견 - {indicator}")
-                        break
+                found = await OmokGameHelper.find_in_page_html(page2, game_indicators)
+                found_game = bool(found)
+                if found_game:
+                    print(f"SUCCESS: 게임 요소 발견 - {found[0]}")
 
                 assert found_game, "게임 관련 요소를 찾을 수 없습니다"
 
@@ -882,16 +785,16 @@ class TestS3SessionRecovery:
 
                 # 5. JavaScript 클라이언트 상태 확인
                 try:
-                    client_state = await page2.evaluate(
-                        "window.omokClient ? window.omokClient.state : null"
+                    # 상태와 연결 상태를 한 번의 evaluate로 조회
+                    client_info = await page2.evaluate(
+                        "window.omokClient ? {state: window.omokClient.state, "
+                        "connectionStatus: window.omokClient.connection.status} : null"
                     )
-                    if client_state:
+                    if client_info:
+                        client_state = client_info["state"]
                         nickname = client_state.get("nickname")
                         session_id = client_state.get("sessionId")
-                        connection_status = await page2.evaluate(
-                            "window.omokClient ? "
-                            "window.omokClient.connection.status : null"
-                        )
+                        connection_status = client_info["connectionStatus"]
 
                         print(
                             f"클라이언트 상태 - 닉네임: {nickname}, 세션: {session_id}, "
@@ -921,7 +824,7 @@ class TestS3SessionRecovery:
                 try:
                     nickname_input = page2.locator("#nicknameInput")
                     if await nickname_input.is_visible(
-                        timeout=TEST_CONFIG["element_wait"]
+                        timeout=TEST_CONFIG.element_wait
                     ):
                         nickname_input_visible = True
                         print("INFO: 닉네임 입력 필요 - 새 세션으로 처리됨")
@@ -933,10 +836,10 @@ class TestS3SessionRecovery:
                             f"{OmokSelectors.Buttons.ENTER}"
                         )
                         if await confirm_btn.first.is_visible(
-                            timeout=TEST_CONFIG["element_wait"]
+                            timeout=TEST_CONFIG.element_wait
                         ):
                             await confirm_btn.first.click()
-                            await page2.wait_for_timeout(TEST_CONFIG["game_action"])
+                            await page2.wait_for_timeout(TEST_CONFIG.game_action)
                             print("SUCCESS: 새 세션으로 게임 접속 완료")
                 except Exception:
                     pass
@@ -945,8 +848,7 @@ class TestS3SessionRecovery:
                     print("SUCCESS: 세션 복원 또는 자동 접속 완료")
 
                 # 7. 최종 게임 상태 확인
-                final_content = await page2.content()
-                if any(indicator in final_content for indicator in game_indicators):
+                if await OmokGameHelper.find_in_page_html(page2, game_indicators):
                     print("SUCCESS: 브라우저 재접속 후 게임 상태 확인")
                 else:
                     print("WARNING: 재접속 후 게임 상태 불완전")
@@ -1011,13 +913,17 @@ class TestS6GameEndAndResult:
         ]
 
         print("INFO: 승리 관련 UI 요소 존재 여부 확인")
-        page1_content = await page1.content()
-        page2_content = await page2.content()
-
-        victory_ui_found = []
-        for element in victory_elements:
-            if element in page1_content.lower() or element in page2_content.lower():
-                victory_ui_found.append(element)
+        found1 = await OmokGameHelper.find_in_page_html(
+            page1, victory_elements, ignore_case=True
+        )
+        found2 = await OmokGameHelper.find_in_page_html(
+            page2, victory_elements, ignore_case=True
+        )
+        victory_ui_found = [
+            element
+            for element in victory_elements
+            if element in found1 or element in found2
+        ]
 
         if victory_ui_found:
             print(f"SUCCESS: 승리 관련 UI 요소 발견 - {victory_ui_found}")
@@ -1035,7 +941,7 @@ class TestS6GameEndAndResult:
         for button_selector in end_game_buttons:
             try:
                 button = page1.locator(button_selector)
-                if await button.is_visible(timeout=TEST_CONFIG["element_wait"]):
+                if await button.is_visible(timeout=TEST_CONFIG.element_wait):
                     print(f"SUCCESS: 게임 종료 관련 버튼 발견 - {button_selector}")
 
                     # 버튼 클릭 가능성 확인 (실제 클릭은 하지 않음)
@@ -1103,9 +1009,7 @@ class TestS6GameEndAndResult:
         await OmokGameHelper.make_alternating_moves(page1, page2, moves_count=3)
 
         # 연결 해제 전 게임 상태 확인
-        before_disconnect = await page2.evaluate(
-            "window.omokClient ? window.omokClient.connection.status : null"
-        )
+        before_disconnect = await OmokGameHelper.get_websocket_status(page2)
         print(f"연결 해제 전 Player2 연결 상태: {before_disconnect}")
 
         # 2. 나가기 버튼 찾기 및 클릭 시도 (헬퍼 함수 사용)
@@ -1123,13 +1027,13 @@ class TestS6GameEndAndResult:
         leave_button_found = await OmokGameHelper.find_and_click_button(
             page1,
             leave_button_selectors,
-            timeout=TEST_CONFIG["element_wait"],
+            timeout=TEST_CONFIG.element_wait,
             success_message="나가기 버튼 클릭",
         )
 
         if leave_button_found:
             # 3. 확인 팝업 처리 (헬퍼 함수 사용)
-            await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
             confirm_selectors = [
                 OmokSelectors.Buttons.CONFIRM,
@@ -1141,7 +1045,7 @@ class TestS6GameEndAndResult:
             await OmokGameHelper.find_and_click_button(
                 page1,
                 confirm_selectors,
-                timeout=TEST_CONFIG["element_wait"],
+                timeout=TEST_CONFIG.element_wait,
                 success_message="확인 버튼 클릭",
             )
 
@@ -1150,11 +1054,11 @@ class TestS6GameEndAndResult:
             print("INFO: 나가기 버튼 미발견 - 탭 닫기로 연결 해제 시뮬레이션")
             # current_url = page1.url  # Unused variable
             await page1.goto("about:blank")  # 다른 페이지로 이동 (연결 해제 시뮬레이션)
-            await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
         # 5. 남은 플레이어(page2)에서 상대방 퇴장 감지 확인
         print("INFO: 남은 플레이어에서 상대방 퇴장 감지 확인")
-        await page2.wait_for_timeout(TEST_CONFIG["game_action"])  # 퇴장 감지 대기
+        await page2.wait_for_timeout(TEST_CONFIG.game_action)  # 퇴장 감지 대기
 
         # 연결 상태나 게임 상태 변경 확인
         try:
@@ -1167,7 +1071,6 @@ class TestS6GameEndAndResult:
             print(f"남은 플레이어 수: {remaining_players}")
 
             # 토스트 메시지나 알림 확인
-            page2_content = await page2.content()
             disconnect_messages = [
                 "상대방이 나갔습니다",
                 "플레이어가 연결을 끊었습니다",
@@ -1177,12 +1080,10 @@ class TestS6GameEndAndResult:
                 "나가셨습니다",
             ]
 
-            disconnect_detected = False
-            for message in disconnect_messages:
-                if message in page2_content:
-                    disconnect_detected = True
-                    print(f"SUCCESS: 연결 해제 알림 감지 - {message}")
-                    break
+            found = await OmokGameHelper.find_in_page_html(page2, disconnect_messages)
+            disconnect_detected = bool(found)
+            if disconnect_detected:
+                print(f"SUCCESS: 연결 해제 알림 감지 - {found[0]}")
 
             if not disconnect_detected:
                 print("INFO: 연결 해제 알림 미감지 - 백그라운드 처리일 수 있음")
@@ -1192,7 +1093,7 @@ class TestS6GameEndAndResult:
 
         # 6. 나간 플레이어의 페이지 이동 확인 (나가기 버튼을 클릭한 경우)
         if leave_button_found:
-            await page1.wait_for_timeout(TEST_CONFIG["game_action"])
+            await page1.wait_for_timeout(TEST_CONFIG.game_action)
             final_url = page1.url
 
             # 메인 페이지나 다른 페이지로 이동했는지 확인
@@ -1206,9 +1107,7 @@ class TestS6GameEndAndResult:
 
         # 7. 남은 플레이어가 게임을 계속할 수 있는지 또는 대기 상태인지 확인
         try:
-            game_state_after = await page2.evaluate(
-                "window.omokClient ? window.omokClient.state.gameState : null"
-            )
+            game_state_after = await OmokGameHelper.get_game_state(page2)
             if game_state_after:
                 current_player = game_state_after.get("current_player")
                 players_count = len(game_state_after.get("players", []))
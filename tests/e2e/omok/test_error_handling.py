@@ -9,7 +9,8 @@ scenarios.md의 S7 시나리오를 체계적으로 검증:
 import asyncio
 
 import pytest
-from playwright.async_api import Browser, TimeoutError
+from playwright.async_api import Browser
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from ...conftest import CONTEXT_CONFIG, TEST_CONFIG
 from .omok_helpers import OmokGameHelper, OmokSelectors
@@ -27,7 +28,7 @@ class TestS7ErrorHandling:
         await OmokGameHelper.setup_two_player_game(page1, page2)
 
         # 정상 연결 상태 확인
-        await page1.wait_for_timeout(TEST_CONFIG["game_action"])
+        await page1.wait_for_timeout(TEST_CONFIG.game_action)
 
         # 연결 상태 표시 요소 찾기 - 헬퍼 함수 활용
         connection_status_selectors = [
@@ -47,7 +48,7 @@ class TestS7ErrorHandling:
         try:
             # 네트워크 조건을 오프라인으로 변경
             await page1.context.set_offline(True)
-            await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
             # 연결 끊김 상태 메시지 확인 - 헬퍼 함수 활용
             disconnected_indicators = [
@@ -63,12 +64,12 @@ class TestS7ErrorHandling:
                 disconnected_indicators,
                 "content",
                 "연결 끊김 감지",
-                timeout=TEST_CONFIG["ui_timeout"],
+                timeout=TEST_CONFIG.ui_timeout,
             )
 
             # 네트워크 복구
             await page1.context.set_offline(False)
-            await page1.wait_for_timeout(TEST_CONFIG["ui_timeout"])  # 재연결 대기
+            await page1.wait_for_timeout(TEST_CONFIG.ui_timeout)  # 재연결 대기
 
             # 재연결 성공 메시지 확인 - 헬퍼 함수 활용
             reconnected_indicators = [
@@ -84,7 +85,7 @@ class TestS7ErrorHandling:
                 reconnected_indicators,
                 "content",
                 "재연결 확인",
-                timeout=TEST_CONFIG["websocket"],
+                timeout=TEST_CONFIG.websocket,
             )
 
             # 재연결 후 게임 기능 정상 작동 확인 - 헬퍼 함수 활용
@@ -98,7 +99,7 @@ class TestS7ErrorHandling:
                 game_elements,
                 "element",
                 "재연결 후 게임 요소 정상",
-                timeout=TEST_CONFIG["game_action"],
+                timeout=TEST_CONFIG.game_action,
             )
 
         except Exception as e:
@@ -162,7 +163,7 @@ class TestS7ErrorHandling:
                 error_indicators,
                 "content",
                 "빈 닉네임 에러 처리",
-                timeout=TEST_CONFIG["game_action"],
+                timeout=TEST_CONFIG.game_action,
             )
 
             if not error_found:
@@ -173,7 +174,7 @@ class TestS7ErrorHandling:
                     toast_selectors,
                     "element",
                     "빈 닉네임 에러 토스트",
-                    timeout=TEST_CONFIG["element_wait"],
+                    timeout=TEST_CONFIG.element_wait,
                 )
 
             # 모달 닫기 - 헬퍼 함수 활용
@@ -196,7 +197,7 @@ class TestS7ErrorHandling:
             invalid_room_url = f"{OmokGameHelper.BASE_URL}/omok/nonexistent-room-12345"
             await page.goto(invalid_room_url)
             await page.wait_for_load_state("networkidle")
-            await page.wait_for_timeout(TEST_CONFIG["game_action"])
+            await page.wait_for_timeout(TEST_CONFIG.game_action)
 
             # 에러 페이지나 메시지 확인 - 헬퍼 함수 활용
             error_indicators = [
@@ -250,7 +251,7 @@ class TestS7ErrorHandling:
                             OmokSelectors.Buttons.JOIN_GAME,
                         ],
                     )
-                    await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+                    await page.wait_for_timeout(TEST_CONFIG.element_wait)
 
                     # 에러 메시지나 필터링 확인 - 헬퍼 함수 활용
                     error_selectors = [".error-message", ".toast-container .error"]
@@ -259,7 +260,7 @@ class TestS7ErrorHandling:
                         error_selectors,
                         "element",
                         f"특수문자 닉네임 필터링 - {nickname[:10]}...",
-                        timeout=TEST_CONFIG["element_wait"],
+                        timeout=TEST_CONFIG.element_wait,
                     )
 
                     if not error_found:
@@ -295,7 +296,7 @@ class TestS7ErrorHandling:
                     OmokSelectors.Buttons.JOIN_GAME,
                 ],
             )
-            await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page.wait_for_timeout(TEST_CONFIG.element_wait)
 
             # 길이 제한 에러나 자동 잘림 확인 - 헬퍼 함수 활용
             error_selectors = [".error-message", ".toast-container .error"]
@@ -304,7 +305,7 @@ class TestS7ErrorHandling:
                 error_selectors,
                 "element",
                 "긴 닉네임 길이 제한",
-                timeout=TEST_CONFIG["element_wait"],
+                timeout=TEST_CONFIG.element_wait,
             )
 
             if not error_found:
@@ -351,7 +352,7 @@ class TestS7NetworkResilience:
             # 게임 페이지 로드
             await page.locator(OmokSelectors.MainPage.OMOK_CARD).click()
             await page.wait_for_load_state(
-                "networkidle", timeout=TEST_CONFIG["network_timeout"] + 5000
+                "networkidle", timeout=TEST_CONFIG.network_timeout + 5000
             )
 
             # 느린 네트워크에서도 기본 기능이 동작하는지 확인 - 헬퍼 함수 활용
@@ -364,10 +365,10 @@ class TestS7NetworkResilience:
                 create_room_elements,
                 "element",
                 "느린 네트워크에서도 기본 UI 로드됨",
-                timeout=TEST_CONFIG["websocket"],
+                timeout=TEST_CONFIG.websocket,
             )
 
-        except TimeoutError:
+        except PlaywrightTimeoutError:
             print("WARNING: 느린 네트워크 조건에서 타임아웃 발생")
         except Exception as e:
             print(f"INFO: 느린 네트워크 테스트 - {e}")
@@ -401,7 +402,7 @@ class TestS7NetworkResilience:
                         clicked = await OmokGameHelper.find_and_click_button(
                             page,
                             create_room_selectors,
-                            timeout=TEST_CONFIG["element_wait"],
+                            timeout=TEST_CONFIG.element_wait,
                             success_message=f"빠른 클릭 {i+1}",
                         )
                         if not clicked:
@@ -410,7 +411,7 @@ class TestS7NetworkResilience:
                     except Exception:
                         break  # 버튼이 비활성화되거나 모달이 열리면 중단
 
-                await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await page.wait_for_timeout(TEST_CONFIG.element_wait)
 
                 # 모달이 한 번만 열렸는지 확인
                 modals = page.locator(".modal, [role='dialog']")
@@ -468,7 +469,7 @@ class TestS7NetworkResilience:
             await page.wait_for_load_state("networkidle")
 
             for i in range(10):  # 10초간 1초마다 상태 확인
-                await page.wait_for_timeout(TEST_CONFIG["element_wait"] // 2)
+                await page.wait_for_timeout(TEST_CONFIG.element_wait // 2)
 
                 # 페이지가 여전히 응답하는지 확인
                 try:
@@ -36,20 +36,9 @@ class TestS5GameFeatures:
         await OmokGameHelper.setup_two_player_game(page1, page2, "Player1", "Player2")
 
         # 실제 색깔 배정 확인 및 흑돌 플레이어부터 시작
-        player1_info = await page1.evaluate(
-            """
-            window.omokClient.state.players.find(
-                p => p.player_number === window.omokClient.state.myPlayerNumber
-            )
-        """
-        )
-        player2_info = await page2.evaluate(
-            """
-            window.omokClient.state.players.find(
-                p => p.player_number === window.omokClient.state.myPlayerNumber
-            )
-        """
-        )
+        snapshot1, snapshot2 = await OmokGameHelper.get_client_snapshots(page1, page2)
+        player1_info = snapshot1["myPlayer"]
+        player2_info = snapshot2["myPlayer"]
 
         print(
             f"색깔 배정 - Player1: color={player1_info['color']}, "
@@ -91,9 +80,10 @@ class TestS5GameFeatures:
 
         if found_undo:
             # 백돌 플레이어에게 무르기 요청 팝업 확인
-            await second_page.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await second_page.wait_for_timeout(TEST_CONFIG.element_wait)
 
-            popup_indicators = OmokSelectors.TextPatterns.UNDO_REQUEST_TITLES + [
+            popup_indicators = [
+                *OmokSelectors.TextPatterns.UNDO_REQUEST_TITLES,
                 OmokSelectors.Buttons.AGREE,
                 OmokSelectors.Buttons.REJECT,
             ]
@@ -119,8 +109,9 @@ class TestS5GameFeatures:
                 )
 
                 # S5-1 검증: 백돌 플레이어의 마지막 수 제거, 턴이 백돌 플레이어로 변경
-                await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
-                await page2.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await OmokGameHelper.wait_on_pages(
+                    TEST_CONFIG.element_wait, page1, page2
+                )
 
                 game_state = await OmokGameHelper.get_game_state(page1)
                 assert game_state is not None, "게임 상태를 가져올 수 없습니다"
@@ -177,20 +168,9 @@ class TestS5GameFeatures:
         await OmokGameHelper.setup_two_player_game(page1, page2, "Player1", "Player2")
 
         # 실제 색깔 배정 확인 및 흑돌 플레이어가 첫 수 놓기
-        player1_info = await page1.evaluate(
-            """
-            window.omokClient.state.players.find(
-                p => p.player_number === window.omokClient.state.myPlayerNumber
-            )
-        """
-        )
-        player2_info = await page2.evaluate(
-            """
-            window.omokClient.state.players.find(
-                p => p.player_number === window.omokClient.state.myPlayerNumber
-            )
-        """
-        )
+        snapshot1, snapshot2 = await OmokGameHelper.get_client_snapshots(page1, page2)
+        player1_info = snapshot1["myPlayer"]
+        player2_info = snapshot2["myPlayer"]
 
         print(
             f"색깔 배정 - Player1: color={player1_info['color']}, "
@@ -234,9 +214,10 @@ class TestS5GameFeatures:
 
         if found_undo:
             # 백돌 플레이어에게 무르기 요청 팝업이 나타나는지 확인
-            await second_page.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await second_page.wait_for_timeout(TEST_CONFIG.element_wait)
 
-            popup_indicators = OmokSelectors.TextPatterns.UNDO_REQUEST_TITLES + [
+            popup_indicators = [
+                *OmokSelectors.TextPatterns.UNDO_REQUEST_TITLES,
                 OmokSelectors.Buttons.AGREE,
                 OmokSelectors.Buttons.REJECT,
             ]
@@ -268,8 +249,9 @@ class TestS5GameFeatures:
                     )
 
                 # 무르기 후 상태 확인
-                await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
-                await page2.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await OmokGameHelper.wait_on_pages(
+                    TEST_CONFIG.element_wait, page1, page2
+                )
 
                 # 무르기 후 상태 검증 (실제 성공 조건)
                 print("무르기 후 턴 변경 검증 시작...")
@@ -340,7 +322,7 @@ class TestS5GameFeatures:
         restart_btn = page1.locator(OmokSelectors.Buttons.RESTART).first
 
         # 무르기 버튼 상태 확인 - 반드시 비활성화되어 있어야 함
-        if await undo_btn.is_visible(timeout=TEST_CONFIG["element_wait"]):
+        if await undo_btn.is_visible(timeout=TEST_CONFIG.element_wait):
             is_disabled = await undo_btn.is_disabled()
             assert (
                 is_disabled
@@ -351,7 +333,7 @@ class TestS5GameFeatures:
 
         # 재시작 버튼 상태 확인 - 반드시 활성화되어 있어야 함
         assert await restart_btn.is_visible(
-            timeout=TEST_CONFIG["element_wait"]
+            timeout=TEST_CONFIG.element_wait
         ), "재시작 버튼이 보이지 않습니다"
         is_disabled = await restart_btn.is_disabled()
         assert not is_disabled, "게임 시작과 동시에 재시작 버튼이 활성화되어야 합니다"
@@ -360,11 +342,11 @@ class TestS5GameFeatures:
         # 2. scenarios.md S5-3: 첫 수를 놓은 후부터 무르기 버튼 활성화
         print("\nINFO: 3-5수 진행 후 버튼 상태 확인")
         await OmokGameHelper.make_alternating_moves(page1, page2, moves_count=3)
-        await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+        await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
         # 무르기 버튼 활성화 확인 - 첫 수 이후 반드시 활성화되어야 함
         assert await undo_btn.is_visible(
-            timeout=TEST_CONFIG["element_wait"]
+            timeout=TEST_CONFIG.element_wait
         ), "무르기 버튼이 보이지 않습니다"
         is_disabled = await undo_btn.is_disabled()
         assert not is_disabled, "첫 수를 놓은 후 무르기 버튼이 활성화되어야 합니다"
@@ -372,7 +354,7 @@ class TestS5GameFeatures:
 
         # 재시작 버튼 여전히 활성화 확인
         assert await restart_btn.is_visible(
-            timeout=TEST_CONFIG["element_wait"]
+            timeout=TEST_CONFIG.element_wait
         ), "재시작 버튼이 보이지 않습니다"
         is_disabled = await restart_btn.is_disabled()
         assert not is_disabled, "게임 진행 중 재시작 버튼이 활성화되어야 합니다"
@@ -383,15 +365,15 @@ class TestS5GameFeatures:
         await OmokGameHelper.make_alternating_moves(
             page1, page2, moves_count=7
         )  # 추가로 7수 더
-        await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+        await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
         # 버튼들이 여전히 활성화되어 있는지 확인
-        if await undo_btn.is_visible(timeout=TEST_CONFIG["element_wait"]):
+        if await undo_btn.is_visible(timeout=TEST_CONFIG.element_wait):
             is_disabled = await undo_btn.is_disabled()
             if not is_disabled:
                 print("SUCCESS: 10수 이상에서도 무르기 버튼 활성화 유지")
 
-        if await restart_btn.is_visible(timeout=TEST_CONFIG["element_wait"]):
+        if await restart_btn.is_visible(timeout=TEST_CONFIG.element_wait):
             is_disabled = await restart_btn.is_disabled()
             if not is_disabled:
                 print("SUCCESS: 10수 이상에서도 재시작 버튼 활성화 유지")
@@ -402,7 +384,7 @@ class TestS5GameFeatures:
         # 무르기 버튼 클릭
         if await undo_btn.is_visible() and not await undo_btn.is_disabled():
             await undo_btn.click()
-            await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
             # 버튼이 일시적으로 비활성화되거나 로딩 상태가 되는지 확인
             try:
@@ -451,15 +433,13 @@ class TestS5GameFeatures:
 
         if found_restart:
             # Player2에게 재시작 요청 팝업 확인 (헬퍼 모듈 사용)
-            await page2.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page2.wait_for_timeout(TEST_CONFIG.element_wait)
 
-            restart_popup_indicators = (
-                OmokSelectors.TextPatterns.RESTART_REQUEST_TITLES
-                + [
-                    OmokSelectors.Buttons.AGREE,
-                    OmokSelectors.Buttons.REJECT,
-                ]
-            )
+            restart_popup_indicators = [
+                *OmokSelectors.TextPatterns.RESTART_REQUEST_TITLES,
+                OmokSelectors.Buttons.AGREE,
+                OmokSelectors.Buttons.REJECT,
+            ]
 
             found_restart_popup = await OmokGameHelper.check_page_condition(
                 page2, restart_popup_indicators, "element", "재시작 요청 팝업 확인"
@@ -479,8 +459,9 @@ class TestS5GameFeatures:
                 # scenarios.md S5-4 검증 포인트 구현:
                 # - 수락 시 보드 완전 초기화
                 # - 선공/후공 순서 유지 또는 변경 규칙 적용
-                await page1.wait_for_timeout(TEST_CONFIG["game_action"])
-                await page2.wait_for_timeout(TEST_CONFIG["game_action"])
+                await OmokGameHelper.wait_on_pages(
+                    TEST_CONFIG.game_action, page1, page2
+                )
 
                 # 1. 보드 완전 초기화 확인
                 game_state = await OmokGameHelper.get_game_state(page1)
@@ -569,7 +550,7 @@ class TestS5GameFeatures:
 
             # Enter 키로 전송
             await page1.keyboard.press("Enter")
-            await page2.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page2.wait_for_timeout(TEST_CONFIG.element_wait)
 
             # scenarios.md S5-5 검증 포인트 구현:
             # - 메시지 즉시 상대방에게 전달
@@ -602,7 +583,7 @@ class TestS5GameFeatures:
                 await page2.keyboard.press("Enter")
 
                 # Player1에서 답장 확인
-                await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await page1.wait_for_timeout(TEST_CONFIG.element_wait)
                 # reply_received =
                 await OmokGameHelper.check_page_condition(
                     page1, [reply_message], "content", "채팅 답장 수신 확인"
@@ -616,7 +597,7 @@ class TestS5GameFeatures:
             xss_test_message = "<script>alert('xss')</script>안전한 메시지"
             await found_chat_input.fill(xss_test_message)
             await page1.keyboard.press("Enter")
-            await page2.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page2.wait_for_timeout(TEST_CONFIG.element_wait)
 
             # 안전한 메시지가 표시되는지 먼저 확인
             safe_message_found = await OmokGameHelper.check_page_condition(
@@ -635,9 +616,7 @@ class TestS5GameFeatures:
                 for chat_area_sel in chat_areas:
                     try:
                         chat_area = page2.locator(chat_area_sel)
-                        if await chat_area.is_visible(
-                            timeout=TEST_CONFIG["element_wait"]
-                        ):
+                        if await chat_area.is_visible(timeout=TEST_CONFIG.element_wait):
                             chat_html = await chat_area.inner_html()
                             # HTML에서 스크립트 태그가 이스케이프되었는지 확인
                             if (
@@ -672,7 +651,7 @@ class TestS5GameFeatures:
             await found_chat_input.fill("")  # 빈 메시지
             # before_empty_content = await page2.content()
             await page1.keyboard.press("Enter")
-            await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page1.wait_for_timeout(TEST_CONFIG.element_wait)
             # after_empty_content = await page2.content()
 
             # 빈 메시지로 인한 새로운 채팅이 추가되지 않아야 함
@@ -682,7 +661,7 @@ class TestS5GameFeatures:
             # 공백만 있는 메시지 테스트
             await found_chat_input.fill("   ")  # 공백만
             await page1.keyboard.press("Enter")
-            await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page1.wait_for_timeout(TEST_CONFIG.element_wait)
             print("SUCCESS: 공백 메시지 처리 테스트 완료")
 
             # 긴 메시지 테스트
@@ -690,7 +669,7 @@ class TestS5GameFeatures:
             try:
                 await found_chat_input.fill(long_message)
                 await page1.keyboard.press("Enter")
-                await page2.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await page2.wait_for_timeout(TEST_CONFIG.element_wait)
                 print("SUCCESS: 긴 메시지 처리 테스트 완료")
             except Exception:
                 pass
@@ -719,13 +698,13 @@ class TestS5ChatAdvanced:
 
         # 채팅 입력 필드 찾기
         chat_input = page1.locator(OmokSelectors.Chat.INPUT).first
-        if await chat_input.is_visible(timeout=TEST_CONFIG["game_action"]):
+        if await chat_input.is_visible(timeout=TEST_CONFIG.game_action):
             # 여러 메시지 전송하여 스크롤 테스트
             for i in range(10):
                 message = f"테스트 메시지 {i+1} - 긴 내용을 포함한 메시지입니다."
                 await chat_input.fill(message)
                 await page1.keyboard.press("Enter")
-                await asyncio.sleep(TEST_CONFIG["retry_interval"] / 1000)
+                await asyncio.sleep(TEST_CONFIG.retry_interval / 1000)
 
             # 채팅 영역에서 스크롤 동작 확인
             chat_area = page1.locator(OmokSelectors.Chat.MESSAGES).first
@@ -736,7 +715,7 @@ class TestS5ChatAdvanced:
                     if hasattr(chat_area, "scroll_to_top")
                     else None
                 )
-                await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
                 # 스크롤을 아래로 내리기
                 (
@@ -744,7 +723,7 @@ class TestS5ChatAdvanced:
                     if hasattr(chat_area, "scroll_to_bottom")
                     else None
                 )
-                await page1.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await page1.wait_for_timeout(TEST_CONFIG.element_wait)
 
                 print("SUCCESS: 채팅 스크롤 테스트 완료")
 
@@ -762,7 +741,7 @@ class TestS5ChatAdvanced:
         )
 
         chat_input = page1.locator(OmokSelectors.Chat.INPUT).first
-        if await chat_input.is_visible(timeout=TEST_CONFIG["game_action"]):
+        if await chat_input.is_visible(timeout=TEST_CONFIG.game_action):
             # 특수문자 테스트
             special_messages = [
                 "한글 메시지 테스트 ㅎㅎㅎ",
@@ -776,11 +755,11 @@ class TestS5ChatAdvanced:
                 try:
                     await chat_input.fill(message)
                     await page1.keyboard.press("Enter")
-                    await page2.wait_for_timeout(TEST_CONFIG["element_wait"])
+                    await page2.wait_for_timeout(TEST_CONFIG.element_wait)
 
                     # Player2에서 메시지 확인
-                    page2_content = await page2.content()
-                    if message[:10] in page2_content:  # 메시지 일부만 확인
+                    # 메시지 일부만 확인
+                    if await OmokGameHelper.find_in_page_html(page2, [message[:10]]):
                         print(f"SUCCESS: 특수문자 메시지 전송 확인 - {message[:20]}...")
 
                 except Exception as e:
@@ -42,7 +42,7 @@ class TestS4ExcelStealth:
         await page.wait_for_load_state("networkidle")
 
         # 4. Excel 스타일 UI 확인 및 화려한 요소 체크 - 헬퍼 함수 활용
-        await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+        await page.wait_for_timeout(TEST_CONFIG.element_wait)
 
         # Excel 스타일 요소들 재확인
         excel_style_verified = await OmokGameHelper.verify_excel_elements(
@@ -88,11 +88,11 @@ class TestS4ExcelStealth:
             create_room_btn = page.locator("text=방 만들기")
             if await create_room_btn.is_visible():
                 await create_room_btn.click()
-                await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await page.wait_for_timeout(TEST_CONFIG.element_wait)
 
                 # 모달이 나타났는지 확인 - 헬퍼 상수 활용
                 nickname_input = page.locator(OmokSelectors.GameUI.NICKNAME_INPUT)
-                if await nickname_input.is_visible(timeout=TEST_CONFIG["game_action"]):
+                if await nickname_input.is_visible(timeout=TEST_CONFIG.game_action):
                     print("SUCCESS: 투명도 변경 후에도 게임 기능 정상")
 
                     # 모달 닫기 - 헬퍼 함수 활용
@@ -118,7 +118,7 @@ class TestS4ExcelStealth:
         await page.goto(OmokGameHelper.BASE_URL)
         await page.locator(OmokSelectors.MainPage.OMOK_CARD).click()
         await page.wait_for_load_state("networkidle")
-        await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+        await page.wait_for_timeout(TEST_CONFIG.element_wait)
 
         # 2. 초기 상태에서 게임 영역이 보이는지 확인 - 헬퍼 함수 활용
         initial_game_area = await OmokGameHelper.find_game_area(page)
@@ -155,12 +155,12 @@ class TestS4ExcelStealth:
             print("빠른 숨김 버튼 클릭 테스트...")
             try:
                 await found_hide_button.click()
-                await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await page.wait_for_timeout(TEST_CONFIG.element_wait)
                 print("SUCCESS: 빠른 숨김 버튼 클릭")
 
                 # 다시 버튼 클릭해서 복원
                 await found_hide_button.click()
-                await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+                await page.wait_for_timeout(TEST_CONFIG.element_wait)
                 print("SUCCESS: 빠른 숨김 버튼으로 복원")
             except Exception as e:
                 print(f"INFO: 빠른 숨김 버튼 클릭 실패 - {e}")
@@ -182,7 +182,7 @@ class TestS4ExcelStealth:
         await page.wait_for_load_state("networkidle")
 
         # 2. 스텔스 모드 기능들을 순차적으로 테스트
-        await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+        await page.wait_for_timeout(TEST_CONFIG.element_wait)
 
         # 종합적인 스텔스 모드 시퀀스 테스트 - 헬퍼 함수 활용
         try:
@@ -228,7 +228,7 @@ class TestS4AccessibilityAndUsability:
             await page.goto(OmokGameHelper.BASE_URL)
             await page.locator(OmokSelectors.MainPage.OMOK_CARD).click()
             await page.wait_for_load_state("networkidle")
-            await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page.wait_for_timeout(TEST_CONFIG.element_wait)
 
             # 모바일에서도 Excel 위장이 적절한지 확인
             mobile_title = await page.title()
@@ -259,11 +259,11 @@ class TestS4AccessibilityAndUsability:
         await page.goto(OmokGameHelper.BASE_URL)
         await page.locator(OmokSelectors.MainPage.OMOK_CARD).click()
         await page.wait_for_load_state("networkidle")
-        await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+        await page.wait_for_timeout(TEST_CONFIG.element_wait)
 
         # Tab 키로 네비게이션 테스트
         await page.keyboard.press("Tab")
-        await page.wait_for_timeout(TEST_CONFIG["retry_interval"])
+        await page.wait_for_timeout(TEST_CONFIG.retry_interval)
 
         # 포커스된 요소가 있는지 확인
         focused_element = page.locator(":focus")
@@ -278,7 +278,7 @@ class TestS4AccessibilityAndUsability:
         # Enter 키로 요소 활성화 테스트
         try:
             await page.keyboard.press("Enter")
-            await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page.wait_for_timeout(TEST_CONFIG.element_wait)
             print("SUCCESS: Enter 키 활성화 테스트 완료")
         except Exception:
             pass
@@ -292,7 +292,7 @@ class TestS4AccessibilityAndUsability:
         await page.goto(OmokGameHelper.BASE_URL)
         await page.locator(OmokSelectors.MainPage.OMOK_CARD).click()
         await page.wait_for_load_state("networkidle")
-        await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+        await page.wait_for_timeout(TEST_CONFIG.element_wait)
 
         # 1. 투명도 슬라이더와 숨김 버튼이 함께 작동하는지 테스트
         opacity_slider = await OmokGameHelper.find_opacity_slider(page)
@@ -302,7 +302,7 @@ class TestS4AccessibilityAndUsability:
             # 투명도를 조절한 후 숨김 버튼 클릭
             await OmokGameHelper.set_opacity(page, "40")
             await hide_button.click()
-            await page.wait_for_timeout(TEST_CONFIG["element_wait"])
+            await page.wait_for_timeout(TEST_CONFIG.element_wait)
 
             # Excel 요소들이 여전히 보이는지 확인
             excel_visible = await OmokGameHelper.verify_excel_elements(page)